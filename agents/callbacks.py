@@ -0,0 +1,142 @@
+"""
+Agent Callbacks - Coordinator 실행 중 발생하는 이벤트를 UI로 전달하는 LangChain 콜백 핸들러
+"""
+import time
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+def _token_usage(response) -> Dict[str, int]:
+    """LLMResult에서 토큰 사용량 추출 (제공자가 보고하지 않으면 빈 dict)"""
+    usage = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+    if usage:
+        return {
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "total_tokens": usage.get("total_tokens", 0),
+        }
+
+    # 스트리밍 응답은 llm_output 대신 메시지의 usage_metadata에 사용량이 담김
+    totals = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    for generations in getattr(response, "generations", None) or []:
+        for generation in generations:
+            metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+            totals["prompt_tokens"] += metadata.get("input_tokens", 0)
+            totals["completion_tokens"] += metadata.get("output_tokens", 0)
+            totals["total_tokens"] += metadata.get("total_tokens", 0)
+    return totals if totals["total_tokens"] else {}
+
+class PlanEventQueueHandler(BaseCallbackHandler):
+    """도구 실행 단계, LLM 호출 통계, 최종 답변 토큰을 큐에 넣는 콜백 핸들러
+
+    이벤트 형식:
+    - {"type": "step", "tool": 도구 이름, "input": 도구 입력}
+    - {"type": "observation", "tool": 도구 이름, "output": 도구 결과, "elapsed_ms": 실행 시간, "error": 실패 여부}
+    - {"type": "llm", "elapsed_ms": 호출 시간, "tokens": 토큰 사용량}
+    - {"type": "token", "text": 최종 답변 토큰}
+
+    ReAct 중간 출력(Thought/Action)은 보내지 않고, LLM 출력에서 "Final Answer:" 이후의
+    토큰만 전달합니다. 병렬 모드에서는 도구들이 동시에 실행되므로 시작 시각을 run_id별로 기록합니다.
+    """
+
+    def __init__(self, events: "queue.Queue[Dict[str, Any]]"):
+        self.events = events
+        self._generation = ""
+        self._in_final_answer = False
+        self._lock = threading.Lock()
+        self._tool_runs: Dict[Any, Dict[str, Any]] = {}
+        self._llm_runs: Dict[Any, float] = {}
+        self.tool_timings: List[Dict[str, Any]] = []
+        self.llm_timings: List[Dict[str, Any]] = []
+
+    def _reset_generation(self):
+        self._generation = ""
+        self._in_final_answer = False
+
+    # LLM 이벤트
+    def on_llm_start(self, serialized, prompts, **kwargs):
+        self._start_llm(kwargs.get("run_id"))
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        self._start_llm(kwargs.get("run_id"))
+
+    def _start_llm(self, run_id):
+        self._reset_generation()
+        with self._lock:
+            self._llm_runs[run_id] = time.perf_counter()
+
+    def on_llm_new_token(self, token: str, **kwargs):
+        if self._in_final_answer:
+            self.events.put({"type": "token", "text": token})
+            return
+
+        self._generation += token
+        marker_index = self._generation.find(FINAL_ANSWER_MARKER)
+        if marker_index >= 0:
+            self._in_final_answer = True
+            remainder = self._generation[marker_index + len(FINAL_ANSWER_MARKER):].lstrip()
+            if remainder:
+                self.events.put({"type": "token", "text": remainder})
+
+    def on_llm_end(self, response, **kwargs):
+        with self._lock:
+            started = self._llm_runs.pop(kwargs.get("run_id"), None)
+        timing = {
+            "elapsed_ms": _elapsed_ms(started),
+            "tokens": _token_usage(response),
+        }
+        with self._lock:
+            self.llm_timings.append(timing)
+        self.events.put({"type": "llm", **timing})
+
+    def on_llm_error(self, error, **kwargs):
+        with self._lock:
+            self._llm_runs.pop(kwargs.get("run_id"), None)
+
+    # 도구 이벤트
+    def on_tool_start(self, serialized, input_str, **kwargs):
+        tool = (serialized or {}).get("name", "tool")
+        with self._lock:
+            self._tool_runs[kwargs.get("run_id")] = {"tool": tool, "started": time.perf_counter()}
+        self.events.put({"type": "step", "tool": tool, "input": input_str})
+
+    def on_tool_end(self, output, **kwargs):
+        self._finish_tool(kwargs.get("run_id"), str(output), error=False)
+
+    def on_tool_error(self, error, **kwargs):
+        self._finish_tool(kwargs.get("run_id"), str(error), error=True)
+
+    def _finish_tool(self, run_id, output: str, error: bool):
+        with self._lock:
+            run = self._tool_runs.pop(run_id, None) or {"tool": "tool", "started": None}
+            timing = {"tool": run["tool"], "elapsed_ms": _elapsed_ms(run["started"]), "error": error}
+            self.tool_timings.append(timing)
+        self.events.put({"type": "observation", "output": output, **timing})
+
+    def metrics(self) -> Dict[str, Any]:
+        """도구별 실행 시간과 LLM 호출 통계 요약"""
+        with self._lock:
+            tool_timings = list(self.tool_timings)
+            llm_timings = list(self.llm_timings)
+
+        tokens = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        for timing in llm_timings:
+            for key in tokens:
+                tokens[key] += timing["tokens"].get(key, 0)
+
+        return {
+            "tools": tool_timings,
+            "tool_ms": round(sum(timing["elapsed_ms"] for timing in tool_timings), 1),
+            "llm_calls": len(llm_timings),
+            "llm_ms": round(sum(timing["elapsed_ms"] for timing in llm_timings), 1),
+            "tokens": tokens,
+        }
+
+def _elapsed_ms(started: Optional[float]) -> float:
+    if started is None:
+        return 0.0
+    return round((time.perf_counter() - started) * 1000, 1)
@@ -4,13 +4,18 @@ Travel Coordinator Agent - Multi Agent System의 메인 코디네이터
 from langchain.agents import AgentExecutor
 from langchain.prompts import PromptTemplate
 from langchain.schema import BaseMessage
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
 import streamlit as st
 from langchain.agents import initialize_agent, AgentType
 import json
 from datetime import date, timedelta
 import re # Added for regex parsing
 import os
+import time
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # langchain_chroma를 선택적 import로 변경
 try:
@@ -20,59 +25,161 @@ except ImportError:
     CHROMA_AVAILABLE = False
     Chroma = None
 
-from config.config import get_embeddings
+# 설정은 사용할 때 config.X로 읽음 (reload_config 후 다시 만든 Coordinator가 새 값을 쓰도록)
+import config.config as config
+from components.plan_cache import PlanCache
+from components.hybrid_retriever import BM25Index, CrossEncoderReranker, HybridRetriever
+from components.local_vector_index import LocalVectorIndex
+from components.context_budget import ContextBudget, TokenCounter, saved_tokens
+from agents.callbacks import PlanEventQueueHandler
+
+# 워커 스레드에 Streamlit 실행 컨텍스트를 연결하는 헬퍼 (버전에 따라 없을 수 있음)
+try:
+    from streamlit.runtime.scriptrunner import add_script_run_ctx
+except ImportError:
+    add_script_run_ctx = None
 
 CHROMA_PERSIST_DIRECTORY = "./chroma_db"
 
+# 최종 여행 계획 출력 형식 (ReAct 프롬프트와 병렬 모드 종합 프롬프트가 공유)
+PLAN_OUTPUT_TEMPLATE = """여행 계획은 다음 형식으로 작성해주세요:
+
+## 📅 여행 일정
+
+### Day 1: [날짜]
+**오전 활동:**
+- 시간: [시간]
+- 활동: [활동명]
+- 장소: [장소]
+- 설명: [상세 설명]
+- 비용: [비용]
+- 교통수단: [교통수단]
+
+**점심:**
+- 시간: [시간]
+- 식당: [식당명]
+- 요리: [요리 종류]
+- 비용: [비용]
+- 메모: [추가 정보]
+
+**오후 활동:**
+- 시간: [시간]
+- 활동: [활동명]
+- 장소: [장소]
+- 설명: [상세 설명]
+- 비용: [비용]
+- 교통수단: [교통수단]
+
+**숙박:**
+- 숙소명: [숙소명]
+- 유형: [숙소 유형]
+- 비용: [비용]
+- 메모: [추가 정보]
+
+## 💡 추천사항
+- 필수 방문지: [목록]
+- 숨겨진 명소: [목록]
+- 현지인 팁: [목록]
+- 예산 절약 팁: [목록]
+
+## 💰 총 예상 비용
+[총 비용 범위]
+
+## 🎒 준비물
+[준비물 목록]"""
+
+# ReAct 모드 작업 지시 (도구 이름/설명은 Agent 프롬프트에 이미 들어가므로 순서만 안내)
+REACT_INSTRUCTIONS = """작업 순서: search_destination → get_weather → search_accommodation, search_restaurants, get_transportation → calculate_budget → optimize_itinerary
+모든 도구 사용이 끝나면 "Final Answer:" 뒤에 아래 형식으로 완전한 여행 계획을 작성하세요."""
+
+def load_vectorstore(embeddings):
+    """ChromaDB vectorstore 로드 (실패 시 None 반환)"""
+    if not CHROMA_AVAILABLE or embeddings is None:
+        return None
+    
+    try:
+        vectorstore = Chroma(persist_directory=CHROMA_PERSIST_DIRECTORY, embedding_function=embeddings)
+        print(f"ChromaDB 로드 성공: {CHROMA_PERSIST_DIRECTORY}")
+        return vectorstore
+    except Exception as e:
+        print(f"ChromaDB 로드 실패: {e}")
+        return None
+
+def load_local_index():
+    """임베딩 API 없이 쓰는 로컬 벡터 색인 로드 (없으면 None)"""
+    index = LocalVectorIndex.load(config.LOCAL_INDEX_DIR)
+    if index is not None:
+        print(f"로컬 벡터 색인 로드 성공: {config.LOCAL_INDEX_DIR} ({len(index)}개 청크)")
+    return index
+
+def load_retriever(vectorstore=None):
+    """하이브리드 검색기 구성 (BM25 색인과 벡터 검색 백엔드 중 하나도 없으면 None)
+
+    VECTOR_BACKEND가 "local"이거나, "auto"인데 ChromaDB가 없으면 로컬 벡터 색인을 사용합니다.
+    """
+    if config.VECTOR_BACKEND == "local" or (config.VECTOR_BACKEND == "auto" and vectorstore is None):
+        vectorstore = load_local_index()
+    bm25_index = BM25Index.load(config.BM25_INDEX_PATH)
+    if bm25_index is not None:
+        print(f"BM25 색인 로드 성공: {config.BM25_INDEX_PATH} ({len(bm25_index)}개 청크)")
+    reranker = CrossEncoderReranker(config.RAG_RERANKER_MODEL) if config.RAG_RERANKER_MODEL else None
+    retriever = HybridRetriever(vectorstore, bm25_index, reranker=reranker, candidates=config.RAG_CANDIDATES)
+    return retriever if retriever.available else None
+
 class TravelCoordinatorAgent:
     """여행 계획을 조율하는 메인 Agent"""
     
-    def __init__(self, llm=None, tools=None, vectorstore=None):
-        """TravelCoordinatorAgent 초기화"""
+    def __init__(self, llm=None, tools=None, vectorstore=None, embeddings=None, planning_mode=None, plan_cache=None, retriever=None, context_budget=None):
+        """TravelCoordinatorAgent 초기화
+
+        planning_mode: "react" (Agent가 도구를 순차 호출) 또는
+        "parallel" (도구를 동시에 실행한 뒤 LLM 1회로 종합). 기본값은 PLANNING_MODE 설정.
+        plan_cache: 결과 캐시 (None이면 PLAN_CACHE_* 설정으로 생성, 비활성화 시 캐시 없음)
+        retriever: RAG 하이브리드 검색기 (None이면 BM25 색인과 vectorstore/로컬 벡터 색인으로 구성)
+        context_budget: 프롬프트 입력 토큰 예산 (None이면 PROMPT_TOKEN_BUDGET/RAG_CONTEXT_TOKEN_BUDGET 설정)
+        """
         self.llm = llm
         self.tools = tools or []
+        self.planning_mode = planning_mode or config.PLANNING_MODE
+        self.context_budget = context_budget or ContextBudget(
+            config.PROMPT_TOKEN_BUDGET, config.RAG_CONTEXT_TOKEN_BUDGET, TokenCounter(config.TOKENIZER_ENCODING)
+        )
         
         # API 키 확인
         self.has_api_key = bool(os.getenv('AOAI_API_KEY'))
         
+        # 외부(리소스 레지스트리 등)에서 vectorstore를 전달받으면 그대로 재사용
+        if vectorstore is not None:
+            self.embeddings = embeddings
+            self.vectorstore = vectorstore
+            print("전달받은 vectorstore를 사용합니다. RAG 기능이 활성화되었습니다.")
         # RAG 활성화 (API 키가 있을 때만 ChromaDB 로드)
-        if self.has_api_key and CHROMA_AVAILABLE:
-            try:
-                from config.config import get_embeddings
-                self.embeddings = get_embeddings()
-                if self.embeddings:
-                    self.vectorstore = Chroma(persist_directory=CHROMA_PERSIST_DIRECTORY, embedding_function=self.embeddings)
-                    print(f"ChromaDB 로드 성공: {CHROMA_PERSIST_DIRECTORY}")
+        elif self.has_api_key and CHROMA_AVAILABLE:
+            self.embeddings = embeddings or config.get_embeddings()
+            if self.embeddings:
+                self.vectorstore = load_vectorstore(self.embeddings)
+                if self.vectorstore:
                     print("RAG 기능이 활성화되었습니다.")
-                else:
-                    print("Embeddings 초기화 실패")
-                    self.vectorstore = None
-            except Exception as e:
-                print(f"ChromaDB 로드 실패: {e}")
+            else:
+                print("Embeddings 초기화 실패")
                 self.vectorstore = None
         else:
             print("API 키가 설정되지 않아 ChromaDB를 로드하지 않습니다.")
-            print("RAG 기능이 비활성화되었습니다.")
+            print("로컬 색인(BM25/문자 n-gram)이 있으면 임베딩 없이 RAG 검색을 수행합니다.")
+            self.embeddings = None
             self.vectorstore = None
         
+        # BM25 색인은 임베딩 없이도 동작하므로 vectorstore가 없어도 검색기를 구성
+        self.retriever = retriever or load_retriever(self.vectorstore)
+        
         # Agent 초기화 (JSON 파싱 에러 처리 포함)
         if self.llm:
             try:
                 # Agent용 시스템 프롬프트 정의
-                system_message = """당신은 전문 여행 코디네이터입니다. 
-
-작업 순서:
-1. 필요한 도구들을 사용하여 정보를 수집하세요
-2. 모든 도구 사용이 완료되면 반드시 최종 여행 계획을 작성하세요
-3. 최종 응답은 상세하고 구조화된 텍스트 형식이어야 합니다
-
-중요 규칙:
-- 도구 사용 후 반드시 "Final Answer:"로 시작하는 최종 응답을 작성해야 합니다
-- 최종 응답이 없으면 작업이 완료되지 않은 것입니다
-- 모든 도구 사용이 끝나면 즉시 최종 응답을 생성하세요
-- 중간에 멈추지 말고 완전한 여행 계획을 작성하세요
-- 응답 형식은 반드시 "Final Answer:"로 시작해야 합니다
-- 도구를 사용할 때는 실제로 도구를 실행하고 결과를 받아야 합니다"""
+                # ReAct 반복마다 다시 전송되므로 규칙은 짧게 유지
+                system_message = """당신은 전문 여행 코디네이터입니다.
+- 도구를 실제로 실행해 정보를 수집하고, 모든 도구 사용이 끝나면 즉시 최종 여행 계획을 작성하세요
+- 최종 응답은 반드시 "Final Answer:"로 시작하는 상세하고 구조화된 텍스트여야 합니다"""
                 
                 agent = initialize_agent(
                     tools=self.tools,
@@ -95,34 +202,53 @@ class TravelCoordinatorAgent:
         else:
             self.agent = None
         
+        # 결과 캐시 초기화 (실패해도 캐시 없이 동작)
+        self.plan_cache = plan_cache
+        if self.plan_cache is None and config.PLAN_CACHE_ENABLED:
+            try:
+                self.plan_cache = PlanCache(
+                    config.PLAN_CACHE_PATH,
+                    ttl_seconds=config.PLAN_CACHE_TTL_SECONDS,
+                    max_entries=config.PLAN_CACHE_MAX_ENTRIES,
+                    similarity_threshold=config.PLAN_CACHE_SIMILARITY_THRESHOLD,
+                    embeddings=self.embeddings
+                )
+            except Exception as e:
+                print(f"계획 캐시 초기화 실패: {e}")
+                self.plan_cache = None
+        
         print("Agent를 활성화하고 Agent 호출 모드로 실행합니다.")
     
-    def plan_travel(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
-        """여행 계획을 수립하는 메인 메서드"""
+    def plan_travel(self, user_input: Dict[str, Any], callbacks: Optional[List[Any]] = None) -> Dict[str, Any]:
+        """여행 계획을 수립하는 메인 메서드 (캐시 적중 시 파이프라인 생략)
+
+        callbacks: Agent/LLM/도구 실행에 전달할 LangChain 콜백 핸들러 목록
+        """
+        
+        cached = self._get_cached_plan(user_input)
+        if cached is not None:
+            return cached
+        
+        result = self._plan_travel_uncached(user_input, callbacks)
+        self._store_cached_plan(user_input, result)
+        return result
+    
+    def _plan_travel_uncached(self, user_input: Dict[str, Any], callbacks: Optional[List[Any]] = None) -> Dict[str, Any]:
+        """RAG + Agent 파이프라인으로 여행 계획 수립"""
         
         try:
-            # RAG 검색 (API 키가 있고 vectorstore가 있을 때만 수행)
-            context_info = ""
-            if self.has_api_key and self.vectorstore and user_input.get('destination'):
-                try:
-                    query = f"{user_input['destination']} 여행 정보 {user_input.get('travel_style', '')} {user_input.get('activities', '')}"
-                    docs = self.vectorstore.similarity_search(query, k=3) # 상위 3개 문서 검색
-                    context_info = "\n\n" + "\n".join([doc.page_content for doc in docs])
-                    print(f"RAG 검색 완료: {len(docs)}개 문서 검색됨")
-                    # st.info(f"RAG 검색된 컨텍스트: {context_info}")
-                except Exception as e:
-                    st.warning(f"RAG 검색 중 오류 발생: {str(e)}")
-                    context_info = ""
-            else:
-                # API 키가 없거나 vectorstore가 없으면 RAG 검색 건너뛰기
-                if not self.has_api_key:
-                    print("API 키가 없어 RAG 검색을 건너뜁니다.")
-                elif not self.vectorstore:
-                    print("ChromaDB가 로드되지 않아 RAG 검색을 건너뜁니다.")
-                context_info = ""
+            # 요청별 입력 토큰 집계 (RAG 컨텍스트 압축, 프롬프트 예산 적용 결과)
+            token_report: Dict[str, Any] = {}
+            
+            # RAG 검색 (BM25 색인 또는 벡터 검색 백엔드가 있을 때만 수행)
+            context_info = self._retrieve_context(user_input, token_report)
+            
+            # 병렬 모드: 독립적인 도구 호출을 동시에 실행한 뒤 LLM 1회로 종합
+            if self.planning_mode == "parallel" and self.llm:
+                return self._plan_travel_parallel(user_input, context_info, callbacks, token_report)
             
             # 프롬프트 생성
-            prompt = self._format_user_input(user_input, context_info)
+            prompt = self._format_user_input(user_input, context_info, token_report)
             
             # Agent를 통한 호출
             if self.agent:
@@ -130,78 +256,15 @@ class TravelCoordinatorAgent:
                     print(f"Agent 호출 시작: {user_input.get('destination', 'N/A')} 여행 계획")
                     
                     # Agent를 통한 호출 (타임아웃 없이, Agent 자체 설정 사용)
-                    result = self.agent.run(prompt)
+                    result = self.agent.run(prompt, callbacks=callbacks)
                     
                     print(f"Agent 응답 수신: {len(str(result))} 문자")
                     print(f"Agent 응답 미리보기: {str(result)[:300]}...")
                     
-                    # Agent 응답이 유효한지 확인
-                    if result and len(str(result).strip()) > 10:
-                        print("Agent 응답이 유효합니다. 파싱을 시작합니다.")
-                        
-                        # 응답 정리
-                        result_str = str(result).strip()
-                        print(f"원본 응답 길이: {len(result_str)} 문자")
-                        
-                        # Tool 호출만 있고 실제 응답이 없는 경우 처리
-                        if "Action:" in result_str and "Final Answer:" not in result_str:
-                            print("Tool 호출만 있고 최종 응답이 없습니다. 데모 데이터를 반환합니다.")
-                            return self._get_demo_result(user_input)
-                        
-                        # "Final Answer:" 부분이 있으면 제거
-                        if "Final Answer:" in result_str:
-                            result_str = result_str.split("Final Answer:")[-1].strip()
-                            print("Final Answer 부분을 제거했습니다.")
-                        
-                        # 마크다운 헤더가 있으면 그대로 사용, 없으면 추가
-                        if not result_str.startswith("#"):
-                            result_str = f"## 📅 여행 계획\n\n{result_str}"
-                            print("마크다운 헤더를 추가했습니다.")
-                        
-                        print(f"정리된 응답 길이: {len(result_str)} 문자")
-                        print(f"정리된 응답 미리보기: {result_str[:200]}...")
-                        
-                        parsed_result = self._parse_result_simple(result_str)
-                        print(f"파싱 완료: {parsed_result.get('type', 'unknown')} 타입")
-                        print(f"파싱된 content 길이: {len(parsed_result.get('content', ''))} 문자")
-                        return parsed_result
-                    else:
-                        # Agent 응답이 유효하지 않으면 데모 데이터 반환
-                        print("Agent 응답이 유효하지 않아 데모 데이터를 반환합니다.")
-                        print(f"응답 길이: {len(str(result)) if result else 0}")
-                        return self._get_demo_result(user_input)
+                    return self._attach_token_report(self._finalize_result(result, user_input), token_report)
                         
                 except Exception as e:
-                    st.warning(f"Agent 호출 중 오류 발생: {str(e)}")
-                    print(f"Agent 오류 상세: {str(e)}")
-                    print(f"오류 타입: {type(e).__name__}")
-                    
-                    # 파싱 오류인 경우 원본 응답을 정리해서 반환
-                    if "Could not parse LLM output" in str(e) or "OutputParserException" in str(e):
-                        print("파싱 오류 감지. 원본 응답을 정리하여 반환합니다.")
-                        try:
-                            # 오류 메시지에서 원본 응답 추출 시도
-                            error_msg = str(e)
-                            if "`" in error_msg:
-                                # 백틱으로 둘러싸인 부분 추출
-                                start = error_msg.find("`") + 1
-                                end = error_msg.rfind("`")
-                                if start > 0 and end > start:
-                                    original_response = error_msg[start:end].strip()
-                                    if len(original_response) > 10:
-                                        # 응답 정리
-                                        if "Final Answer:" in original_response:
-                                            original_response = original_response.split("Final Answer:")[-1].strip()
-                                        
-                                        if not original_response.startswith("#"):
-                                            original_response = f"## 📅 여행 계획\n\n{original_response}"
-                                        
-                                        return self._parse_result_simple(original_response)
-                        except:
-                            pass
-                    
-                    # Agent 오류 시 데모 데이터 반환
-                    return self._get_demo_result(user_input)
+                    return self._handle_agent_error(e, user_input)
             else:
                 # Agent가 없으면 데모 데이터 반환
                 print("Agent가 초기화되지 않아 데모 데이터를 반환합니다.")
@@ -211,6 +274,318 @@ class TravelCoordinatorAgent:
             st.error(f"여행 계획 수립 중 오류 발생: {str(e)}")
             return self._get_demo_result(user_input)
     
+    def stream_plan(self, user_input: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """여행 계획 수립 과정을 이벤트로 스트리밍
+
+        plan_travel을 백그라운드 스레드에서 실행하면서 다음 이벤트를 생성합니다.
+        - {"type": "start", "expected_steps": ...}: 예상 단계 수 (도구 수 + 최종 답변 생성)
+        - {"type": "step", ...} / {"type": "observation", ...}: 도구 실행 시작/결과 (실행 시간 포함)
+        - {"type": "llm", ...}: LLM 호출별 소요 시간과 토큰 사용량
+        - {"type": "token", "text": ...}: 최종 답변 토큰 (LLM이 생성하는 즉시)
+        - {"type": "result", "result": ..., "metrics": ...}: plan_travel 최종 결과와 단계별 소요 시간 (마지막 이벤트)
+        """
+        events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        handler = PlanEventQueueHandler(events)
+        started = time.perf_counter()
+        
+        def worker():
+            try:
+                result = self.plan_travel(user_input, callbacks=[handler])
+            except Exception as e:
+                print(f"스트리밍 계획 수립 중 오류: {e}")
+                result = self._get_demo_result(user_input)
+            
+            metrics = handler.metrics()
+            metrics["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self._log_plan_metrics(metrics)
+            events.put({"type": "result", "result": result, "metrics": metrics})
+        
+        thread = threading.Thread(target=worker, daemon=True)
+        if add_script_run_ctx:
+            # 워커 스레드에서도 st.info/st.warning 등이 현재 페이지에 표시되도록 컨텍스트 연결
+            add_script_run_ctx(thread)
+        
+        yield {"type": "start", "expected_steps": len(self.tools) + 1}
+        thread.start()
+        
+        while True:
+            event = events.get()
+            yield event
+            if event["type"] == "result":
+                break
+    
+    def _log_plan_metrics(self, metrics: Dict[str, Any]):
+        """단계별 소요 시간 로그 출력"""
+        for timing in metrics["tools"]:
+            status = "실패" if timing["error"] else "완료"
+            print(f"도구 {timing['tool']} {status}: {timing['elapsed_ms']:.0f}ms")
+        print(
+            f"계획 수립 완료: 전체 {metrics['total_ms']:.0f}ms, 도구 {metrics['tool_ms']:.0f}ms, "
+            f"LLM {metrics['llm_calls']}회 {metrics['llm_ms']:.0f}ms, 토큰 {metrics['tokens']['total_tokens']}개"
+        )
+    
+    async def aplan_travel(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
+        """plan_travel의 비동기 버전 (한 워커의 이벤트 루프에서 여러 계획을 동시에 처리)"""
+        
+        # 캐시 조회/저장은 SQLite(및 선택적 임베딩) 호출이므로 워커 스레드에서 실행
+        cached = await asyncio.to_thread(self._get_cached_plan, user_input)
+        if cached is not None:
+            return cached
+        
+        result = await self._aplan_travel_uncached(user_input)
+        await asyncio.to_thread(self._store_cached_plan, user_input, result)
+        return result
+    
+    async def _aplan_travel_uncached(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
+        """_plan_travel_uncached의 비동기 버전"""
+        
+        try:
+            token_report: Dict[str, Any] = {}
+            
+            # vectorstore 검색은 동기 API이므로 워커 스레드에서 실행
+            context_info = await asyncio.to_thread(self._retrieve_context, user_input, token_report)
+            
+            if self.planning_mode == "parallel" and self.llm:
+                return await self._aplan_travel_parallel(user_input, context_info, token_report)
+            
+            prompt = self._format_user_input(user_input, context_info, token_report)
+            
+            if self.agent:
+                try:
+                    print(f"Agent 비동기 호출 시작: {user_input.get('destination', 'N/A')} 여행 계획")
+                    result = await self.agent.arun(prompt)
+                    print(f"Agent 응답 수신: {len(str(result))} 문자")
+                    return self._attach_token_report(self._finalize_result(result, user_input), token_report)
+                except Exception as e:
+                    return self._handle_agent_error(e, user_input)
+            else:
+                print("Agent가 초기화되지 않아 데모 데이터를 반환합니다.")
+                return self._get_demo_result(user_input)
+                
+        except Exception as e:
+            st.error(f"여행 계획 수립 중 오류 발생: {str(e)}")
+            return self._get_demo_result(user_input)
+    
+    def _get_cached_plan(self, user_input: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """캐시된 여행 계획 조회 (캐시 오류는 무시하고 미스로 처리)"""
+        if not self.plan_cache:
+            return None
+        try:
+            cached = self.plan_cache.get(user_input)
+            if cached is not None:
+                print(f"계획 캐시 적중: {user_input.get('destination', 'N/A')}")
+            return cached
+        except Exception as e:
+            print(f"계획 캐시 조회 실패: {e}")
+            return None
+    
+    def _store_cached_plan(self, user_input: Dict[str, Any], result: Dict[str, Any]):
+        """성공한 계획만 캐시에 저장 (데모/오류 결과는 저장하지 않음)"""
+        if not self.plan_cache or not result or result.get('status') != 'success':
+            return
+        try:
+            self.plan_cache.put(user_input, result)
+        except Exception as e:
+            print(f"계획 캐시 저장 실패: {e}")
+    
+    def _retrieve_context(self, user_input: Dict[str, Any], token_report: Optional[Dict[str, Any]] = None) -> str:
+        """RAG 검색으로 참조 컨텍스트 생성 (BM25 + 벡터 하이브리드, 목적지 도시/국가로 필터)
+
+        검색된 청크는 중복을 제거하고 관련도 순서대로 RAG_CONTEXT_TOKEN_BUDGET 안에 담습니다.
+        """
+        if self.retriever and user_input.get('destination'):
+            try:
+                query = self._build_retrieval_query(user_input)
+                filters = self.retriever.destination_filters(user_input['destination'])
+                docs = self.retriever.retrieve(query, k=config.RAG_TOP_K, filters=filters)
+                # 필터에 맞는 청크가 없으면 전체에서 다시 검색
+                if not docs and filters:
+                    docs = self.retriever.retrieve(query, k=config.RAG_TOP_K)
+                print(f"RAG 검색 완료: {len(docs)}개 문서 검색됨 (필터: {filters or '없음'})")
+                return self.context_budget.pack_chunks(docs, token_report)
+            except Exception as e:
+                st.warning(f"RAG 검색 중 오류 발생: {str(e)}")
+                return ""
+        
+        # 검색기가 없으면 RAG 검색 건너뛰기
+        if not self.retriever:
+            print("BM25 색인과 ChromaDB가 모두 없어 RAG 검색을 건너뜁니다.")
+        return ""
+    
+    def _build_retrieval_query(self, user_input: Dict[str, Any]) -> str:
+        """검색 질의 구성 (목록 입력은 쉼표로 이어 붙임)"""
+        parts = [user_input['destination'], "여행 정보", user_input.get('travel_style', '')]
+        for key in ('activities', 'food_preferences'):
+            value = user_input.get(key) or []
+            parts.append(", ".join(value) if isinstance(value, (list, tuple)) else str(value))
+        return " ".join(part for part in parts if part)
+    
+    def _finalize_result(self, result: Any, user_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent/LLM 응답을 정리하여 결과 딕셔너리로 변환"""
+        
+        # Agent 응답이 유효한지 확인
+        if not result or len(str(result).strip()) <= 10:
+            # Agent 응답이 유효하지 않으면 데모 데이터 반환
+            print("Agent 응답이 유효하지 않아 데모 데이터를 반환합니다.")
+            print(f"응답 길이: {len(str(result)) if result else 0}")
+            return self._get_demo_result(user_input)
+        
+        print("Agent 응답이 유효합니다. 파싱을 시작합니다.")
+        
+        # 응답 정리
+        result_str = str(result).strip()
+        print(f"원본 응답 길이: {len(result_str)} 문자")
+        
+        # Tool 호출만 있고 실제 응답이 없는 경우 처리
+        if "Action:" in result_str and "Final Answer:" not in result_str:
+            print("Tool 호출만 있고 최종 응답이 없습니다. 데모 데이터를 반환합니다.")
+            return self._get_demo_result(user_input)
+        
+        # "Final Answer:" 부분이 있으면 제거
+        if "Final Answer:" in result_str:
+            result_str = result_str.split("Final Answer:")[-1].strip()
+            print("Final Answer 부분을 제거했습니다.")
+        
+        # 마크다운 헤더가 있으면 그대로 사용, 없으면 추가
+        if not result_str.startswith("#"):
+            result_str = f"## 📅 여행 계획\n\n{result_str}"
+            print("마크다운 헤더를 추가했습니다.")
+        
+        print(f"정리된 응답 길이: {len(result_str)} 문자")
+        print(f"정리된 응답 미리보기: {result_str[:200]}...")
+        
+        parsed_result = self._parse_result_simple(result_str)
+        print(f"파싱 완료: {parsed_result.get('type', 'unknown')} 타입")
+        print(f"파싱된 content 길이: {len(parsed_result.get('content', ''))} 문자")
+        return parsed_result
+    
+    def _handle_agent_error(self, e: Exception, user_input: Dict[str, Any]) -> Dict[str, Any]:
+        """Agent 호출 오류 처리 (파싱 오류면 원본 응답 복구, 아니면 데모 데이터)"""
+        st.warning(f"Agent 호출 중 오류 발생: {str(e)}")
+        print(f"Agent 오류 상세: {str(e)}")
+        print(f"오류 타입: {type(e).__name__}")
+        
+        # 파싱 오류인 경우 원본 응답을 정리해서 반환
+        if "Could not parse LLM output" in str(e) or "OutputParserException" in str(e):
+            print("파싱 오류 감지. 원본 응답을 정리하여 반환합니다.")
+            try:
+                # 오류 메시지에서 원본 응답 추출 시도
+                error_msg = str(e)
+                if "`" in error_msg:
+                    # 백틱으로 둘러싸인 부분 추출
+                    start = error_msg.find("`") + 1
+                    end = error_msg.rfind("`")
+                    if start > 0 and end > start:
+                        original_response = error_msg[start:end].strip()
+                        if len(original_response) > 10:
+                            # 응답 정리
+                            if "Final Answer:" in original_response:
+                                original_response = original_response.split("Final Answer:")[-1].strip()
+                            
+                            if not original_response.startswith("#"):
+                                original_response = f"## 📅 여행 계획\n\n{original_response}"
+                            
+                            return self._parse_result_simple(original_response)
+            except:
+                pass
+        
+        # Agent 오류 시 데모 데이터 반환
+        return self._get_demo_result(user_input)
+    
+    def _plan_travel_parallel(self, user_input: Dict[str, Any], context: str = "", callbacks: Optional[List[Any]] = None,
+                              token_report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """도구 호출을 병렬로 실행하고 LLM 1회 호출로 최종 계획을 종합"""
+        
+        started = time.perf_counter()
+        print(f"병렬 계획 모드 시작: {user_input.get('destination', 'N/A')} 여행 계획")
+        
+        observations = self._run_tools_parallel(self._build_tool_queries(user_input), callbacks)
+        print(f"도구 병렬 실행 완료: {len(observations)}개, {time.perf_counter() - started:.2f}초")
+        
+        prompt = self._format_synthesis_input(user_input, context, observations, token_report)
+        try:
+            if callbacks:
+                response = self.llm.invoke(prompt, config={"callbacks": callbacks})
+            else:
+                response = self.llm.invoke(prompt)
+            result = getattr(response, 'content', response)
+            print(f"종합 LLM 응답 수신: {len(str(result))} 문자, 총 {time.perf_counter() - started:.2f}초")
+            return self._attach_token_report(self._finalize_result(result, user_input), token_report)
+        except Exception as e:
+            return self._handle_agent_error(e, user_input)
+    
+    async def _aplan_travel_parallel(self, user_input: Dict[str, Any], context: str = "",
+                                     token_report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """_plan_travel_parallel의 비동기 버전 (도구는 asyncio.gather, 종합은 ainvoke)"""
+        
+        started = time.perf_counter()
+        observations = await self._arun_tools_parallel(self._build_tool_queries(user_input))
+        print(f"도구 비동기 실행 완료: {len(observations)}개, {time.perf_counter() - started:.2f}초")
+        
+        prompt = self._format_synthesis_input(user_input, context, observations, token_report)
+        try:
+            response = await self.llm.ainvoke(prompt)
+            result = getattr(response, 'content', response)
+            return self._attach_token_report(self._finalize_result(result, user_input), token_report)
+        except Exception as e:
+            return self._handle_agent_error(e, user_input)
+    
+    def _build_tool_queries(self, user_input: Dict[str, Any]) -> Dict[str, str]:
+        """사용자 입력으로 각 도구의 입력 문자열 구성 (도구 description의 입력 형식을 따름)"""
+        destination = user_input.get('destination', '')
+        duration = user_input.get('duration', 5)
+        budget_range = user_input.get('budget_range', '보통 (50-100만원)')
+        
+        return {
+            "search_destination": destination,
+            "get_weather": f"{destination}, {duration}일 여행",
+            "search_accommodation": f"{destination}, {budget_range}, {user_input.get('accommodation_type', '호텔')}",
+            "search_restaurants": f"{destination}, {', '.join(user_input.get('food_preferences', [])) or '현지 음식'}",
+            "get_transportation": f"{destination}, {', '.join(user_input.get('transportation', [])) or '대중교통'}",
+            "calculate_budget": f"{budget_range}, {duration}일, {destination}, {user_input.get('group_size', 1)}명, {user_input.get('accommodation_type', '호텔')}",
+            "optimize_itinerary": f"{destination}, {duration}일, {', '.join(user_input.get('activities', [])) or '일반적인 관광'}, {user_input.get('pace') or '보통'}",
+        }
+    
+    def _run_tools_parallel(self, queries: Dict[str, str], callbacks: Optional[List[Any]] = None) -> Dict[str, str]:
+        """도구들을 스레드 풀에서 동시에 실행하고 도구 이름별 결과 반환"""
+        tools = [tool for tool in self.tools if tool.name in queries]
+        if not tools:
+            return {}
+        
+        observations = {}
+        with ThreadPoolExecutor(max_workers=min(config.PARALLEL_TOOL_WORKERS, len(tools))) as executor:
+            futures = {
+                executor.submit(tool.run, queries[tool.name], **({"callbacks": callbacks} if callbacks else {})): tool.name
+                for tool in tools
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    observations[name] = str(future.result()).strip()
+                except Exception as e:
+                    print(f"도구 실행 실패 ({name}): {e}")
+                    observations[name] = f"도구 실행 실패: {str(e)}"
+        
+        # 도구 목록 순서대로 정렬해 프롬프트를 결정적으로 유지
+        return {tool.name: observations[tool.name] for tool in tools}
+    
+    async def _arun_tools_parallel(self, queries: Dict[str, str]) -> Dict[str, str]:
+        """도구들의 비동기 경로(arun)를 동시에 실행하고 도구 이름별 결과 반환"""
+        tools = [tool for tool in self.tools if tool.name in queries]
+        results = await asyncio.gather(
+            *(tool.arun(queries[tool.name]) for tool in tools),
+            return_exceptions=True
+        )
+        
+        observations = {}
+        for tool, result in zip(tools, results):
+            if isinstance(result, Exception):
+                print(f"도구 실행 실패 ({tool.name}): {result}")
+                observations[tool.name] = f"도구 실행 실패: {str(result)}"
+            else:
+                observations[tool.name] = str(result).strip()
+        return observations
+    
     def _get_demo_result(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
         """데모 결과 반환"""
         destination = user_input.get('destination', '파리')
@@ -340,16 +715,26 @@ class TravelCoordinatorAgent:
             """
         }
     
-    def _format_user_input(self, user_input: Dict[str, Any], context: str = "") -> str:
-        """사용자 입력을 프롬프트 형식으로 변환 (컨텍스트 포함)"""
-        
-        context_section = f"\n\n참조할 여행 정보:\n{context}" if context else ""
+    def _format_user_input(self, user_input: Dict[str, Any], context: str = "",
+                           token_report: Optional[Dict[str, Any]] = None) -> str:
+        """사용자 입력을 ReAct 프롬프트로 변환 (컨텍스트 포함, 첫 호출 입력에 토큰 예산 적용)"""
+        request_section = self._format_request_section(user_input)
+
+        def render(sections: Dict[str, str]) -> str:
+            context_section = f"참조할 여행 정보:\n{sections['context']}\n\n" if sections['context'] else ""
+            return f"""당신은 전문 여행 코디네이터입니다. 사용자의 요구사항에 맞는 여행 계획을 수립해주세요.
+
+{context_section}{request_section}
 
-        return f"""당신은 전문 여행 코디네이터입니다. 사용자의 요구사항에 맞는 완벽한 여행 계획을 수립해주세요.
+{REACT_INSTRUCTIONS}
 
-{context_section}
+{PLAN_OUTPUT_TEMPLATE}"""
 
-여행 계획 요청:
+        return self.context_budget.fit(render, {"context": context}, token_report)
+    
+    def _format_request_section(self, user_input: Dict[str, Any]) -> str:
+        """프롬프트의 '여행 계획 요청' 섹션 생성"""
+        return f"""여행 계획 요청:
 - 목적지: {user_input.get('destination', 'N/A')}
 - 여행 기간: {user_input.get('duration', 'N/A')}일
 - 인원수: {user_input.get('group_size', 'N/A')}명
@@ -360,76 +745,49 @@ class TravelCoordinatorAgent:
 - 음식 선호: {', '.join(user_input.get('food_preferences', []))}
 - 교통수단: {', '.join(user_input.get('transportation', []))}
 - 여행 페이스: {user_input.get('pace', 'N/A')}
-- 추가 요구사항: {user_input.get('additional_notes', 'N/A')}
-
-작업 순서:
-1. 목적지 정보를 검색하세요 (search_destination 도구 사용)
-2. 날씨 정보를 확인하세요 (get_weather 도구 사용)
-3. 숙박, 음식, 교통, 액티비티를 계획하세요 (각각의 도구 사용)
-4. 예산을 관리하세요 (budget_calculator 도구 사용)
-5. 최종 일정을 최적화하세요 (itinerary_optimizer 도구 사용)
-
-**매우 중요: 모든 도구 사용이 완료되면 반드시 "Final Answer:"로 시작하는 최종 여행 계획을 작성해주세요.**
-
-사용 가능한 도구들:
-- search_destination: 목적지 정보 검색
-- get_weather: 날씨 정보 조회
-- search_accommodation: 숙박 시설 검색
-- search_restaurant: 레스토랑 검색
-- search_transportation: 교통 수단 검색
-- budget_calculator: 예산 계산
-- itinerary_optimizer: 일정 최적화
-
-최종 응답 형식:
-Final Answer: [여기에 상세한 여행 계획을 작성]
-
-여행 계획은 다음 형식으로 작성해주세요:
-
-## 📅 여행 일정
-
-### Day 1: [날짜]
-**오전 활동:**
-- 시간: [시간]
-- 활동: [활동명]
-- 장소: [장소]
-- 설명: [상세 설명]
-- 비용: [비용]
-- 교통수단: [교통수단]
+- 추가 요구사항: {user_input.get('additional_notes', 'N/A')}"""
+    
+    def _format_synthesis_input(self, user_input: Dict[str, Any], context: str, observations: Dict[str, str],
+                                token_report: Optional[Dict[str, Any]] = None) -> str:
+        """병렬 모드용 종합 프롬프트 생성 (도구 결과를 미리 포함하므로 추가 도구 호출 없음)
 
-**점심:**
-- 시간: [시간]
-- 식당: [식당명]
-- 요리: [요리 종류]
-- 비용: [비용]
-- 메모: [추가 정보]
+        입력 토큰 예산을 넘으면 RAG 컨텍스트와 도구별 결과를 고르게 줄입니다.
+        """
+        request_section = self._format_request_section(user_input)
 
-**오후 활동:**
-- 시간: [시간]
-- 활동: [활동명]
-- 장소: [장소]
-- 설명: [상세 설명]
-- 비용: [비용]
-- 교통수단: [교통수단]
+        def render(sections: Dict[str, str]) -> str:
+            context_section = f"참조할 여행 정보:\n{sections['context']}\n\n" if sections['context'] else ""
+            observation_section = "\n\n".join(
+                f"[{name}]\n{sections[f'tool:{name}']}" for name in observations
+            ) or "도구 조회 결과가 없습니다."
+            return f"""당신은 전문 여행 코디네이터입니다. 사용자의 요구사항에 맞는 여행 계획을 수립해주세요.
 
-**숙박:**
-- 숙소명: [숙소명]
-- 유형: [숙소 유형]
-- 비용: [비용]
-- 메모: [추가 정보]
+{context_section}{request_section}
 
-## 💡 추천사항
-- 필수 방문지: [목록]
-- 숨겨진 명소: [목록]
-- 현지인 팁: [목록]
-- 예산 절약 팁: [목록]
+전문 Agent 도구 조회 결과:
+{observation_section}
 
-## 💰 총 예상 비용
-[총 비용 범위]
+위 도구 조회 결과를 모두 반영하여 도구를 다시 호출하지 말고 "Final Answer:" 뒤에 아래 형식으로 완전한 여행 계획을 작성하세요.
 
-## 🎒 준비물
-[준비물 목록]
+{PLAN_OUTPUT_TEMPLATE}"""
 
-모든 도구 사용을 완료한 후 "Final Answer:"로 시작하는 완전한 여행 계획을 작성해주세요."""
+        sections = {"context": context}
+        sections.update((f"tool:{name}", str(observation)) for name, observation in observations.items())
+        return self.context_budget.fit(render, sections, token_report)
+    
+    def _attach_token_report(self, result: Dict[str, Any], token_report: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """요청별 입력 토큰 집계를 로그로 남기고 결과에 token_budget으로 추가"""
+        if not token_report:
+            return result
+        token_report["saved_tokens"] = saved_tokens(token_report)
+        print(
+            f"프롬프트 입력 토큰: {token_report.get('prompt_tokens', 0)}개 "
+            f"(RAG {token_report.get('rag_tokens_before', 0)} → {token_report.get('rag_tokens_after', 0)}, "
+            f"절감 {token_report['saved_tokens']}개)"
+        )
+        if isinstance(result, dict):
+            result["token_budget"] = dict(token_report)
+        return result
     
     def _parse_result_simple(self, result: str) -> Dict[str, Any]:
         """Agent 결과를 파싱하여 구조화된 데이터로 변환 (텍스트 기반)"""
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+AI 여행 플래너 - 배치 계획 생성 (Streamlit 없이 JSONL 요청을 일괄 처리)
+
+입력 JSONL의 각 줄은 여행 입력 하나입니다. "id"(또는 "request_id")가 없으면 줄 번호를 ID로 사용하고,
+여행 입력은 "input" 필드에 두거나 최상위에 바로 둘 수 있습니다.
+
+    {"id": "paris-5d", "destination": "파리", "duration": 5, "activities": ["맛집 탐방"]}
+    {"id": "rome-3d", "input": {"destination": "로마", "duration": 3}}
+
+결과는 요청마다 한 줄씩 출력 JSONL에 추가되며, 다시 실행하면 이미 처리된 ID는 건너뜁니다.
+--retry-failed로 다시 처리한 요청은 실행이 끝나면 요청 ID마다 최신 결과 한 줄만 남도록 출력 파일을 다시 씁니다.
+
+    python batch_planner.py data/batch_requests.sample.jsonl -o results.jsonl --concurrency 4
+    python batch_planner.py data/batch_requests.sample.jsonl -o results.jsonl --demo
+"""
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Set, Tuple
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from agents.callbacks import PlanEventQueueHandler
+
+ID_FIELDS = ("id", "request_id")
+
+def load_requests(path: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """입력 JSONL을 (요청 ID, 여행 입력) 목록으로 변환"""
+    requests = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                print(f"{line_number}번째 줄을 읽을 수 없어 건너뜁니다: {e}")
+                continue
+
+            request_id = str(next((row[field] for field in ID_FIELDS if field in row), f"line-{line_number}"))
+            user_input = row.get("input") or {key: value for key, value in row.items() if key not in ID_FIELDS}
+            requests.append((request_id, user_input))
+    return requests
+
+def load_checkpoint(path: str, retry_failed: bool = False) -> Set[str]:
+    """출력 파일에서 이미 처리된 요청 ID 수집 (retry_failed이면 실패한 요청은 다시 처리)"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                # 중단 시 마지막 줄이 잘렸을 수 있음
+                continue
+            if retry_failed and row.get("status") != "success":
+                continue
+            done.add(row["request_id"])
+    return done
+
+def compact_output(path: str) -> int:
+    """요청 ID마다 마지막 결과 한 줄만 남도록 출력 파일을 다시 씀 (남은 줄 수 반환)
+
+    순서는 각 ID가 처음 기록된 위치를 유지하고, 임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도
+    기존 출력은 그대로 남습니다.
+    """
+    if not os.path.exists(path):
+        return 0
+    records: Dict[str, str] = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            records[row["request_id"]] = line if line.endswith("\n") else line + "\n"
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(records.values())
+    os.replace(tmp_path, path)
+    return len(records)
+
+def plan_one(coordinator, request_id: str, user_input: Dict[str, Any]) -> Dict[str, Any]:
+    """요청 하나를 처리하고 결과와 소요 시간/토큰 통계 반환"""
+    handler = PlanEventQueueHandler(queue.Queue())
+    started = time.perf_counter()
+    try:
+        result = coordinator.plan_travel(user_input, callbacks=[handler])
+        error = None
+    except Exception as e:
+        result, error = None, str(e)
+    latency_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    ok = bool(result) and result.get("status") != "error"
+    if not ok and error is None:
+        error = (result or {}).get("message", "결과가 비어 있습니다.")
+    return {
+        "request_id": request_id,
+        "status": "success" if ok else "error",
+        "latency_ms": latency_ms,
+        "metrics": handler.metrics(),
+        "error": error,
+        "input": user_input,
+        "result": result,
+    }
+
+def build_coordinator(demo: bool):
+    """Coordinator 생성 (demo이면 LLM 없이 데모 결과 생성)"""
+    if demo:
+        from agents.coordinator import TravelCoordinatorAgent
+        return TravelCoordinatorAgent(None, [])
+
+    from components.resource_registry import get_resource_registry
+    registry = get_resource_registry()
+    if registry.get_llm() is None:
+        print("API 키가 설정되지 않아 데모 결과를 생성합니다.")
+    return registry.get_coordinator()
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def run_batch(input_path: str, output_path: str, concurrency: int = 2, demo: bool = False,
+              retry_failed: bool = False) -> Dict[str, Any]:
+    """입력 JSONL 전체를 처리하고 요약 통계 반환"""
+    requests = load_requests(input_path)
+    done = load_checkpoint(output_path, retry_failed)
+    pending = [(request_id, user_input) for request_id, user_input in requests if request_id not in done]
+    print(f"요청 {len(requests)}건 중 {len(requests) - len(pending)}건은 이미 처리되어 건너뜁니다.")
+
+    summary = {"processed": 0, "succeeded": 0, "failed": 0, "skipped": len(requests) - len(pending)}
+    if not pending:
+        if retry_failed:
+            compact_output(output_path)
+        return summary
+
+    coordinator = build_coordinator(demo)
+    latencies, total_tokens = [], 0
+    write_lock = threading.Lock()
+    started = time.perf_counter()
+
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    with open(output_path, "a", encoding="utf-8") as out, \
+            ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = [executor.submit(plan_one, coordinator, request_id, user_input) for request_id, user_input in pending]
+        for future in as_completed(futures):
+            record = future.result()
+            # 완료 즉시 한 줄씩 기록해 중단되어도 다음 실행에서 이어서 처리
+            with write_lock:
+                out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                out.flush()
+
+            summary["processed"] += 1
+            summary["succeeded" if record["status"] == "success" else "failed"] += 1
+            latencies.append(record["latency_ms"])
+            total_tokens += record["metrics"]["tokens"]["total_tokens"]
+            print(f"[{summary['processed']}/{len(pending)}] {record['request_id']}: "
+                  f"{record['status']} ({record['latency_ms']:.0f}ms)")
+
+    # 다시 처리한 요청의 이전 실패 기록 제거
+    if retry_failed:
+        compact_output(output_path)
+
+    elapsed = time.perf_counter() - started
+    summary.update({
+        "elapsed_seconds": round(elapsed, 2),
+        "throughput_per_minute": round(summary["processed"] / elapsed * 60, 2) if elapsed else 0.0,
+        "latency_p50_ms": _percentile(latencies, 0.5),
+        "latency_p95_ms": _percentile(latencies, 0.95),
+        "total_tokens": total_tokens,
+    })
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="JSONL 여행 요청을 일괄 처리해 여행 계획 생성")
+    parser.add_argument("input", help="입력 JSONL 파일")
+    parser.add_argument("-o", "--output", default="batch_results.jsonl", help="출력 JSONL 파일 (체크포인트로도 사용)")
+    parser.add_argument("--concurrency", type=int, default=2, help="동시에 처리할 요청 수")
+    parser.add_argument("--demo", action="store_true", help="LLM 없이 데모 결과 생성")
+    parser.add_argument("--retry-failed", action="store_true", help="이전 실행에서 실패한 요청도 다시 처리")
+    args = parser.parse_args()
+
+    summary = run_batch(args.input, args.output, args.concurrency, args.demo, args.retry_failed)
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
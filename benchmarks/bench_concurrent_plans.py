@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+동시 여행 계획 처리량 벤치마크 - 동기 경로(plan_travel) vs 비동기 경로(aplan_travel)
+
+LLM 호출은 고정 지연을 가진 가짜 LLM으로 대체하므로 API 키 없이 실행됩니다.
+
+    python benchmarks/bench_concurrent_plans.py --plans 20 --latency 0.5
+"""
+import os
+import sys
+
+# 반복 요청이 디스크 계획 캐시에서 반환되어 처리량이 부풀려지지 않도록 설정을 읽기 전에 비활성화
+os.environ["PLAN_CACHE_ENABLED"] = "false"
+
+import time
+import asyncio
+import argparse
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.coordinator import TravelCoordinatorAgent
+from tools import (
+    SearchDestinationTool, WeatherTool, AccommodationSearchTool,
+    RestaurantSearchTool, TransportationTool, BudgetCalculatorTool,
+    ItineraryOptimizerTool
+)
+
+FINAL_ANSWER = "Final Answer: ## 📅 여행 일정\n\n### Day 1: 도착\n**오전 활동:**\n- 활동: 시내 관광"
+
+class LatencyLLM:
+    """고정 지연 후 최종 답변을 반환하는 가짜 LLM (동기/비동기 모두 지원)"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def invoke(self, prompt):
+        time.sleep(self.latency)
+        return FINAL_ANSWER
+
+    async def ainvoke(self, prompt):
+        await asyncio.sleep(self.latency)
+        return FINAL_ANSWER
+
+def build_agent(latency: float) -> TravelCoordinatorAgent:
+    """병렬 모드 Coordinator 생성 (Agent 초기화 없이 가짜 LLM 연결)"""
+    tools = [
+        SearchDestinationTool(), WeatherTool(), AccommodationSearchTool(),
+        RestaurantSearchTool(), TransportationTool(), BudgetCalculatorTool(),
+        ItineraryOptimizerTool()
+    ]
+    agent = TravelCoordinatorAgent(None, tools, planning_mode="parallel")
+    agent.llm = LatencyLLM(latency)
+    return agent
+
+def make_requests(count: int):
+    destinations = ["파리", "로마", "도쿄", "취리히"]
+    return [
+        {
+            "destination": destinations[i % len(destinations)],
+            "duration": 3 + i % 4,
+            "budget_range": "보통 (50-100만원)",
+            "accommodation_type": "호텔",
+            "activities": ["맛집 탐방", "박물관/미술관"],
+            "food_preferences": ["현지 음식"],
+            "transportation": ["대중교통", "도보"],
+        }
+        for i in range(count)
+    ]
+
+def bench_sync(agent, requests):
+    started = time.perf_counter()
+    for request in requests:
+        agent.plan_travel(request)
+    return time.perf_counter() - started
+
+async def _run_async(agent, requests):
+    await asyncio.gather(*(agent.aplan_travel(request) for request in requests))
+
+def bench_async(agent, requests):
+    started = time.perf_counter()
+    asyncio.run(_run_async(agent, requests))
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="동기/비동기 계획 처리량 비교")
+    parser.add_argument("--plans", type=int, default=20, help="실행할 계획 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="가짜 LLM 응답 지연 (초)")
+    args = parser.parse_args()
+
+    agent = build_agent(args.latency)
+    requests = make_requests(args.plans)
+
+    sync_elapsed = bench_sync(agent, requests)
+    async_elapsed = bench_async(agent, requests)
+
+    print("\n=== 동시 계획 처리량 ===")
+    print(f"계획 수: {args.plans}, LLM 지연: {args.latency:.2f}초")
+    print(f"동기 (plan_travel 순차):   {sync_elapsed:.2f}초, {args.plans / sync_elapsed:.2f} plans/s")
+    print(f"비동기 (aplan_travel 동시): {async_elapsed:.2f}초, {args.plans / async_elapsed:.2f} plans/s")
+    print(f"속도 향상: {sync_elapsed / async_elapsed:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+JSON 추출 처리량 벤치마크 - 기존 탐욕적 정규식 방식 vs 중괄호 균형 스캐너
+
+100KB 이상의 LLM 응답에서 JSON을 추출하는 시간을 비교합니다. (외부 의존성 없음)
+
+    python benchmarks/bench_json_extraction.py --size-kb 200 --runs 20
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.json_extractor import IncrementalJSONExtractor, extract_largest_json
+
+def legacy_extract(response_text):
+    """기존 _extract_json_from_response 구현 (```json 블록 → 탐욕적 {.*})"""
+    json_match = re.search(r'```json\s*(.*?)\s*```', response_text, re.DOTALL)
+    if json_match:
+        json_str = json_match.group(1)
+    else:
+        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        if not json_match:
+            return None
+        json_str = json_match.group(0)
+    try:
+        return json.loads(json_str)
+    except json.JSONDecodeError:
+        return None
+
+def make_plan(size_kb: int) -> dict:
+    day = {
+        "activities": [
+            {"time": "09:00", "activity": "박물관 관람", "location": "시립 박물관", "description": "대표 소장품 {특별전} 감상"},
+            {"time": "14:00", "activity": "공원 산책", "location": "중앙 공원", "description": "\"현지인\" 추천 코스"},
+        ],
+        "meals": [{"time": "12:30", "restaurant": "비스트로", "cuisine": "가정식", "cost": "€25"}],
+    }
+    plan = {"itinerary": []}
+    while len(json.dumps(plan, ensure_ascii=False).encode("utf-8")) < size_kb * 1024:
+        plan["itinerary"].append(dict(day, day=len(plan["itinerary"]) + 1))
+    return plan
+
+def make_cases(size_kb: int):
+    plan_json = json.dumps(make_plan(size_kb), ensure_ascii=False, indent=2)
+    trailing = plan_json.replace('"€25"\n', '"€25",\n')
+    return {
+        "fenced": f"여행 계획입니다.\n```json\n{plan_json}\n```\n즐거운 여행 되세요!",
+        "bare_with_prose_braces": f"참고: {{destination}} 기준입니다.\n{plan_json}\n예산은 {{budget}}에 맞췄습니다.",
+        "trailing_commas": f"```json\n{trailing}\n```",
+    }
+
+def timed(func, text, runs):
+    result = func(text)
+    started = time.perf_counter()
+    for _ in range(runs):
+        func(text)
+    return (time.perf_counter() - started) / runs, result
+
+def streamed(text, chunk_size=16):
+    extractor = IncrementalJSONExtractor()
+    for start in range(0, len(text), chunk_size):
+        extractor.feed(text[start:start + chunk_size])
+    extractor.close()
+    return extractor.largest()
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON 추출 처리량 비교")
+    parser.add_argument("--size-kb", type=int, default=200, help="JSON 본문 크기 (KB)")
+    parser.add_argument("--runs", type=int, default=20, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"\n=== JSON 추출 ({args.size_kb}KB, {args.runs}회 평균) ===")
+    for name, text in make_cases(args.size_kb).items():
+        size_mb = len(text.encode("utf-8")) / 1024 / 1024
+        print(f"\n[{name}] {size_mb * 1024:.0f}KB")
+        for label, func in (("기존 정규식", legacy_extract), ("스캐너", extract_largest_json), ("스트리밍(16자)", streamed)):
+            elapsed, result = timed(func, text, args.runs)
+            found = f"일정 {len(result['itinerary'])}일" if result else "추출 실패"
+            print(f"  {label:14s} {elapsed * 1000:8.2f}ms  {size_mb / elapsed:7.1f}MB/s  {found}")
+
+if __name__ == "__main__":
+    main()
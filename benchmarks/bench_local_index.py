@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+RAG 검색 백엔드 벤치마크 - 로컬 벡터 색인(문자 n-gram, mmap) vs ChromaDB
+
+같은 합성 청크로 두 백엔드를 만들어 구축 시간, 시작(로드) 시간, 질의 지연 시간을 비교합니다.
+ChromaDB는 결정적 가짜 임베딩을 쓰므로 실제 운영에서 질의마다 더해지는 임베딩 API 호출 시간은
+포함되지 않습니다. langchain_chroma가 없으면 로컬 색인만 측정합니다. (API 키 불필요)
+
+    python benchmarks/bench_local_index.py --docs 2000 --runs 200
+"""
+import os
+import sys
+import time
+import tempfile
+import argparse
+import statistics
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.hybrid_retriever import BM25Index, HybridRetriever, RetrievedChunk
+from components.local_vector_index import LocalVectorIndex
+
+DESTINATIONS = ["파리", "로마", "도쿄", "취리히", "바르셀로나", "방콕", "뉴욕", "프라하"]
+SECTIONS = ["관광지", "음식", "교통", "숙박", "날씨", "문화", "쇼핑", "예산"]
+QUERIES = ["파리 여행 정보 박물관", "도쿄 맛집 탐방 라멘", "취리히 대중교통 패스", "방콕 숙박 예산", "로마 유적 관광지"]
+
+def make_chunks(count: int):
+    return [
+        RetrievedChunk(
+            f"chunk-{i}",
+            f"{DESTINATIONS[i % len(DESTINATIONS)]} {SECTIONS[i % len(SECTIONS)]} 정보 {i}: "
+            f"{DESTINATIONS[i % len(DESTINATIONS)]} 여행자를 위한 {SECTIONS[i % len(SECTIONS)]} 안내입니다. " * 4,
+            {"city": DESTINATIONS[i % len(DESTINATIONS)], "section": SECTIONS[i % len(SECTIONS)]}
+        )
+        for i in range(count)
+    ]
+
+def latency(search, runs: int):
+    """질의를 돌아가며 runs회 실행한 (평균, p50, p95) ms"""
+    search(QUERIES[0])
+    samples = []
+    for run in range(runs):
+        started = time.perf_counter()
+        search(QUERIES[run % len(QUERIES)])
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return statistics.mean(samples), samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+def report(label: str, build_ms: float, load_ms: float, stats):
+    mean, p50, p95 = stats
+    print(f"  {label:22s} 구축 {build_ms:9.1f}ms  로드 {load_ms:8.2f}ms  질의 평균 {mean:7.3f}ms  p50 {p50:7.3f}ms  p95 {p95:7.3f}ms")
+
+def bench_local(chunks, runs: int, directory: str):
+    started = time.perf_counter()
+    index = LocalVectorIndex.build(chunks)
+    index.save(directory)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    loaded = LocalVectorIndex.load(directory)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    report("로컬 벡터 색인", build_ms, load_ms, latency(lambda query: loaded.similarity_search(query, k=20), runs))
+    filtered = {"city": {"$in": ["파리"]}}
+    report("로컬 벡터 색인 + 필터", build_ms, load_ms,
+           latency(lambda query: loaded.similarity_search(query, k=20, filter=filtered), runs))
+
+    hybrid = HybridRetriever(loaded, BM25Index.from_documents(chunks))
+    report("BM25 + 로컬 (RRF)", build_ms, load_ms, latency(lambda query: hybrid.retrieve(query, k=3), runs))
+
+def bench_chroma(chunks, runs: int, directory: str):
+    try:
+        from langchain_chroma import Chroma
+        from langchain_core.documents import Document
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+    except ImportError as e:
+        print(f"  ChromaDB를 사용할 수 없어 건너뜁니다: {e}")
+        return
+
+    embeddings = DeterministicFakeEmbedding(size=256)
+    documents = [Document(page_content=chunk.page_content, metadata=chunk.metadata) for chunk in chunks]
+    started = time.perf_counter()
+    Chroma.from_documents(documents, embeddings, persist_directory=directory, collection_name="bench")
+    build_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    vectorstore = Chroma(persist_directory=directory, embedding_function=embeddings, collection_name="bench")
+    vectorstore.similarity_search(QUERIES[0], k=1)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    report("ChromaDB (가짜 임베딩)", build_ms, load_ms, latency(lambda query: vectorstore.similarity_search(query, k=20), runs))
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 벡터 색인과 ChromaDB 검색 지연 비교")
+    parser.add_argument("--docs", type=int, default=2000, help="청크 수")
+    parser.add_argument("--runs", type=int, default=200, help="질의 반복 횟수")
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.docs)
+    print(f"\n=== RAG 검색 백엔드 ({args.docs}개 청크, 질의 {args.runs}회) ===")
+    with tempfile.TemporaryDirectory() as directory:
+        bench_local(chunks, args.runs, os.path.join(directory, "local"))
+        bench_chroma(chunks, args.runs, os.path.join(directory, "chroma"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+벤치마크용 가짜 LLM - 기록된 ReAct 응답을 순서대로 재생 (API 키 불필요, 결과 결정적)
+"""
+import os
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.llms import LLM
+
+TRANSCRIPT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transcripts")
+
+class ScriptedReActLLM(LLM):
+    """responses를 호출 순서대로 반환하는 LLM (마지막 응답 이후에는 처음부터 반복)
+
+    ReAct Agent와 병렬 모드 종합 호출 모두에서 사용할 수 있으며, latency초만큼
+    지연시켜 실제 API 응답 시간을 흉내냅니다. calls는 계획 하나의 Agent 반복 횟수를
+    측정할 때 reset()으로 초기화합니다.
+    """
+
+    responses: List[str]
+    latency: float = 0.0
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-react"
+
+    def _call(self, prompt: str, stop: Optional[List[str]] = None, run_manager=None, **kwargs: Any) -> str:
+        response = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return response
+
+    def reset(self):
+        self.calls = 0
+
+def load_transcript(name: str) -> Dict[str, Any]:
+    """transcripts/<name>.json 로드 (user_input, responses 포함)"""
+    path = name if os.path.exists(name) else os.path.join(TRANSCRIPT_DIR, f"{name}.json")
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+계획 파이프라인 벤치마크 - 기록된 ReAct 응답을 재생하는 가짜 LLM으로 결정적으로 측정
+
+측정 항목:
+- plan_react: ReAct Agent 경로의 전체 계획 지연 시간, Agent 반복/도구 호출 횟수
+- plan_parallel: 병렬 모드 경로의 전체 계획 지연 시간
+- parser_text / parser_json: LLMResponseProcessor.process_llm_response의 큰 응답 처리량
+- rag_query: 가짜 임베딩을 사용한 인메모리 Chroma 검색 지연 시간 (임베딩 API 시간 제외)
+
+결과는 JSON 리포트로 저장하며, --compare로 이전 리포트와 비교할 수 있습니다.
+
+    python benchmarks/run_benchmarks.py --runs 10 --latency 0.05
+    python benchmarks/run_benchmarks.py --only parser_text parser_json --compare benchmarks/results/base.json
+"""
+import os
+import sys
+
+# 벤치마크 중 디스크 계획 캐시가 결과를 가리지 않도록 설정을 읽기 전에 비활성화
+os.environ["PLAN_CACHE_ENABLED"] = "false"
+
+import json
+import time
+import queue
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.callbacks import PlanEventQueueHandler
+from agents.coordinator import TravelCoordinatorAgent
+from components.hybrid_retriever import HybridRetriever
+from components.llm_response_processor import LLMResponseProcessor
+from tools import (
+    SearchDestinationTool, WeatherTool, AccommodationSearchTool,
+    RestaurantSearchTool, TransportationTool, BudgetCalculatorTool,
+    ItineraryOptimizerTool
+)
+from benchmarks.fake_llm import ScriptedReActLLM, load_transcript
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+BENCHMARKS = ["plan_react", "plan_parallel", "parser_text", "parser_json", "rag_query"]
+
+# 비교 시 표시할 지표 (값이 작을수록 좋은 지표와 클수록 좋은 지표)
+LOWER_IS_BETTER = ("mean_ms", "p50_ms", "p95_ms")
+HIGHER_IS_BETTER = ("chars_per_second",)
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """측정값(초) 목록을 ms 단위 통계로 변환"""
+    ordered = sorted(sample * 1000 for sample in samples)
+    return {
+        "runs": len(ordered),
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "min_ms": round(ordered[0], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+def measure(func: Callable[[], Any], runs: int, warmup: int = 1) -> List[float]:
+    """func를 warmup회 실행한 뒤 runs회 실행 시간(초) 측정"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+def build_tools():
+    return [
+        SearchDestinationTool(), WeatherTool(), AccommodationSearchTool(),
+        RestaurantSearchTool(), TransportationTool(), BudgetCalculatorTool(),
+        ItineraryOptimizerTool()
+    ]
+
+def build_fake_vectorstore(documents: int):
+    """결정적 가짜 임베딩으로 인메모리 Chroma 컬렉션 생성 (Chroma가 없으면 None)"""
+    try:
+        from langchain_chroma import Chroma
+        from langchain_core.documents import Document
+        from langchain_core.embeddings import DeterministicFakeEmbedding
+    except ImportError as e:
+        print(f"Chroma를 사용할 수 없어 RAG 벤치마크를 건너뜁니다: {e}")
+        return None
+
+    destinations = ["파리", "로마", "도쿄", "취리히", "바르셀로나", "방콕", "뉴욕", "프라하"]
+    sections = ["관광지", "음식", "교통", "숙박", "날씨", "문화", "쇼핑", "예산"]
+    docs = [
+        Document(
+            page_content=f"{destinations[i % len(destinations)]} {sections[i % len(sections)]} 정보 {i}: "
+                         f"{destinations[i % len(destinations)]} 여행자를 위한 {sections[i % len(sections)]} 안내입니다. " * 4,
+            metadata={"destination": destinations[i % len(destinations)], "section": sections[i % len(sections)]}
+        )
+        for i in range(documents)
+    ]
+    return Chroma.from_documents(
+        docs,
+        DeterministicFakeEmbedding(size=256),
+        collection_name=f"bench_{int(time.time() * 1000)}"
+    )
+
+def attach_vectorstore(agent: TravelCoordinatorAgent, vectorstore):
+    """벤치마크용 vectorstore 연결 (없으면 RAG 단계 생략, 디스크의 색인은 사용하지 않음)"""
+    agent.vectorstore = vectorstore
+    agent.has_api_key = vectorstore is not None
+    agent.retriever = HybridRetriever(vectorstore) if vectorstore is not None else None
+
+def bench_plan_react(transcript, runs: int, latency: float, vectorstore) -> Dict[str, Any]:
+    """ReAct Agent 경로 전체 계획 지연 시간과 반복 횟수"""
+    llm = ScriptedReActLLM(responses=transcript["responses"], latency=latency)
+    agent = TravelCoordinatorAgent(llm, build_tools(), planning_mode="react")
+    attach_vectorstore(agent, vectorstore)
+
+    iterations, tool_calls, samples = [], [], []
+    for _ in range(runs + 1):
+        llm.reset()
+        handler = PlanEventQueueHandler(queue.Queue())
+        started = time.perf_counter()
+        result = agent.plan_travel(transcript["user_input"], callbacks=[handler])
+        samples.append(time.perf_counter() - started)
+        iterations.append(llm.calls)
+        tool_calls.append(len(handler.metrics()["tools"]))
+
+    # 첫 실행은 워밍업으로 제외
+    stats = summarize(samples[1:])
+    stats.update({
+        "agent_iterations": max(iterations[1:]),
+        "tool_calls": max(tool_calls[1:]),
+        "llm_latency_s": latency,
+        "status": result.get("status"),
+    })
+    return stats
+
+def bench_plan_parallel(transcript, runs: int, latency: float, vectorstore) -> Dict[str, Any]:
+    """병렬 모드 경로 전체 계획 지연 시간 (도구 동시 실행 + LLM 1회)"""
+    llm = ScriptedReActLLM(responses=[transcript["responses"][-1]], latency=latency)
+    agent = TravelCoordinatorAgent(None, build_tools(), planning_mode="parallel")
+    agent.llm = llm
+    attach_vectorstore(agent, vectorstore)
+
+    llm.reset()
+    samples = measure(lambda: agent.plan_travel(transcript["user_input"]), runs)
+    stats = summarize(samples)
+    stats.update({"llm_calls_per_plan": llm.calls / (runs + 1), "llm_latency_s": latency})
+    return stats
+
+def make_text_response(days: int) -> str:
+    """PLAN_OUTPUT_TEMPLATE 형식의 큰 텍스트 응답 생성"""
+    blocks = ["## 📅 여행 일정\n"]
+    for day in range(1, days + 1):
+        blocks.append(
+            f"### Day {day}: 시내 탐방 {day}\n"
+            "**오전 활동:**\n- 시간: 09:00-12:00\n- 활동: 박물관 관람\n- 장소: 시립 박물관\n"
+            "- 설명: 대표 소장품 감상\n- 비용: €17\n- 교통수단: 지하철\n\n"
+            "**점심:**\n- 시간: 12:30-13:30\n- 식당: 현지 비스트로\n- 요리: 가정식\n- 비용: €25\n- 메모: 예약 권장\n\n"
+            "**오후 활동:**\n- 시간: 14:00-17:00\n- 활동: 공원 산책\n- 장소: 중앙 공원\n"
+            "- 설명: 산책과 휴식\n- 비용: 무료\n- 교통수단: 도보\n\n"
+            "**숙박:**\n- 숙소명: 시티 호텔\n- 유형: 호텔\n- 비용: €150/박\n- 메모: 연박\n"
+        )
+    blocks.append("## 💰 총 예상 비용\n약 150만원\n")
+    return "\n".join(blocks)
+
+def make_json_response(days: int) -> str:
+    """```json 블록을 포함한 큰 JSON 응답 생성"""
+    itinerary = [
+        {
+            "day": day,
+            "activities": [
+                {"time": "09:00-12:00", "activity": "박물관 관람", "location": "시립 박물관", "cost": "€17"},
+                {"time": "14:00-17:00", "activity": "공원 산책", "location": "중앙 공원", "cost": "무료"},
+            ],
+            "meals": [
+                {"time": "12:30", "restaurant": "현지 비스트로", "cuisine": "가정식", "cost": "€25"},
+                {"time": "19:00", "restaurant": "야시장", "cuisine": "길거리 음식", "cost": "€15"},
+            ],
+            "accommodation": {"name": "시티 호텔", "type": "호텔", "cost": "€150"},
+        }
+        for day in range(1, days + 1)
+    ]
+    payload = {"itinerary": itinerary, "total_estimated_cost": "약 150만원", "packing_list": ["우산"]}
+    return "여행 계획입니다.\n```json\n" + json.dumps(payload, ensure_ascii=False, indent=2) + "\n```\n"
+
+def bench_parser(response_text: str, runs: int) -> Dict[str, Any]:
+    """process_llm_response 처리 시간과 처리량"""
+    processor = LLMResponseProcessor()
+    samples = measure(lambda: processor.process_llm_response(response_text), runs)
+    stats = summarize(samples)
+    stats.update({
+        "input_chars": len(response_text),
+        "chars_per_second": round(len(response_text) / statistics.mean(samples)),
+        "days_parsed": len(processor.get_processed_data().get("itinerary", [])),
+    })
+    return stats
+
+def bench_rag_query(vectorstore, runs: int, transcript) -> Optional[Dict[str, Any]]:
+    """Coordinator RAG 검색 단계 지연 시간 (vectorstore 검색 + 컨텍스트 구성)"""
+    if vectorstore is None:
+        return None
+    agent = TravelCoordinatorAgent(None, [])
+    attach_vectorstore(agent, vectorstore)
+    samples = measure(lambda: agent._retrieve_context(transcript["user_input"]), runs)
+    return summarize(samples)
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]):
+    """두 리포트의 주요 지표 변화율 출력"""
+    print(f"\n=== 비교: {baseline['meta']['commit']} → {current['meta']['commit']} ===")
+    for name, stats in current["results"].items():
+        base_stats = baseline["results"].get(name)
+        if not stats or not base_stats:
+            continue
+        for metric in LOWER_IS_BETTER + HIGHER_IS_BETTER:
+            if metric not in stats or not base_stats.get(metric):
+                continue
+            change = (stats[metric] - base_stats[metric]) / base_stats[metric] * 100
+            improved = change < 0 if metric in LOWER_IS_BETTER else change > 0
+            marker = "개선" if improved else "저하"
+            print(f"{name:14s} {metric:18s} {base_stats[metric]:>12} → {stats[metric]:>12} ({change:+.1f}%, {marker})")
+
+def main():
+    parser = argparse.ArgumentParser(description="계획 파이프라인 벤치마크 (가짜 LLM 사용, API 키 불필요)")
+    parser.add_argument("--runs", type=int, default=10, help="벤치마크별 측정 횟수")
+    parser.add_argument("--latency", type=float, default=0.0, help="가짜 LLM 호출당 지연 (초)")
+    parser.add_argument("--transcript", default="paris_react", help="재생할 ReAct 기록 이름 또는 경로")
+    parser.add_argument("--parser-days", type=int, default=60, help="파서 벤치마크 응답의 일수")
+    parser.add_argument("--rag-docs", type=int, default=2000, help="RAG 벤치마크 문서 수")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, help="실행할 벤치마크만 선택")
+    parser.add_argument("--output", help="리포트 저장 경로 (기본값: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--compare", help="비교할 이전 리포트 경로")
+    args = parser.parse_args()
+
+    selected = args.only or BENCHMARKS
+    transcript = load_transcript(args.transcript)
+    needs_vectorstore = any(name in selected for name in ("plan_react", "plan_parallel", "rag_query"))
+    vectorstore = build_fake_vectorstore(args.rag_docs) if needs_vectorstore else None
+
+    runners = {
+        "plan_react": lambda: bench_plan_react(transcript, args.runs, args.latency, vectorstore),
+        "plan_parallel": lambda: bench_plan_parallel(transcript, args.runs, args.latency, vectorstore),
+        "parser_text": lambda: bench_parser(make_text_response(args.parser_days), args.runs),
+        "parser_json": lambda: bench_parser(make_json_response(args.parser_days), args.runs),
+        "rag_query": lambda: bench_rag_query(vectorstore, args.runs, transcript),
+    }
+
+    results = {}
+    for name in selected:
+        print(f"\n▶ {name}")
+        results[name] = runners[name]()
+        print(json.dumps(results[name], ensure_ascii=False))
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['commit']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n리포트 저장: {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare_reports(json.load(f), report)
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,50 @@ from .user_input_handler import UserInputHandler
 from .llm_client import LLMClient
 from .llm_response_processor import LLMResponseProcessor
 from .llm_prompt_generator import LLMPromptGenerator
+from .resource_registry import ResourceRegistry, get_resource_registry
+from .plan_jobs import PlanJob, PlanJobManager
+from .json_extractor import IncrementalJSONExtractor, extract_json_objects, extract_largest_json
+from .itinerary_parser import StreamingItineraryParser, parse_itinerary
+from .activity_classifier import ActivityClassifier, parse_start_minutes
+from .itinerary_model import ItineraryTable, ActivityRecord, MealRecord, AccommodationRecord
+from .cost_engine import CostAmount, FXRates, parse_cost
+from .poi_store import POIStore, open_poi_store
+from .route_optimizer import optimize_route
+from .matrix_cache import MatrixCache
+from .hybrid_retriever import BM25Index, HybridRetriever, reciprocal_rank_fusion
+from .markdown_splitter import split_markdown_sections
+from .local_vector_index import LocalVectorIndex
 
 __all__ = [
     "UserInputHandler",
     "LLMClient", 
     "LLMResponseProcessor",
-    "LLMPromptGenerator"
+    "LLMPromptGenerator",
+    "ResourceRegistry",
+    "get_resource_registry",
+    "PlanJob",
+    "PlanJobManager",
+    "IncrementalJSONExtractor",
+    "extract_json_objects",
+    "extract_largest_json",
+    "StreamingItineraryParser",
+    "parse_itinerary",
+    "ActivityClassifier",
+    "parse_start_minutes",
+    "ItineraryTable",
+    "ActivityRecord",
+    "MealRecord",
+    "AccommodationRecord",
+    "CostAmount",
+    "FXRates",
+    "parse_cost",
+    "POIStore",
+    "open_poi_store",
+    "optimize_route",
+    "MatrixCache",
+    "BM25Index",
+    "HybridRetriever",
+    "reciprocal_rank_fusion",
+    "split_markdown_sections",
+    "LocalVectorIndex"
 ] 
\ No newline at end of file
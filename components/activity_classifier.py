@@ -0,0 +1,168 @@
+"""
+Activity Classifier - 키워드 표를 한 번 컴파일해 활동 카테고리/식사 유형을 일괄 분류
+"""
+import re
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 카테고리별 키워드 (앞에 있는 카테고리가 우선, 한 이름에 여러 카테고리 키워드가 있으면 우선순위로 결정)
+DEFAULT_ACTIVITY_CATEGORIES: Dict[str, Sequence[str]] = {
+    "문화": ("박물관", "미술관", "갤러리", "museum", "gallery"),
+    "자연": ("공원", "산", "바다", "자연", "park", "beach"),
+    "쇼핑": ("쇼핑", "마켓", "몰", "shopping", "market", "mall"),
+    "음식": ("레스토랑", "카페", "음식", "restaurant", "cafe"),
+    "액티비티": ("운동", "스포츠", "액티비티", "sport", "activity"),
+}
+DEFAULT_ACTIVITY_CATEGORY = "기타"
+
+# 식사 유형을 직접 나타내는 단어 (시간보다 우선)
+MEAL_TYPE_KEYWORDS: Dict[str, Sequence[str]] = {
+    "아침": ("아침", "조식", "breakfast"),
+    "점심": ("점심", "중식", "lunch", "브런치", "brunch"),
+    "저녁": ("저녁", "석식", "dinner"),
+}
+# 시작 시각(분) 기준 식사 유형 구간 [시작, 끝)
+MEAL_TIME_RANGES: Tuple[Tuple[int, int, str], ...] = (
+    (5 * 60, 11 * 60, "아침"),
+    (11 * 60, 15 * 60, "점심"),
+    (17 * 60, 22 * 60, "저녁"),
+)
+DEFAULT_MEAL_TYPE = "간식"
+
+# "12:30", "12:30-13:30", "오후 7시", "7 PM", "19시 30분"의 첫 시각
+_TIME = re.compile(
+    r'(?P<meridiem_ko>오전|오후)?\s*(?P<hour>\d{1,2})\s*(?::\s*(?P<minute>\d{2})|시(?:\s*(?P<minute_ko>\d{1,2})\s*분)?)?'
+    r'\s*(?P<meridiem_en>[ap]\.?m\.?)?',
+    re.IGNORECASE
+)
+
+def _keyword_pattern(keywords: Sequence[str]) -> "re.Pattern[str]":
+    """키워드 하나라도 포함되면 일치하는 정규식 (긴 키워드 우선)"""
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("|".join(re.escape(keyword) for keyword in ordered), re.IGNORECASE)
+
+def _to_minutes(match: "re.Match[str]") -> Optional[int]:
+    hour = int(match.group("hour"))
+    minute = int(match.group("minute") or match.group("minute_ko") or 0)
+    meridiem = (match.group("meridiem_ko") or match.group("meridiem_en") or "").lower()
+    if meridiem in ("오후",) or meridiem.startswith("p"):
+        hour = hour % 12 + 12
+    elif meridiem in ("오전",) or meridiem.startswith("a"):
+        hour = hour % 12
+    if hour > 24 or minute > 59:
+        return None
+    return hour * 60 + minute
+
+def parse_time_range(time_text: str) -> Tuple[Optional[int], Optional[int]]:
+    """"09:00-11:00" 같은 시간 문자열을 자정 기준 (시작 분, 끝 분)으로 변환 (없는 값은 None)"""
+    minutes = [_to_minutes(match) for _, match in zip(range(2), _TIME.finditer(time_text or ""))]
+    minutes += [None] * (2 - len(minutes))
+    start, end = minutes
+    if start is not None and start >= 24 * 60:
+        return None, None
+    return start, end
+
+def parse_start_minutes(time_text: str) -> Optional[int]:
+    """시간 문자열에서 시작 시각을 자정 기준 분으로 반환 (시각이 없으면 None)"""
+    match = _TIME.search(time_text or "")
+    if match is None:
+        return None
+    minutes = _to_minutes(match)
+    return minutes if minutes is not None and minutes < 24 * 60 else None
+
+class ActivityClassifier:
+    """활동 이름 → 카테고리, 식사 시간 → 식사 유형 분류기
+
+    키워드 표 전체를 하나의 정규식으로 컴파일하므로 이름마다 한 번만 검색하며,
+    classify_activities는 여러 이름을 이어 붙여 한 번의 검색으로 분류합니다.
+    """
+
+    def __init__(
+        self,
+        categories: Optional[Dict[str, Sequence[str]]] = None,
+        default_category: str = DEFAULT_ACTIVITY_CATEGORY,
+        meal_keywords: Optional[Dict[str, Sequence[str]]] = None,
+        meal_time_ranges: Sequence[Tuple[int, int, str]] = MEAL_TIME_RANGES,
+        default_meal_type: str = DEFAULT_MEAL_TYPE
+    ):
+        self.categories = categories or DEFAULT_ACTIVITY_CATEGORIES
+        self.default_category = default_category
+        self.meal_keywords = meal_keywords or MEAL_TYPE_KEYWORDS
+        self.meal_time_ranges = tuple(meal_time_ranges)
+        self.default_meal_type = default_meal_type
+
+        # 키워드 → (우선순위, 카테고리); 같은 키워드가 여러 카테고리에 있으면 앞 카테고리 사용
+        self._keyword_index: Dict[str, Tuple[int, str]] = {}
+        for priority, (category, keywords) in enumerate(self.categories.items()):
+            for keyword in keywords:
+                self._keyword_index.setdefault(keyword.lower(), (priority, category))
+        self._activity_pattern = _keyword_pattern(list(self._keyword_index))
+
+        self._meal_index = {
+            keyword.lower(): meal_type
+            for meal_type, keywords in self.meal_keywords.items()
+            for keyword in keywords
+        }
+        self._meal_pattern = _keyword_pattern(list(self._meal_index))
+
+    # 활동 분류
+    def classify_activity(self, name: str) -> str:
+        """활동 이름 하나 분류"""
+        return self.classify_activities([name])[0]
+
+    def classify_activities(self, names: Sequence[str]) -> List[str]:
+        """여러 활동 이름을 한 번의 정규식 검색으로 분류"""
+        if not names:
+            return []
+
+        # 이름들을 줄바꿈으로 이어 붙이고, 일치 위치로 어느 이름의 키워드인지 찾음
+        texts = [(name or "").replace("\n", " ") for name in names]
+        starts, position = [], 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1
+
+        best: List[Optional[Tuple[int, str]]] = [None] * len(texts)
+        for match in self._activity_pattern.finditer("\n".join(texts)):
+            item = bisect_right(starts, match.start()) - 1
+            candidate = self._keyword_index[match.group(0).lower()]
+            if best[item] is None or candidate[0] < best[item][0]:
+                best[item] = candidate
+
+        return [entry[1] if entry else self.default_category for entry in best]
+
+    # 식사 분류
+    def classify_meal(self, time_text: str, hint: str = "") -> str:
+        """식사 유형 분류 (시간 문자열이나 힌트에 식사 이름이 있으면 우선, 없으면 시작 시각 구간)"""
+        match = self._meal_pattern.search(f"{hint} {time_text or ''}")
+        if match:
+            return self._meal_index[match.group(0).lower()]
+
+        minutes = parse_start_minutes(time_text)
+        if minutes is None:
+            return self.default_meal_type
+        for start, end, meal_type in self.meal_time_ranges:
+            if start <= minutes < end:
+                return meal_type
+        return self.default_meal_type
+
+    def classify_meals(self, times: Sequence[str], hints: Optional[Sequence[str]] = None) -> List[str]:
+        """여러 식사 시간 분류"""
+        hints = hints or [""] * len(times)
+        return [self.classify_meal(time_text, hint) for time_text, hint in zip(times, hints)]
+
+    def classify_itinerary(self, itinerary: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """일정 전체의 활동 category와 식사 meal_type을 한 번에 채움 (입력 목록을 수정해 반환)"""
+        activities = [activity for day in itinerary for activity in (day.get("activities") or [])]
+        categories = self.classify_activities([activity.get("activity", "") for activity in activities])
+        for activity, category in zip(activities, categories):
+            activity["category"] = category
+
+        meals = [meal for day in itinerary for meal in (day.get("meals") or [])]
+        meal_types = self.classify_meals([meal.get("time", "") for meal in meals], [meal.get("slot", "") for meal in meals])
+        for meal, meal_type in zip(meals, meal_types):
+            meal["meal_type"] = meal_type
+        return itinerary
+
+# 기본 키워드 표로 한 번만 컴파일한 공유 분류기
+default_classifier = ActivityClassifier()
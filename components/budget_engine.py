@@ -0,0 +1,158 @@
+"""
+Budget Engine - 목적지/예산 등급별 비용표로 여행 예산을 계산 (LLM 호출 없음)
+"""
+import os
+import csv
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from components.cost_engine import DEFAULT_FX_BASE, DEFAULT_FX_RATES, FXRates, parse_cost
+from components.text_match import compile_names, normalize_name
+
+COST_TABLE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cost_table.csv")
+DEFAULT_DESTINATION = "기본"
+BUDGET_TIERS = ("저예산", "보통", "고급", "럭셔리")
+DEFAULT_TIER = "보통"
+
+# 비용표 열 → 예산 분류 (숙박은 객실/박 기준, 나머지는 1인/일 기준)
+COST_FIELDS = {
+    "lodging_per_room_night": "숙박",
+    "food_per_person_day": "식비",
+    "transport_per_person_day": "교통",
+    "activities_per_person_day": "액티비티",
+    "misc_per_person_day": "기타",
+}
+# 숙박 유형별 (숙박비 배율, 객실당 인원 - None이면 1인 1침대 요금)
+ACCOMMODATION_SCALING: Dict[str, Tuple[float, Optional[int]]] = {
+    "호텔": (1.0, 2),
+    "리조트": (1.4, 2),
+    "에어비앤비": (0.85, 4),
+    "게스트하우스": (0.55, 2),
+    "호스텔": (0.35, None),
+    "상관없음": (1.0, 2),
+}
+SAVING_TIPS = {
+    "숙박": "게스트하우스나 에어비앤비를 이용하면 숙박비를 크게 줄일 수 있습니다",
+    "식비": "점심 세트 메뉴와 현지 마켓을 활용하세요",
+    "교통": "대중교통 정기권/패스를 이용하세요",
+    "액티비티": "통합 입장권과 무료 입장일을 확인하세요",
+    "기타": "기념품은 공항보다 시내 상점이 저렴합니다",
+}
+
+class CostTable:
+    """목적지 × 예산 등급 비용표 (CSV를 한 번 읽어 (목적지, 등급) 키로 색인)
+
+    목적지 이름과 별칭을 하나의 정규식으로 컴파일해 "파리, 프랑스" 같은 입력에서도
+    한 번의 검색으로 목적지를 찾습니다 (단어 단위로 맞추므로 "Jerome"은 로마가 아님).
+    """
+
+    def __init__(self, rows: List[Dict[str, str]]):
+        self.rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.currencies: Dict[str, str] = {}
+        aliases: Dict[str, str] = {}
+
+        for row in rows:
+            destination = row["destination"].strip()
+            self.rows[(destination, row["tier"].strip())] = {field: float(row[field]) for field in COST_FIELDS}
+            self.currencies[destination] = row["currency"].strip().upper()
+            for alias in [destination] + row.get("aliases", "").split("|"):
+                if alias.strip():
+                    aliases.setdefault(normalize_name(alias), destination)
+
+        self._aliases = aliases
+        self._pattern = compile_names(aliases)
+
+    @classmethod
+    def from_csv(cls, path: str) -> "CostTable":
+        with open(path, encoding="utf-8", newline="") as f:
+            return cls(list(csv.DictReader(f)))
+
+    def match_destination(self, destination: str) -> Optional[str]:
+        """입력 문자열에 단어로 들어 있는 비용표 목적지 (없으면 None)"""
+        match = self._pattern.search(destination or "") if self._pattern else None
+        return self._aliases[normalize_name(match.group("name"))] if match else None
+
+    def lookup(self, destination: str, tier: str) -> Tuple[str, Dict[str, float]]:
+        """(사용한 목적지, 비용 행) 반환 - 목적지가 없으면 기본 행, 등급이 없으면 보통 등급"""
+        key = self.match_destination(destination) or DEFAULT_DESTINATION
+        row = self.rows.get((key, tier)) or self.rows.get((key, DEFAULT_TIER))
+        if row is None:
+            raise KeyError(f"비용표에 '{key}' 항목이 없습니다")
+        return key, row
+
+@lru_cache(maxsize=None)
+def load_cost_table(path: str = COST_TABLE_PATH) -> CostTable:
+    """비용표 로드 (경로별로 프로세스에서 한 번만 읽음)"""
+    return CostTable.from_csv(path)
+
+def resolve_tier(budget_range: str) -> str:
+    """예산 범위 문자열("보통 (50-100만원)")의 등급 이름"""
+    for tier in BUDGET_TIERS:
+        if tier in (budget_range or ""):
+            return tier
+    return DEFAULT_TIER
+
+def estimate_budget(
+    destination: str,
+    duration: int,
+    budget_range: str = "보통 (50-100만원)",
+    group_size: int = 1,
+    accommodation_type: str = "호텔",
+    table: Optional[CostTable] = None,
+    fx_rates: Optional[FXRates] = None
+) -> Dict[str, Any]:
+    """여행 예산 계산 (현지 체류 비용, 항공권 제외)
+
+    예산 범위는 1인 기준으로 보고, 1인 비용을 예산 범위 통화로 환산해 비교합니다.
+    """
+    table = table or load_cost_table()
+    fx_rates = fx_rates or FXRates(DEFAULT_FX_RATES, base=DEFAULT_FX_BASE)
+    duration = max(int(duration), 1)
+    group_size = max(int(group_size), 1)
+    nights = max(duration - 1, 1)
+    tier = resolve_tier(budget_range)
+    matched, row = table.lookup(destination, tier)
+    currency = table.currencies[matched]
+
+    lodging_scale, people_per_room = ACCOMMODATION_SCALING.get(accommodation_type, ACCOMMODATION_SCALING["호텔"])
+    rooms = group_size if people_per_room is None else math.ceil(group_size / people_per_room)
+
+    breakdown = {}
+    for field, category in COST_FIELDS.items():
+        if field == "lodging_per_room_night":
+            breakdown[category] = row[field] * lodging_scale * rooms * nights
+        else:
+            breakdown[category] = row[field] * group_size * duration
+    total = sum(breakdown.values())
+    per_person = total / group_size
+
+    result = {
+        "destination": destination,
+        "matched_destination": matched,
+        "tier": tier,
+        "currency": currency,
+        "duration": duration,
+        "nights": nights,
+        "group_size": group_size,
+        "accommodation_type": accommodation_type,
+        "rooms": rooms,
+        "breakdown": {category: round(amount, 2) for category, amount in breakdown.items()},
+        "total": round(total, 2),
+        "per_person": round(per_person, 2),
+        "saving_tips": [SAVING_TIPS[category] for category, _ in sorted(breakdown.items(), key=lambda item: -item[1])[:2]],
+    }
+
+    budget = parse_cost(budget_range)
+    if budget is not None and budget.currency:
+        per_person_in_budget = fx_rates.convert(per_person, currency, budget.currency)
+        # "이상"이면 상한 없음, "이하"/범위면 상한과 비교
+        upper = math.inf if "이상" in budget_range else budget.high
+        result["budget"] = {
+            "low": budget.low if "이하" not in budget_range else 0.0,
+            "high": None if math.isinf(upper) else upper,
+            "currency": budget.currency,
+            "per_person_estimate": round(per_person_in_budget, 2),
+            "within_budget": bool(per_person_in_budget <= upper),
+        }
+    return result
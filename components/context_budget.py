@@ -0,0 +1,211 @@
+"""
+Context Budget - 프롬프트 입력 토큰을 세고 RAG 컨텍스트/도구 결과를 토큰 예산에 맞춰 줄임
+"""
+import os
+import re
+import hashlib
+import tempfile
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from components.hybrid_retriever import tokenize
+
+DEFAULT_ENCODING = "o200k_base"
+# 거의 같은 청크로 보는 토큰 집합 자카드 유사도
+DUPLICATE_SIMILARITY = 0.8
+TRUNCATION_MARK = "…"
+
+_ASCII_RUN = re.compile(r'[\x21-\x7e]+')
+_NON_ASCII = re.compile(r'[^\x00-\x7f\s]')
+
+def approximate_tokens(text: str) -> int:
+    """tiktoken이 없을 때의 토큰 수 근사 (ASCII는 4자당 1토큰, 한글 등은 글자당 1토큰)"""
+    if not text:
+        return 0
+    ascii_tokens = sum((len(run) + 3) // 4 for run in _ASCII_RUN.findall(text))
+    return ascii_tokens + len(_NON_ASCII.findall(text))
+
+def _encoding_cache_path(encoding: str) -> Optional[str]:
+    """tiktoken이 인코딩 파일을 내려받아 두는 로컬 캐시 경로 (캐시를 끈 경우 None)
+
+    tiktoken.load.read_file_cached와 같은 규칙(TIKTOKEN_CACHE_DIR → DATA_GYM_CACHE_DIR →
+    임시 디렉토리/data-gym-cache, 파일 이름은 원본 URL의 SHA-1)을 따릅니다.
+    """
+    cache_dir = os.environ.get("TIKTOKEN_CACHE_DIR", os.environ.get("DATA_GYM_CACHE_DIR"))
+    if cache_dir is None:
+        cache_dir = os.path.join(tempfile.gettempdir(), "data-gym-cache")
+    if not cache_dir:
+        return None
+    url = f"https://openaipublic.blob.core.windows.net/encodings/{encoding}.tiktoken"
+    return os.path.join(cache_dir, hashlib.sha1(url.encode()).hexdigest())
+
+@lru_cache(maxsize=None)
+def _load_encoding(encoding: str):
+    """tiktoken 인코딩을 프로세스에서 한 번만 로드 (로컬 캐시에 없으면 내려받지 않고 None)"""
+    try:
+        import tiktoken
+    except ImportError:
+        print(f"tiktoken이 설치되지 않아 토큰 수를 근사합니다 ({encoding}).")
+        return None
+
+    cache_path = _encoding_cache_path(encoding)
+    if cache_path is None or not os.path.exists(cache_path):
+        print(f"tiktoken 인코딩 파일이 로컬 캐시에 없어 토큰 수를 근사합니다 ({encoding}).")
+        return None
+    try:
+        return tiktoken.get_encoding(encoding)
+    except Exception as e:
+        print(f"tiktoken 인코딩을 불러올 수 없어 토큰 수를 근사합니다 ({encoding}): {e}")
+        return None
+
+class TokenCounter:
+    """로컬 토크나이저로 토큰 수 계산 (tiktoken이 없거나 인코딩 파일이 로컬에 없으면 근사)
+
+    인코딩은 모듈 수준에서 캐싱하므로 TokenCounter를 여러 번 만들어도 다시 로드하지 않고,
+    네트워크에서 인코딩 파일을 내려받지도 않습니다.
+    """
+
+    def __init__(self, encoding: str = DEFAULT_ENCODING):
+        self.encoding_name = encoding
+        self._encoding = _load_encoding(encoding)
+
+    @property
+    def exact(self) -> bool:
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return approximate_tokens(text)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """max_tokens 이하로 자름 (줄 경계 우선, 한 줄도 안 들어가면 글자 단위, 잘렸으면 … 표시)"""
+        if max_tokens <= 0 or not text:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        limit = max_tokens - self.count(TRUNCATION_MARK)
+
+        kept: List[str] = []
+        used = 0
+        for line in text.split("\n"):
+            cost = self.count(line) + (1 if kept else 0)
+            if used + cost > limit:
+                break
+            kept.append(line)
+            used += cost
+        if kept:
+            return "\n".join(kept).rstrip() + TRUNCATION_MARK
+
+        # 첫 줄부터 예산을 넘으면 글자 수를 이분 탐색
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count(text[:middle]) <= limit:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low].rstrip() + TRUNCATION_MARK if low else ""
+
+def _similarity(left: set, right: set) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+def dedupe_chunks(chunks: Sequence[Any], threshold: float = DUPLICATE_SIMILARITY) -> List[Any]:
+    """관련도 순서를 유지하면서 같은(또는 토큰 집합이 threshold 이상 겹치는) 청크 제거"""
+    kept: List[Any] = []
+    kept_tokens: List[set] = []
+    for chunk in chunks:
+        tokens = set(tokenize(chunk.page_content))
+        if any(_similarity(tokens, other) >= threshold for other in kept_tokens):
+            continue
+        kept.append(chunk)
+        kept_tokens.append(tokens)
+    return kept
+
+class ContextBudget:
+    """직접 만드는 계획 프롬프트의 입력 토큰 예산
+
+    - pack_chunks: 검색된 청크를 중복 제거 후 관련도 순서대로 context_tokens 안에 담음
+      (마지막 청크는 줄 단위로 잘라 넣음)
+    - fit: 고정 지시문을 뺀 나머지 예산을 가변 섹션(RAG 컨텍스트, 도구 결과)에 나눠 프롬프트가
+      max_tokens를 넘지 않게 함
+    max_tokens / context_tokens가 0 이하면 해당 제한을 두지 않습니다.
+
+    fit은 렌더링한 프롬프트 하나에만 적용됩니다. 병렬 모드에서는 종합 호출 1회가 전부이므로
+    호출당 예산이 되지만, ReAct 모드에서는 첫 입력에만 적용되고 이후 반복에 붙는
+    scratchpad(Thought/Action/Observation)는 줄이지 않습니다.
+    """
+
+    def __init__(self, max_tokens: int = 0, context_tokens: int = 0, counter: Optional[TokenCounter] = None):
+        self.max_tokens = max_tokens
+        self.context_tokens = context_tokens
+        self.counter = counter or TokenCounter()
+
+    def count(self, text: str) -> int:
+        return self.counter.count(text)
+
+    def pack_chunks(self, chunks: Sequence[Any], report: Optional[Dict[str, Any]] = None) -> str:
+        """청크 본문을 빈 줄로 이어 붙인 컨텍스트 (report에 rag_tokens_before/after 기록)"""
+        before = sum(self.count(chunk.page_content) for chunk in chunks)
+        pieces: List[str] = []
+        used = 0
+        for chunk in dedupe_chunks(chunks):
+            text = chunk.page_content.strip()
+            cost = self.count(text)
+            if self.context_tokens > 0 and used + cost > self.context_tokens:
+                text = self.counter.truncate(text, self.context_tokens - used)
+                if text:
+                    pieces.append(text)
+                    used += self.count(text)
+                break
+            pieces.append(text)
+            used += cost
+        if report is not None:
+            report["rag_chunks"] = len(pieces)
+            report["rag_tokens_before"] = before
+            report["rag_tokens_after"] = used
+        return "\n\n".join(pieces)
+
+    def fit(self, render: Callable[[Dict[str, str]], str], sections: Dict[str, str],
+            report: Optional[Dict[str, Any]] = None) -> str:
+        """render(sections)가 max_tokens 이하가 되도록 sections 값을 줄여 렌더링
+
+        고정 부분(모든 섹션을 비운 렌더링 결과)을 먼저 빼고, 남은 예산을 섹션에 균등하게 나누되
+        짧은 섹션이 남긴 몫은 긴 섹션이 쓰게 합니다. 고정 부분만으로 예산을 넘으면 섹션을 모두
+        비우고 경고하며, 넘은 토큰 수를 report의 over_budget_tokens에 기록합니다.
+        """
+        prompt = render(sections)
+        tokens = self.count(prompt)
+        trimmed = 0
+        if self.max_tokens > 0 and tokens > self.max_tokens:
+            fixed = self.count(render({name: "" for name in sections}))
+            if fixed > self.max_tokens:
+                print(f"경고: 프롬프트의 고정 부분({fixed}토큰)만으로 입력 토큰 예산({self.max_tokens})을 넘습니다.")
+            remaining = max(0, self.max_tokens - fixed)
+            costs = {name: self.count(text) for name, text in sections.items()}
+            fitted = dict(sections)
+            pending = sorted(sections, key=lambda name: costs[name])
+            while pending:
+                share = remaining // len(pending)
+                name = pending.pop(0)
+                fitted[name] = sections[name] if costs[name] <= share else self.counter.truncate(sections[name], share)
+                remaining -= self.count(fitted[name])
+            prompt = render(fitted)
+            new_tokens = self.count(prompt)
+            trimmed = tokens - new_tokens
+            tokens = new_tokens
+            print(f"프롬프트가 입력 토큰 예산({self.max_tokens})을 넘어 {trimmed}토큰을 줄였습니다.")
+        if report is not None:
+            report["prompt_tokens"] = tokens
+            report["trimmed_tokens"] = report.get("trimmed_tokens", 0) + trimmed
+            if self.max_tokens > 0 and tokens > self.max_tokens:
+                report["over_budget_tokens"] = tokens - self.max_tokens
+        return prompt
+
+def saved_tokens(report: Dict[str, Any]) -> int:
+    """요청 하나에서 줄인 입력 토큰 수 (RAG 중복 제거/자르기 + 예산 초과분 자르기)"""
+    return (report.get("rag_tokens_before", 0) - report.get("rag_tokens_after", 0)) + report.get("trimmed_tokens", 0)
@@ -0,0 +1,225 @@
+"""
+Cost Engine - 일정의 비용 문자열을 통화별 금액으로 파싱하고 환율표(로컬 캐시)로 환산
+"""
+import os
+import re
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+# 통화 기호/코드/단어 → ISO 코드
+CURRENCY_ALIASES = {
+    "€": "EUR", "eur": "EUR", "유로": "EUR",
+    "$": "USD", "usd": "USD", "달러": "USD",
+    "£": "GBP", "gbp": "GBP", "파운드": "GBP",
+    "¥": "JPY", "jpy": "JPY", "엔": "JPY", "円": "JPY",
+    "₩": "KRW", "krw": "KRW", "원": "KRW",
+    "cny": "CNY", "위안": "CNY",
+    "฿": "THB", "thb": "THB", "바트": "THB",
+}
+# 금액 뒤에 붙는 배수 단위 ("50-100만원", "€15k")
+AMOUNT_UNITS = {"만": 10000, "천": 1000, "k": 1000}
+FREE_WORDS = ("무료", "free")
+# 통화 표시 없는 숫자를 금액으로 보는 앞말 ("입장료 40", "약 30")
+COST_CONTEXT_WORDS = ("비용", "가격", "요금", "예산", "입장료", "금액", "인당", "약", "cost", "price", "fee", "budget")
+# 금액 표시 주변에 있어도 되는 말 ("약 40", "40 정도")
+_APPROX_WORDS = re.compile(r'약|정도|내외|approx\.?|about', re.IGNORECASE)
+
+# 1 통화 단위당 기준 통화(KRW) 금액 - 환율 캐시와 원격 조회가 모두 없을 때 사용하는 근사값
+DEFAULT_FX_BASE = "KRW"
+DEFAULT_FX_RATES = {
+    "KRW": 1.0,
+    "EUR": 1450.0,
+    "USD": 1350.0,
+    "GBP": 1700.0,
+    "JPY": 9.0,
+    "CNY": 185.0,
+    "THB": 38.0,
+}
+
+_SYMBOL = r'[€$£¥₩฿]'
+_CODE = r'EUR|USD|GBP|JPY|KRW|CNY|THB'
+_WORD = r'원|유로|달러|엔|円|파운드|위안|바트'
+_NUMBER = r'\d[\d,]*(?:\.\d+)?'
+# 배수 단위 ("50 만원"은 띄어 써도 되고, "15k"는 붙여 쓴 k만 - "15 km"는 제외)
+_UNIT = r'\s*[만천]|[kK](?![a-zA-Z])'
+_MONEY = re.compile(
+    rf'(?P<prefix>{_SYMBOL}|(?:{_CODE})(?=\s?\d))?\s*(?P<low>{_NUMBER})(?P<low_unit>{_UNIT})?'
+    rf'(?:\s*[-~–〜]\s*{_SYMBOL}?\s*(?P<high>{_NUMBER})(?P<high_unit>{_UNIT})?)?'
+    rf'\s*(?P<suffix>{_WORD}|{_CODE})?',
+    re.IGNORECASE
+)
+# 숫자 바로 뒤에 붙은 다른 단위 ("12시", "2인", "3일", "12:00", "5km")
+_OTHER_UNIT = re.compile(r'[^\W\d_]|[:/.]\d')
+
+class CostAmount:
+    """비용 하나 (범위는 low~high, 단일 금액은 low == high, 통화를 모르면 currency None)"""
+
+    __slots__ = ("low", "high", "currency")
+
+    def __init__(self, low: float, high: float, currency: Optional[str]):
+        self.low = low
+        self.high = high
+        self.currency = currency
+
+    @property
+    def mid(self) -> float:
+        return (self.low + self.high) / 2
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, CostAmount) and (self.low, self.high, self.currency) == (other.low, other.high, other.currency)
+
+    def __repr__(self) -> str:
+        return f"CostAmount({self.low!r}, {self.high!r}, {self.currency!r})"
+
+def _number(text: str) -> float:
+    return float(text.replace(",", ""))
+
+def _unit(text: Optional[str]) -> Optional[str]:
+    return text.strip().lower() if text else None
+
+def _in_cost_context(text: str, match: "re.Match") -> bool:
+    """통화 표시 없는 숫자가 금액인지 (값 전체가 금액이거나 비용을 뜻하는 말 뒤에 있고, 다른 단위가 붙지 않음)"""
+    start, end = match.start(), match.start() + len(match.group(0).rstrip())
+    if _OTHER_UNIT.match(text, end) or (start and text[start - 1] in ":/"):
+        return False
+    before, after = text[:start], text[end:]
+    if not re.search(r'[^\W_]', _APPROX_WORDS.sub("", before + after)):
+        return True
+    before = before.lower()
+    return any(word in before for word in COST_CONTEXT_WORDS)
+
+def parse_cost(text: Any, default_currency: Optional[str] = None) -> Optional[CostAmount]:
+    """비용 문자열 파싱 ("€25-35", "₩1,500,000", "50-100만원", "15k", "무료" 등)
+
+    통화가 붙은 첫 금액을 우선 사용하고, 통화가 있는 금액이 없으면 금액으로 볼 수 있는
+    첫 숫자(값 전체가 숫자이거나 "입장료 40"처럼 비용을 뜻하는 말 뒤의 숫자, "12시"/"2인"은 제외)를
+    default_currency로 봅니다. 금액이 없으면 None ("무료"는 0)을 반환합니다.
+    """
+    text = str(text or "")
+    fallback = None
+    for match in _MONEY.finditer(text):
+        marker = match.group("prefix") or match.group("suffix")
+        if not marker and (fallback is not None or not _in_cost_context(text, match)):
+            continue
+
+        low, high = _number(match.group("low")), _number(match.group("high") or match.group("low"))
+        low_unit, high_unit = _unit(match.group("low_unit")), _unit(match.group("high_unit"))
+        if match.group("high") is None:
+            high_unit = low_unit
+        # "50-100만원"처럼 단위가 뒤에만 있으면 양쪽에 적용
+        low *= AMOUNT_UNITS.get(low_unit or high_unit, 1)
+        high *= AMOUNT_UNITS.get(high_unit or low_unit, 1)
+        if high < low:
+            low, high = high, low
+
+        if marker:
+            return CostAmount(low, high, CURRENCY_ALIASES[marker.strip().lower()])
+        fallback = CostAmount(low, high, default_currency)
+
+    if fallback is not None:
+        return fallback
+    if any(word in text.lower() for word in FREE_WORDS):
+        return CostAmount(0.0, 0.0, None)
+    return None
+
+class FXRates:
+    """통화별 환율표 (rates[통화] = 1 통화 단위의 기준 통화 금액)"""
+
+    def __init__(self, rates: Dict[str, float], base: str = DEFAULT_FX_BASE, fetched_at: Optional[float] = None):
+        self.base = base
+        self.rates = {code.upper(): float(rate) for code, rate in rates.items()}
+        self.rates[base] = 1.0
+        self.fetched_at = fetched_at
+
+    def rate(self, from_currency: Optional[str], to_currency: str) -> float:
+        """from → to 환산 배율 (통화가 없거나 모르는 통화면 NaN)"""
+        if from_currency == to_currency:
+            return 1.0
+        source, target = self.rates.get(from_currency), self.rates.get(to_currency)
+        if source is None or target is None:
+            return float("nan")
+        return source / target
+
+    def convert(self, amount: float, from_currency: Optional[str], to_currency: str) -> float:
+        return amount * self.rate(from_currency, to_currency)
+
+    def rate_vector(self, currencies: Iterable[Optional[str]], to_currency: str) -> np.ndarray:
+        """통화 열 전체의 환산 배율 배열 (통화 종류별로 한 번만 계산)"""
+        currencies = list(currencies)
+        cache: Dict[Optional[str], float] = {}
+        for currency in set(currencies):
+            cache[currency] = self.rate(currency, to_currency)
+        return np.fromiter((cache[currency] for currency in currencies), dtype=np.float64, count=len(currencies))
+
+    def rebase(self, base: str) -> "FXRates":
+        """기준 통화를 바꾼 환율표 (base 환율이 없으면 그대로 반환)"""
+        if base == self.base or base not in self.rates:
+            return self
+        factor = self.rates[base]
+        return FXRates({code: rate / factor for code, rate in self.rates.items()}, base=base, fetched_at=self.fetched_at)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"base": self.base, "rates": self.rates, "fetched_at": self.fetched_at}
+
+    @classmethod
+    def load(
+        cls,
+        cache_path: str,
+        ttl_seconds: int = 86400,
+        url: Optional[str] = None,
+        base: str = DEFAULT_FX_BASE,
+        fetcher: Optional[Callable[[str], Dict[str, Any]]] = None
+    ) -> "FXRates":
+        """로컬 캐시 파일에서 환율표 로드
+
+        캐시가 없거나 ttl_seconds보다 오래되었고 url이 설정되어 있으면 다시 조회해
+        캐시를 갱신합니다. 조회에 실패하면 오래된 캐시, 그마저 없으면 기본 근사값을 사용합니다.
+        url 응답은 {"rates": {통화: 1 기준 통화당 금액}} 형식이어야 합니다.
+        """
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            cached = cached.rebase(base)
+            if time.time() - (cached.fetched_at or 0) < ttl_seconds:
+                return cached
+
+        if url:
+            try:
+                payload = (fetcher or _fetch_json)(url)
+                rates = {code: 1 / float(rate) for code, rate in payload["rates"].items() if float(rate) > 0}
+                fresh = cls(rates, base=base, fetched_at=time.time())
+                _write_cache(cache_path, fresh)
+                print(f"환율표 갱신: {len(fresh.rates)}개 통화")
+                return fresh
+            except Exception as e:
+                print(f"환율 조회 실패: {e}")
+
+        if cached is not None:
+            return cached
+        return cls(DEFAULT_FX_RATES, base=DEFAULT_FX_BASE).rebase(base)
+
+def _fetch_json(url: str) -> Dict[str, Any]:
+    import httpx
+
+    response = httpx.get(url, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+def _read_cache(cache_path: str) -> Optional[FXRates]:
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        return FXRates(data["rates"], base=data["base"], fetched_at=data.get("fetched_at"))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _write_cache(cache_path: str, rates: FXRates):
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(rates.to_dict(), f, ensure_ascii=False)
+    os.replace(temp_path, cache_path)
@@ -0,0 +1,201 @@
+"""
+Embedding Service - 임베딩 요청을 배치/병렬 처리하고 텍스트 해시 → 벡터를 디스크에 캐싱
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+# 재시도할 오류: 속도 제한(429), 요청 시간 초과(408), 서버 오류(5xx), 연결/시간 초과 예외
+RETRYABLE_STATUS_CODES = (408, 429)
+RETRYABLE_ERROR_NAMES = ("RateLimitError", "APITimeoutError", "APIConnectionError", "Timeout")
+
+def _status_code(error: Exception) -> Optional[int]:
+    """openai.APIStatusError(status_code) / httpx.HTTPStatusError(response.status_code)의 HTTP 상태 코드"""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+def is_retryable_error(error: Exception) -> bool:
+    """일시적 오류인지 판단 (인증 실패/잘못된 요청 등 4xx는 재시도해도 같은 결과)"""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    return any(name in cls.__name__ for cls in type(error).__mro__ for name in RETRYABLE_ERROR_NAMES)
+
+def _as_float32(vector: List[float]) -> List[float]:
+    """캐시 저장 형식(float32)과 같은 정밀도로 변환"""
+    return array("f", vector).tolist()
+
+class CachedEmbeddings(Embeddings):
+    """임베딩 모델 래퍼
+
+    - embed_documents: 캐시에 없는 텍스트만 모아 batch_size 단위로 나누고,
+      최대 max_workers개 배치를 동시에 요청 (일시적 오류만 지수 백오프로 재시도, 일부 배치가
+      실패해도 성공한 배치는 캐시에 저장한 뒤 오류를 다시 발생)
+    - embed_query: 메모리 LRU → SQLite 캐시 → API 순서로 조회
+    - 캐시 키는 모델 이름 + 용도(query/document) + 텍스트의 SHA-256
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        cache_path: str,
+        model_key: str = "",
+        batch_size: int = 256,
+        max_workers: int = 4,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        memory_cache_size: int = 1024
+    ):
+        self.base = base
+        self.cache_path = cache_path
+        self.model_key = model_key
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.memory_cache_size = memory_cache_size
+
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self.api_calls = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.cache_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _key(self, kind: str, text: str) -> str:
+        return hashlib.sha256(f"{self.model_key}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    # 캐시 입출력
+    def _load(self, keys: List[str]) -> Dict[str, List[float]]:
+        """SQLite 캐시에서 여러 벡터를 한 번에 조회"""
+        found = {}
+        with self._connect() as conn:
+            # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+            for start in range(0, len(keys), 500):
+                part = keys[start:start + 500]
+                placeholders = ",".join("?" * len(part))
+                for key, blob in conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", part
+                ):
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+        return found
+
+    def _store(self, vectors: Dict[str, List[float]]):
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("f", vector).tobytes()) for key, vector in vectors.items()]
+            )
+
+    def _remember(self, key: str, vector: List[float]):
+        with self._memory_lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_cache_size:
+                self._memory.popitem(last=False)
+
+    def _recall(self, key: str) -> Optional[List[float]]:
+        with self._memory_lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+            return vector
+
+    # API 호출
+    def _with_retry(self, func, *args):
+        """일시적 오류(속도 제한, 시간 초과, 5xx)만 지수 백오프로 재시도"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._memory_lock:
+                    self.api_calls += 1
+                return func(*args)
+            except Exception as e:
+                if attempt == self.max_retries or not is_retryable_error(e):
+                    raise
+                delay = self.retry_base_delay * (2 ** attempt)
+                print(f"임베딩 요청 실패 ({e}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """문서 임베딩 (캐시에 없는 텍스트만 배치로 요청)"""
+        keys = [self._key("document", text) for text in texts]
+        vectors = self._load(list(set(keys)))
+
+        # 중복 제거 후 캐시에 없는 텍스트만 요청
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        if missing:
+            missing_keys = list(missing)
+            batches = [missing_keys[i:i + self.batch_size] for i in range(0, len(missing_keys), self.batch_size)]
+            print(f"임베딩 요청: {len(missing_keys)}개 텍스트, {len(batches)}개 배치 (캐시 적중 {len(set(keys)) - len(missing_keys)}개)")
+
+            def embed_batch(batch_keys):
+                return self._with_retry(self.base.embed_documents, [missing[key] for key in batch_keys])
+
+            computed = {}
+            errors = []
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                futures = {executor.submit(embed_batch, batch_keys): batch_keys for batch_keys in batches}
+                for future in as_completed(futures):
+                    try:
+                        batch_vectors = future.result()
+                    except Exception as e:
+                        errors.append(e)
+                        continue
+                    # 캐시에서 읽은 값과 동일하도록 float32 정밀도로 맞춤
+                    computed.update((key, _as_float32(vector)) for key, vector in zip(futures[future], batch_vectors))
+
+            # 일부 배치가 실패해도 이미 받은 벡터는 저장해 다음 호출에서 다시 요청하지 않음
+            if computed:
+                self._store(computed)
+            if errors:
+                print(f"임베딩 배치 {len(errors)}/{len(batches)}개 실패 (성공한 {len(computed)}개 벡터는 캐시에 저장)")
+                raise errors[0]
+            vectors.update(computed)
+
+        return [vectors[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        """검색 질의 임베딩 (반복되는 질의는 API를 호출하지 않음)"""
+        key = self._key("query", text)
+
+        vector = self._recall(key)
+        if vector is not None:
+            return vector
+
+        vector = self._load([key]).get(key)
+        if vector is None:
+            vector = _as_float32(self._with_retry(self.base.embed_query, text))
+            self._store({key: vector})
+
+        self._remember(key, vector)
+        return vector
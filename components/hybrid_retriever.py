@@ -0,0 +1,280 @@
+"""
+Hybrid Retriever - BM25 역색인과 벡터 검색 결과를 RRF로 합치고 선택적으로 재순위화
+"""
+import os
+import re
+import json
+import math
+import hashlib
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from components.text_match import mentions
+
+BM25_INDEX_VERSION = 1
+RRF_K = 60
+
+_WORD = re.compile(r'[^\W_]+')
+_HANGUL = re.compile(r'[가-힣]+')
+
+def tokenize(text: str) -> List[str]:
+    """검색용 토큰화 - 한글은 음절 바이그램("파리의" → 파리, 리의), 그 외는 소문자 단어
+
+    조사가 붙은 도시/장소 이름도 형태소 분석기 없이 맞출 수 있습니다.
+    """
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        for part in re.split(r'([가-힣]+)', word):
+            if not part:
+                continue
+            if _HANGUL.fullmatch(part) and len(part) > 1:
+                tokens.extend(part[i:i + 2] for i in range(len(part) - 1))
+            else:
+                tokens.append(part)
+    return tokens
+
+class RetrievedChunk:
+    """검색 결과 청크 (vectorstore Document와 같은 page_content/metadata 속성)"""
+
+    __slots__ = ("id", "page_content", "metadata", "score")
+
+    def __init__(self, chunk_id: str, page_content: str, metadata: Dict[str, Any], score: float = 0.0):
+        self.id = chunk_id
+        self.page_content = page_content
+        self.metadata = metadata
+        self.score = score
+
+    def __repr__(self) -> str:
+        return f"RetrievedChunk(id={self.id!r}, score={self.score:.4f})"
+
+def chunk_id_of(document: Any) -> str:
+    """청크 ID (수집 시 넣은 chunk_hash, 없으면 본문 해시)"""
+    metadata = getattr(document, "metadata", None) or {}
+    return metadata.get("chunk_hash") or hashlib.sha256(document.page_content.encode("utf-8")).hexdigest()
+
+class BM25Index:
+    """청크 본문의 BM25 역색인
+
+    용어별 (청크 번호 배열, 빈도 배열) 게시 목록을 두고, 질의 용어의 점수를 NumPy로
+    한 번에 더합니다. 메타데이터 필터는 점수 계산 전에 청크 마스크로 적용합니다.
+    """
+
+    def __init__(self, ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]],
+                 k1: float = 1.5, b: float = 0.75, token_lists: Optional[List[List[str]]] = None):
+        self.ids = ids
+        self.texts = texts
+        self.metadatas = metadatas
+        self.k1 = k1
+        self.b = b
+        token_lists = token_lists if token_lists is not None else [tokenize(text) for text in texts]
+
+        self.doc_lengths = np.array([len(tokens) for tokens in token_lists], dtype=np.float64)
+        self.avg_length = float(self.doc_lengths.mean()) if len(ids) else 0.0
+        postings: Dict[str, Dict[int, int]] = {}
+        for doc, tokens in enumerate(token_lists):
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[doc] = counts.get(doc, 0) + 1
+        self.postings = {
+            term: (np.fromiter(counts.keys(), dtype=np.int64, count=len(counts)),
+                   np.fromiter(counts.values(), dtype=np.float64, count=len(counts)))
+            for term, counts in postings.items()
+        }
+        self._token_lists = token_lists
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Any], **kwargs) -> "BM25Index":
+        """page_content/metadata를 가진 문서(청크) 목록으로 색인 생성"""
+        ids, texts, metadatas = [], [], []
+        for document in documents:
+            ids.append(chunk_id_of(document))
+            texts.append(document.page_content)
+            metadatas.append(dict(document.metadata or {}))
+        return cls(ids, texts, metadatas, **kwargs)
+
+    def metadata_values(self, key: str) -> List[str]:
+        """메타데이터 key의 서로 다른 값 (도시/국가 필터 후보)"""
+        return sorted({str(metadata[key]) for metadata in self.metadatas if metadata.get(key)})
+
+    def _mask(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        if not filters:
+            return None
+        mask = np.ones(len(self.ids), dtype=bool)
+        for key, value in filters.items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            mask &= np.array([metadata.get(key) in values for metadata in self.metadatas], dtype=bool)
+        return mask
+
+    def scores(self, query: str, filters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """질의에 대한 모든 청크의 BM25 점수 (필터에 맞지 않는 청크는 -inf)"""
+        scores = np.zeros(len(self.ids))
+        n = len(self.ids)
+        norm = self.k1 * (1 - self.b + self.b * self.doc_lengths / (self.avg_length or 1.0))
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            docs, tf = posting
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores[docs] += idf * tf * (self.k1 + 1) / (tf + norm[docs])
+        mask = self._mask(filters)
+        if mask is not None:
+            scores[~mask] = -np.inf
+        return scores
+
+    def search(self, query: str, k: int = 10, filters: Optional[Dict[str, Any]] = None) -> List[RetrievedChunk]:
+        """점수 상위 k개 청크 (점수 0 이하는 제외)"""
+        scores = self.scores(query, filters)
+        if not len(scores):
+            return []
+        top = np.argpartition(-scores, min(k, len(scores)) - 1)[:k] if len(scores) > k else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            RetrievedChunk(self.ids[doc], self.texts[doc], self.metadatas[doc], float(scores[doc]))
+            for doc in top if scores[doc] > 0
+        ]
+
+    def save(self, path: str):
+        """색인 저장 (토큰화 결과 포함, 임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        payload = {
+            "version": BM25_INDEX_VERSION,
+            "k1": self.k1,
+            "b": self.b,
+            "chunks": [
+                {"id": chunk_id, "text": text, "metadata": metadata, "tokens": tokens}
+                for chunk_id, text, metadata, tokens in zip(self.ids, self.texts, self.metadatas, self._token_lists)
+            ],
+        }
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["BM25Index"]:
+        """저장된 색인 로드 (없거나 버전이 다르면 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"BM25 색인 로드 실패: {e}")
+            return None
+        if payload.get("version") != BM25_INDEX_VERSION:
+            return None
+        chunks = payload["chunks"]
+        return cls(
+            [chunk["id"] for chunk in chunks], [chunk["text"] for chunk in chunks],
+            [chunk["metadata"] for chunk in chunks], k1=payload["k1"], b=payload["b"],
+            token_lists=[chunk["tokens"] for chunk in chunks]
+        )
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = RRF_K) -> List[Tuple[str, float]]:
+    """여러 순위 목록을 RRF(1 / (k + 순위))로 합친 (id, 점수) 목록"""
+    fused: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, chunk_id in enumerate(ranking, 1):
+            fused[chunk_id] = fused.get(chunk_id, 0.0) + 1.0 / (k + rank)
+    return sorted(fused.items(), key=lambda item: -item[1])
+
+class CrossEncoderReranker:
+    """로컬 cross-encoder 재순위화 (sentence-transformers가 없으면 비활성화)"""
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+        self._model = None
+        try:
+            from sentence_transformers import CrossEncoder
+            self._model = CrossEncoder(model_name)
+        except Exception as e:
+            print(f"재순위화 모델을 사용할 수 없습니다 ({model_name}): {e}")
+
+    @property
+    def available(self) -> bool:
+        return self._model is not None
+
+    def rerank(self, query: str, chunks: List[RetrievedChunk]) -> List[RetrievedChunk]:
+        if not self.available or not chunks:
+            return chunks
+        scores = self._model.predict([(query, chunk.page_content) for chunk in chunks])
+        for chunk, score in zip(chunks, scores):
+            chunk.score = float(score)
+        return sorted(chunks, key=lambda chunk: -chunk.score)
+
+def _chroma_filter(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """{키: 값} 필터를 Chroma where 형식으로 변환 (여러 키는 $and, 값 목록은 $in)"""
+    if not filters:
+        return None
+    clauses = [
+        {key: {"$in": list(value)} if isinstance(value, (list, tuple, set)) else value}
+        for key, value in filters.items()
+    ]
+    return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
+class HybridRetriever:
+    """BM25 + 벡터 검색 하이브리드 검색기
+
+    두 검색기에서 후보를 candidates개씩 가져와 RRF로 합치고, 재순위화 모델이 있으면 상위
+    후보만 다시 정렬합니다. 한쪽만 있어도 동작합니다 (API 키가 없으면 BM25만 사용).
+    """
+
+    def __init__(self, vectorstore: Any = None, bm25_index: Optional[BM25Index] = None,
+                 reranker: Optional[CrossEncoderReranker] = None, candidates: int = 20):
+        self.vectorstore = vectorstore
+        self.bm25_index = bm25_index
+        self.reranker = reranker
+        self.candidates = candidates
+
+    @property
+    def available(self) -> bool:
+        return self.vectorstore is not None or (self.bm25_index is not None and len(self.bm25_index) > 0)
+
+    def destination_filters(self, destination: str) -> Optional[Dict[str, Any]]:
+        """목적지 문자열에 색인된 도시(한글/별칭)·국가 이름이 있으면 메타데이터 필터 반환 (도시 우선)"""
+        if self.bm25_index is None or not destination:
+            return None
+        for key in ("city", "city_alias", "country"):
+            matches = [value for value in self.bm25_index.metadata_values(key) if mentions(destination, value)]
+            if matches:
+                return {key: matches}
+        return None
+
+    def retrieve(self, query: str, k: int = 3, filters: Optional[Dict[str, Any]] = None) -> List[RetrievedChunk]:
+        rankings: List[List[str]] = []
+        chunks: Dict[str, RetrievedChunk] = {}
+
+        if self.bm25_index is not None:
+            lexical = self.bm25_index.search(query, self.candidates, filters)
+            rankings.append([chunk.id for chunk in lexical])
+            chunks.update((chunk.id, chunk) for chunk in lexical)
+
+        if self.vectorstore is not None:
+            try:
+                documents = self.vectorstore.similarity_search(query, k=self.candidates, filter=_chroma_filter(filters))
+            except Exception as e:
+                print(f"벡터 검색 실패, BM25 결과만 사용합니다: {e}")
+                documents = []
+            ranking = []
+            for document in documents:
+                chunk_id = chunk_id_of(document)
+                ranking.append(chunk_id)
+                chunks.setdefault(chunk_id, RetrievedChunk(chunk_id, document.page_content, dict(document.metadata or {})))
+            rankings.append(ranking)
+
+        fused = []
+        for chunk_id, score in reciprocal_rank_fusion(rankings):
+            chunk = chunks[chunk_id]
+            chunk.score = score
+            fused.append(chunk)
+
+        if self.reranker is not None and self.reranker.available:
+            fused = self.reranker.rerank(query, fused[:max(k * 3, k)])
+        return fused[:k]
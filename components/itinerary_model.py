@@ -0,0 +1,177 @@
+"""
+Itinerary Model - 일정의 활동/식사/숙박을 열(column) 단위로 보관하는 경량 모델과 DataFrame 변환
+"""
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from components.activity_classifier import parse_time_range
+from components.cost_engine import FXRates, parse_cost
+
+ACTIVITY_COLUMNS = ("day", "time", "activity", "location", "description", "cost", "transportation", "category")
+MEAL_COLUMNS = ("day", "time", "restaurant", "cuisine", "cost", "notes", "meal_type")
+ACCOMMODATION_COLUMNS = ("day", "name", "type", "cost", "notes")
+COLUMN_DEFAULTS = {"category": "기타", "meal_type": "간식"}
+# 문자열 열에서 파생되는 열 (숫자 값이 없으면 NaN, 통화를 모르면 "")
+NUMERIC_COLUMNS = ("start_minute", "end_minute", "cost_low", "cost_high", "currency")
+ITEM_KINDS = ("activities", "meals", "accommodation")
+# 비용 집계에 쓰는 항목 종류별 예산 분류
+COST_CATEGORIES = {"accommodation": "숙박", "meals": "식비", "activities": "활동"}
+
+class _Record:
+    """열 하나의 값을 속성으로 읽는 행 (__slots__로 dict 없이 보관)"""
+
+    __slots__ = ()
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+class ActivityRecord(_Record):
+    __slots__ = ACTIVITY_COLUMNS + NUMERIC_COLUMNS
+
+class MealRecord(_Record):
+    __slots__ = MEAL_COLUMNS + NUMERIC_COLUMNS
+
+class AccommodationRecord(_Record):
+    __slots__ = ACCOMMODATION_COLUMNS + NUMERIC_COLUMNS
+
+RECORD_CLASSES = {"activities": ActivityRecord, "meals": MealRecord, "accommodation": AccommodationRecord}
+
+class ItineraryTable:
+    """일정 전체의 활동/식사/숙박을 열 단위 배열로 보관하는 표
+
+    from_itinerary가 처리된 일정(dict 목록)을 한 번만 순회해 문자열 열과
+    숫자 열(시작/끝 분, 비용 범위)을 만들고, 요약·차트·비용 집계·DataFrame은 모두 이 열에서 계산합니다.
+    숫자 열은 NumPy 배열이므로 to_frame은 복사 없이 DataFrame을 만듭니다.
+    """
+
+    def __init__(self, days: Sequence[int], activities: Dict[str, Any], meals: Dict[str, Any], accommodation: Dict[str, Any]):
+        self.days = np.asarray(days, dtype=np.int32)
+        self.activities = activities
+        self.meals = meals
+        self.accommodation = accommodation
+        self._summary: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_itinerary(cls, itinerary: List[Dict[str, Any]]) -> "ItineraryTable":
+        days: List[int] = []
+        columns = {
+            "activities": {name: [] for name in ACTIVITY_COLUMNS},
+            "meals": {name: [] for name in MEAL_COLUMNS},
+            "accommodation": {name: [] for name in ACCOMMODATION_COLUMNS},
+        }
+
+        for index, day_data in enumerate(itinerary):
+            day = max(int(day_data.get("day") or index + 1), 0)
+            days.append(day)
+            for kind in ITEM_KINDS:
+                kind_columns = columns[kind]
+                items = day_data.get(kind) or []
+                for item in ([items] if isinstance(items, dict) else items):
+                    kind_columns["day"].append(day)
+                    for name, values in kind_columns.items():
+                        if name != "day":
+                            values.append(item.get(name) or COLUMN_DEFAULTS.get(name, ""))
+
+        return cls(days, *(cls._with_numeric(columns[kind]) for kind in ITEM_KINDS))
+
+    @staticmethod
+    def _with_numeric(columns: Dict[str, List[Any]]) -> Dict[str, Any]:
+        times = [parse_time_range(time_text) for time_text in columns.get("time", [""] * len(columns["day"]))]
+        costs = [parse_cost(cost) for cost in columns["cost"]]
+        columns["day"] = np.asarray(columns["day"], dtype=np.int32)
+        columns["start_minute"] = np.array([np.nan if start is None else start for start, _ in times], dtype=np.float64)
+        columns["end_minute"] = np.array([np.nan if end is None else end for _, end in times], dtype=np.float64)
+        columns["cost_low"] = np.array([np.nan if cost is None else cost.low for cost in costs], dtype=np.float64)
+        columns["cost_high"] = np.array([np.nan if cost is None else cost.high for cost in costs], dtype=np.float64)
+        columns["currency"] = [cost.currency or "" if cost else "" for cost in costs]
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def _columns(self, kind: str) -> Dict[str, Any]:
+        if kind not in ITEM_KINDS:
+            raise ValueError(f"알 수 없는 항목 종류: {kind}")
+        return getattr(self, kind)
+
+    def records(self, kind: str = "activities") -> Iterator[_Record]:
+        """행 단위 접근 (ActivityRecord / MealRecord / AccommodationRecord)"""
+        record_cls = RECORD_CLASSES[kind]
+        columns = self._columns(kind)
+        yield from (record_cls(*row) for row in zip(*(columns[name] for name in record_cls.__slots__)))
+
+    def to_frame(self, kind: str = "activities") -> pd.DataFrame:
+        """활동/식사/숙박 열을 DataFrame으로 변환 (숫자 열은 복사하지 않음)"""
+        return pd.DataFrame(self._columns(kind), copy=False)
+
+    def counts_per_day(self, kind: str = "activities") -> np.ndarray:
+        """days 순서와 같은 일자별 항목 수"""
+        return self._per_day(self._columns(kind)["day"])
+
+    def _per_day(self, item_days: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """항목별 일차(와 가중치)를 days 순서의 일자별 합계로 변환"""
+        if not len(self.days):
+            return np.zeros(0, dtype=np.int64 if weights is None else np.float64)
+        size = int(max(self.days.max(), item_days.max() if len(item_days) else 0)) + 1
+        return np.bincount(item_days, weights=weights, minlength=size)[self.days]
+
+    def summary(self) -> Dict[str, Any]:
+        """일정 요약 (한 번 계산 후 재사용)"""
+        if self._summary is None:
+            categories, counts = np.unique(np.asarray(self.activities["category"], dtype=str), return_counts=True)
+            order = np.argsort(-counts, kind="stable")
+            self._summary = {
+                "total_days": len(self.days),
+                "total_activities": len(self.activities["day"]),
+                "total_meals": len(self.meals["day"]),
+                "activities_per_day": self.counts_per_day("activities").tolist(),
+                "meals_per_day": self.counts_per_day("meals").tolist(),
+                "category_counts": {str(categories[i]): int(counts[i]) for i in order},
+            }
+        return self._summary
+
+    def cost_summary(self, fx_rates: FXRates, currency: Optional[str] = None) -> Dict[str, Any]:
+        """모든 항목의 비용을 currency(기본: 환율표 기준 통화)로 환산해 일자별/분류별/전체 합계를 한 번에 계산
+
+        범위 비용은 low/high를 따로 합산하며, 금액이나 통화를 알 수 없는 항목은 합계에서
+        제외하고 unpriced 개수로 알려줍니다.
+        """
+        currency = currency or fx_rates.base
+        columns = [self._columns(kind) for kind in ITEM_KINDS]
+        item_days = np.concatenate([kind_columns["day"] for kind_columns in columns])
+        kind_index = np.repeat(np.arange(len(ITEM_KINDS)), [len(kind_columns["day"]) for kind_columns in columns])
+        factors = fx_rates.rate_vector([code for kind_columns in columns for code in kind_columns["currency"]], currency)
+        low = np.concatenate([kind_columns["cost_low"] for kind_columns in columns])
+        high = np.concatenate([kind_columns["cost_high"] for kind_columns in columns])
+        # 무료(0)는 통화와 관계없이 0, 그 밖에 통화를 모르는 금액은 NaN이 되어 합계에서 제외
+        low = np.where(low == 0, 0.0, low * factors)
+        high = np.where(high == 0, 0.0, high * factors)
+
+        priced = ~np.isnan(low)
+        low, high = np.where(priced, low, 0.0), np.where(priced, high, 0.0)
+        per_day_low, per_day_high = self._per_day(item_days, low), self._per_day(item_days, high)
+        per_kind_low = np.bincount(kind_index, weights=low, minlength=len(ITEM_KINDS))
+        per_kind_high = np.bincount(kind_index, weights=high, minlength=len(ITEM_KINDS))
+
+        return {
+            "currency": currency,
+            "total": {"low": round(float(low.sum()), 2), "high": round(float(high.sum()), 2)},
+            "by_category": {
+                COST_CATEGORIES[kind]: {"low": round(float(per_kind_low[i]), 2), "high": round(float(per_kind_high[i]), 2)}
+                for i, kind in enumerate(ITEM_KINDS)
+            },
+            "by_day": [
+                {"day": int(day), "low": round(float(day_low), 2), "high": round(float(day_high), 2)}
+                for day, day_low, day_high in zip(self.days, per_day_low, per_day_high)
+            ],
+            "unpriced": int(np.count_nonzero(~priced)),
+        }
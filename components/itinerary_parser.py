@@ -0,0 +1,216 @@
+"""
+Itinerary Parser - 마크다운 여행 일정을 스트리밍으로 받으면서 일자/활동/식사 레코드로 변환
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+# 일자 제목: "### Day 1: 파리 도착", "#### **Day 2 - 몽마르트르**", "**Day 3**" 등
+_DAY_HEADER = re.compile(r'^(?:#{1,6}\s*)?(?:\*\*)?\s*Day\s*(\d+)\s*[:：\-–]?\s*(.*?)\s*(?:\*\*)?\s*$', re.IGNORECASE)
+# 그 밖의 섹션 제목: "## 💡 추천사항"
+_SECTION_HEADER = re.compile(r'^#{1,6}\s*(.*?)\s*$')
+# 블록 제목: "**오전 활동:**", "**점심**:"
+_BLOCK_HEADER = re.compile(r'^\*\*\s*([^*]+?)\s*[:：]?\s*\*\*\s*[:：]?\s*$')
+# 항목: "- 시간: 09:00", "- **활동**: 에펠탑"
+_FIELD_LINE = re.compile(r'^[-*•]\s*(?:\*\*)?\s*([^:：*]+?)\s*(?:\*\*)?\s*[:：]\s*(?:\*\*)?\s*(.*?)\s*$')
+# 목록 항목: "- 편한 신발"
+_LIST_ITEM = re.compile(r'^[-*•]\s+(.*?)\s*$')
+
+ACTIVITY_FIELDS = {
+    "시간": "time", "활동": "activity", "장소": "location",
+    "설명": "description", "비용": "cost", "교통수단": "transportation", "교통": "transportation",
+}
+MEAL_FIELDS = {
+    "시간": "time", "식당": "restaurant", "요리": "cuisine", "음식": "cuisine",
+    "비용": "cost", "메모": "notes",
+}
+ACCOMMODATION_FIELDS = {
+    "숙소명": "name", "숙소": "name", "유형": "type", "비용": "cost", "메모": "notes",
+}
+RECOMMENDATION_FIELDS = {
+    "필수 방문지": "must_visit", "숨겨진 명소": "hidden_gems",
+    "현지인 팁": "local_tips", "예산 절약 팁": "budget_tips",
+}
+MEAL_KEYWORDS = ("아침", "점심", "저녁", "식사", "브런치", "조식", "석식")
+# "- **오전**: 에펠탑 방문" 처럼 시간대 이름으로 한 줄에 적은 활동
+TIME_OF_DAY_LABELS = ("오전", "오후", "저녁", "밤", "아침", "점심")
+
+def _split_list(value: str) -> List[str]:
+    return [item.strip() for item in re.split(r'[,，、]', value) if item.strip()]
+
+class StreamingItineraryParser:
+    """PLAN_OUTPUT_TEMPLATE 형식의 응답을 청크 단위로 파싱
+
+    feed로 받은 텍스트는 완성된 줄만 처리하며, 블록(활동/식사/숙박)과 일자가 끝날 때마다
+    이벤트를 반환합니다. 각 줄은 한 번만 처리하므로 응답 길이에 선형입니다.
+
+    이벤트 형식:
+    - {"type": "activity" | "meal" | "accommodation", "day": 일차, "record": 레코드}
+    - {"type": "day", "record": 일자 레코드 (activities/meals/accommodation 포함)}
+    """
+
+    def __init__(self):
+        self.days: List[Dict[str, Any]] = []
+        self.recommendations: Dict[str, List[str]] = {key: [] for key in RECOMMENDATION_FIELDS.values()}
+        self.total_estimated_cost = ""
+        self.packing_list: List[str] = []
+
+        self._partial: List[str] = []
+        self._day: Optional[Dict[str, Any]] = None
+        self._block: Optional[str] = None  # "activity" / "meal" / "accommodation"
+        self._block_label = ""
+        self._record: Dict[str, Any] = {}
+        self._section: Optional[str] = None  # 일정 이후 섹션: "recommendations" / "cost" / "packing"
+        self._events: List[Dict[str, Any]] = []
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """텍스트 청크 추가 후 새로 완성된 레코드 이벤트 반환"""
+        if "\n" not in chunk:
+            self._partial.append(chunk)
+            return []
+
+        head, *lines, tail = chunk.split("\n")
+        self._partial.append(head)
+        self._handle_line("".join(self._partial))
+        for line in lines:
+            self._handle_line(line)
+        self._partial = [tail]
+        return self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """스트림 종료 (마지막 줄과 열린 블록/일자 마무리)"""
+        self._handle_line("".join(self._partial))
+        self._partial = []
+        self._close_day()
+        return self._drain()
+
+    def result(self) -> Dict[str, Any]:
+        """지금까지 파싱한 내용을 LLM JSON 응답과 같은 구조로 반환"""
+        return {
+            "itinerary": self.days,
+            "recommendations": self.recommendations,
+            "total_estimated_cost": self.total_estimated_cost,
+            "packing_list": self.packing_list,
+        }
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        events, self._events = self._events, []
+        return events
+
+    # 줄 처리
+    def _handle_line(self, line: str):
+        line = line.strip()
+        if not line:
+            # 빈 줄은 블록 안의 레코드 구분
+            self._close_record()
+            return
+
+        match = _DAY_HEADER.match(line)
+        if match:
+            self._close_day()
+            self._section = None
+            self._day = {"day": int(match.group(1)), "title": match.group(2), "activities": [], "meals": [], "accommodation": {}}
+            return
+
+        match = _SECTION_HEADER.match(line) if line.startswith("#") else None
+        if match:
+            self._close_day()
+            self._section = self._classify_section(match.group(1))
+            return
+
+        if self._section:
+            self._handle_section_line(line)
+            return
+        if self._day is None:
+            return
+
+        match = _BLOCK_HEADER.match(line)
+        if match:
+            self._close_record()
+            self._block_label = match.group(1)
+            self._block = self._classify_block(self._block_label)
+            return
+
+        match = _FIELD_LINE.match(line)
+        if match:
+            self._handle_field(match.group(1), match.group(2))
+
+    def _handle_field(self, name: str, value: str):
+        if self._block is None:
+            if name in TIME_OF_DAY_LABELS:
+                # 블록 제목 없이 "- **오전**: 활동" 형식으로 적은 경우
+                self._close_record()
+                self._block_label = name
+                self._block = "activity"
+                self._record = {"time": name, "activity": value}
+                self._close_record()
+                self._block = None
+            return
+
+        fields = {"activity": ACTIVITY_FIELDS, "meal": MEAL_FIELDS, "accommodation": ACCOMMODATION_FIELDS}[self._block]
+        key = fields.get(name)
+        if key is None:
+            return
+        if key in self._record:
+            # 같은 항목이 다시 나오면 같은 블록의 다음 레코드
+            self._close_record()
+        self._record[key] = value
+
+    def _handle_section_line(self, line: str):
+        if self._section == "recommendations":
+            match = _FIELD_LINE.match(line)
+            key = RECOMMENDATION_FIELDS.get(match.group(1)) if match else None
+            if key:
+                self.recommendations[key].extend(_split_list(match.group(2)))
+        elif self._section == "cost":
+            self.total_estimated_cost = f"{self.total_estimated_cost} {line}".strip()
+        elif self._section == "packing":
+            match = _LIST_ITEM.match(line)
+            self.packing_list.extend([match.group(1)] if match else _split_list(line))
+
+    # 블록/일자 마무리
+    def _close_record(self):
+        if not self._record or self._day is None:
+            self._record = {}
+            return
+
+        record, self._record = self._record, {}
+        if self._block == "accommodation":
+            self._day["accommodation"].update(record)
+        else:
+            record["slot"] = self._block_label
+            self._day["activities" if self._block == "activity" else "meals"].append(record)
+        self._events.append({"type": self._block, "day": self._day["day"], "record": record})
+
+    def _close_day(self):
+        self._close_record()
+        self._block = None
+        self._block_label = ""
+        if self._day is not None:
+            self.days.append(self._day)
+            self._events.append({"type": "day", "record": self._day})
+            self._day = None
+
+    @staticmethod
+    def _classify_block(label: str) -> str:
+        if "숙박" in label or "숙소" in label:
+            return "accommodation"
+        if "활동" in label or not any(keyword in label for keyword in MEAL_KEYWORDS):
+            return "activity"
+        return "meal"
+
+    @staticmethod
+    def _classify_section(title: str) -> Optional[str]:
+        if "추천" in title:
+            return "recommendations"
+        if "비용" in title:
+            return "cost"
+        if "준비물" in title:
+            return "packing"
+        return None
+
+def parse_itinerary(text: str) -> Dict[str, Any]:
+    """완성된 응답 전체를 한 번에 파싱"""
+    parser = StreamingItineraryParser()
+    parser.feed(text)
+    parser.close()
+    return parser.result()
@@ -0,0 +1,176 @@
+"""
+JSON Extractor - LLM 응답에서 JSON 객체를 한 번의 순회로 찾아 추출 (스트리밍 입력 지원)
+"""
+import re
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+# 객체 내부에서 다음 중괄호(또는 청크 끝에서 끊긴 문자열)까지를 한 번에 건너뛰는 패턴
+# (완결된 문자열 리터럴은 통째로 건너뛰므로 문자열 안의 중괄호는 무시됨)
+_OBJECT_CONTENT = re.compile(r'(?:[^{}"]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+# 청크 경계에서 끊긴 문자열의 나머지 (닫는 따옴표까지 / 청크 끝까지)
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_STRING_PARTIAL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_STRING_OR_TRAILING_COMMA = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|,(\s*[}\]])', re.DOTALL)
+
+def _strip_trailing_commas(candidate: str) -> str:
+    """문자열 리터럴 밖의 `,}` / `,]` 에서 쉼표 제거"""
+    return _STRING_OR_TRAILING_COMMA.sub(lambda m: m.group(1) if m.group(1) is not None else m.group(0), candidate)
+
+def _loads(candidate: str) -> Optional[Any]:
+    """JSON 파싱 (실패하면 후행 쉼표를 제거하고 한 번 더 시도)"""
+    try:
+        return json.loads(candidate)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return json.loads(_strip_trailing_commas(candidate))
+    except json.JSONDecodeError:
+        return None
+
+class JSONObjectScanner:
+    """문자열 리터럴 안의 중괄호는 무시하면서 {...} 구간을 찾는 스캐너
+
+    feed로 입력을 나누어 넣을 수 있으며, 닫힌 구간마다 전체 입력 기준 (시작, 끝, 깊이)를
+    반환합니다. 깊이 0은 가장 바깥 객체입니다. 각 청크는 한 번만 검사하고 중괄호 사이의
+    내용은 정규식으로 건너뛰므로 입력 길이에 선형이며, 청크를 이어 붙이지 않습니다.
+    """
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._chunks_start = 0  # _chunks[0]의 전체 입력 기준 위치
+        self._offset = 0  # 다음 청크의 전체 입력 기준 위치
+        self._joined: Optional[str] = None
+        self._stack: List[int] = []
+        self._in_string = False
+        self._escape_pending = False
+
+    @property
+    def depth(self) -> int:
+        return len(self._stack)
+
+    def feed(self, chunk: str) -> List[Tuple[int, int, int]]:
+        offset, stack = self._offset, self._stack
+        self._chunks.append(chunk)
+        self._joined = None
+        self._offset += len(chunk)
+
+        spans = []
+        pos, length = 0, len(chunk)
+        if self._escape_pending and length:
+            # 이전 청크 끝의 백슬래시가 이스케이프하는 문자 건너뛰기
+            self._escape_pending = False
+            pos = 1
+
+        while pos < length:
+            if self._in_string:
+                match = _STRING_REST.match(chunk, pos)
+                if match is None:
+                    # 문자열이 다음 청크로 이어짐 (끝이 백슬래시면 다음 문자를 이스케이프)
+                    pos = _STRING_PARTIAL.match(chunk, pos).end()
+                    self._escape_pending = pos < length
+                    break
+                self._in_string = False
+                pos = match.end()
+                continue
+
+            if not stack:
+                # 객체 밖의 일반 문장은 따옴표를 포함해 무시하고 다음 여는 중괄호로 이동
+                pos = chunk.find("{", pos)
+                if pos < 0:
+                    break
+                stack.append(offset + pos)
+                pos += 1
+                continue
+
+            pos = _OBJECT_CONTENT.match(chunk, pos).end()
+            if pos >= length:
+                break
+            char = chunk[pos]
+            if char == "{":
+                stack.append(offset + pos)
+            elif char == "}":
+                start = stack.pop()
+                spans.append((start, offset + pos + 1, len(stack)))
+            else:
+                # 청크 안에서 닫히지 않은 문자열
+                self._in_string = True
+            pos += 1
+
+        return spans
+
+    def text(self, start: int, end: int) -> str:
+        """전체 입력 기준 위치로 보관 중인 입력 일부 반환"""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+            self._chunks = [self._joined]
+        return self._joined[start - self._chunks_start:end - self._chunks_start]
+
+    def discard_consumed(self):
+        """열린 객체가 없으면 이미 검사한 입력을 버려 메모리 사용량 유지"""
+        if not self._stack:
+            self._chunks = []
+            self._joined = None
+            self._chunks_start = self._offset
+
+def _parse_spans(scanner: JSONObjectScanner, spans: List[Tuple[int, int, int]]) -> List[Tuple[int, int, Dict[str, Any]]]:
+    """큰 구간부터 파싱해, 파싱된 구간 안에 포함된 구간은 건너뛰고 (시작, 끝, 객체) 목록 반환"""
+    accepted: List[Tuple[int, int, Dict[str, Any]]] = []
+    for start, end, _ in sorted(spans, key=lambda span: span[0] - span[1]):
+        if any(a_start <= start and end <= a_end for a_start, a_end, _ in accepted):
+            continue
+        value = _loads(scanner.text(start, end))
+        if isinstance(value, dict):
+            accepted.append((start, end, value))
+    return sorted(accepted, key=lambda item: item[0])
+
+def extract_json_objects(text: str) -> List[Dict[str, Any]]:
+    """텍스트에 포함된 JSON 객체를 등장 순서대로 모두 반환 (다른 객체 안에 포함된 객체 제외)"""
+    scanner = JSONObjectScanner()
+    return [value for _, _, value in _parse_spans(scanner, scanner.feed(text))]
+
+def extract_largest_json(text: str) -> Optional[Dict[str, Any]]:
+    """텍스트에서 가장 큰 유효 JSON 객체 반환 (코드 블록/앞뒤 설명/후행 쉼표 허용)"""
+    scanner = JSONObjectScanner()
+    for start, end, _ in sorted(scanner.feed(text), key=lambda span: span[0] - span[1]):
+        value = _loads(scanner.text(start, end))
+        if isinstance(value, dict):
+            return value
+    return None
+
+class IncrementalJSONExtractor:
+    """토큰 스트림을 받으면서 완성된 JSON 객체를 즉시 반환하는 추출기
+
+    가장 바깥 객체가 닫힐 때마다 파싱하며, 바깥 객체가 유효하지 않으면 그 안의
+    유효한 객체들을 대신 반환합니다. 완료된 입력은 버리므로 긴 스트림에도 메모리가 일정합니다.
+    """
+
+    def __init__(self):
+        self._scanner = JSONObjectScanner()
+        self._pending: List[Tuple[int, int, int]] = []
+        self.objects: List[Dict[str, Any]] = []
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """입력 청크 추가 후 새로 완성된 객체 목록 반환"""
+        completed = []
+        for span in self._scanner.feed(chunk):
+            self._pending.append(span)
+            if span[2] == 0:
+                completed.extend(value for _, _, value in _parse_spans(self._scanner, self._pending))
+                self._pending = []
+        self._scanner.discard_consumed()
+        self.objects.extend(completed)
+        return completed
+
+    def close(self) -> List[Dict[str, Any]]:
+        """스트림 종료 (닫히지 않은 바깥 객체 안에서 완성된 객체가 있으면 반환)"""
+        completed = [value for _, _, value in _parse_spans(self._scanner, self._pending)]
+        self._pending = []
+        self.objects.extend(completed)
+        return completed
+
+    def largest(self) -> Optional[Dict[str, Any]]:
+        """지금까지 추출한 객체 중 직렬화 길이가 가장 긴 객체"""
+        if not self.objects:
+            return None
+        return max(self.objects, key=lambda value: len(json.dumps(value, ensure_ascii=False)))
@@ -1,11 +1,7 @@
 import openai
 from typing import Dict, Any, Optional
 import streamlit as st
-from config.config import (
-    OPENAI_API_KEY, OPENAI_MODEL, DEFAULT_TEMPERATURE, MAX_TOKENS,
-    get_llm, get_embeddings, get_langfuse,
-    AOAI_API_KEY, AOAI_ENDPOINT, AOAI_DEPLOY_GPT4O
-)
+import config.config as config
 
 class LLMClient:
     """LLM 클라이언트 - OpenAI API와 Azure OpenAI 통신"""
@@ -20,20 +16,20 @@ class LLMClient:
         """LLM 클라이언트 초기화"""
         try:
             # Azure OpenAI 우선 시도
-            if all([AOAI_API_KEY, AOAI_ENDPOINT, AOAI_DEPLOY_GPT4O]):
-                self.azure_llm = get_llm()
+            if all([config.AOAI_API_KEY, config.AOAI_ENDPOINT, config.AOAI_DEPLOY_GPT4O]):
+                self.azure_llm = config.get_llm()
                 if self.azure_llm:
                     st.success("✅ Azure OpenAI 연결 성공!")
                     return
             
             # OpenAI API 시도
-            if OPENAI_API_KEY and OPENAI_API_KEY != "your_openai_api_key_here":
-                self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
+            if config.OPENAI_API_KEY and config.OPENAI_API_KEY != "your_openai_api_key_here":
+                self.client = openai.OpenAI(api_key=config.OPENAI_API_KEY)
                 st.success("✅ OpenAI API 연결 성공!")
                 return
             
             # Langfuse 초기화
-            self.langfuse = get_langfuse()
+            self.langfuse = config.get_langfuse()
             if self.langfuse:
                 st.info("📊 Langfuse 연결됨")
             
@@ -64,7 +60,7 @@ class LLMClient:
                 else:
                     # OpenAI API 사용
                     response = self.client.chat.completions.create(
-                        model=OPENAI_MODEL,
+                        model=config.OPENAI_MODEL,
                         messages=[
                             {
                                 "role": "system",
@@ -75,8 +71,8 @@ class LLMClient:
                                 "content": prompt
                             }
                         ],
-                        temperature=DEFAULT_TEMPERATURE,
-                        max_tokens=MAX_TOKENS
+                        temperature=config.DEFAULT_TEMPERATURE,
+                        max_tokens=config.MAX_TOKENS
                     )
                     return response.choices[0].message.content
                 
@@ -100,7 +96,7 @@ class LLMClient:
                 else:
                     # OpenAI API 사용
                     response = self.client.chat.completions.create(
-                        model=OPENAI_MODEL,
+                        model=config.OPENAI_MODEL,
                         messages=[
                             {
                                 "role": "system",
@@ -111,8 +107,8 @@ class LLMClient:
                                 "content": base_prompt
                             }
                         ],
-                        temperature=DEFAULT_TEMPERATURE,
-                        max_tokens=MAX_TOKENS
+                        temperature=config.DEFAULT_TEMPERATURE,
+                        max_tokens=config.MAX_TOKENS
                     )
                     return response.choices[0].message.content
                 
@@ -138,7 +134,7 @@ class LLMClient:
                 else:
                     # OpenAI API 사용
                     response = self.client.chat.completions.create(
-                        model=OPENAI_MODEL,
+                        model=config.OPENAI_MODEL,
                         messages=[
                             {
                                 "role": "system",
@@ -176,7 +172,7 @@ class LLMClient:
                 else:
                     # OpenAI API 사용
                     response = self.client.chat.completions.create(
-                        model=OPENAI_MODEL,
+                        model=config.OPENAI_MODEL,
                         messages=[
                             {
                                 "role": "system",
@@ -211,9 +207,9 @@ class LLMClient:
             "azure_connected": self.azure_llm is not None,
             "openai_connected": self.client is not None,
             "langfuse_connected": self.langfuse is not None,
-            "azure_api_key_set": bool(AOAI_API_KEY and AOAI_API_KEY != "your_azure_openai_api_key_here"),
-            "openai_api_key_set": bool(OPENAI_API_KEY and OPENAI_API_KEY != "your_openai_api_key_here"),
-            "model": "Azure OpenAI" if self.azure_llm else OPENAI_MODEL,
-            "temperature": DEFAULT_TEMPERATURE,
-            "max_tokens": MAX_TOKENS
+            "azure_api_key_set": bool(config.AOAI_API_KEY and config.AOAI_API_KEY != "your_azure_openai_api_key_here"),
+            "openai_api_key_set": bool(config.OPENAI_API_KEY and config.OPENAI_API_KEY != "your_openai_api_key_here"),
+            "model": "Azure OpenAI" if self.azure_llm else config.OPENAI_MODEL,
+            "temperature": config.DEFAULT_TEMPERATURE,
+            "max_tokens": config.MAX_TOKENS
         } 
\ No newline at end of file
@@ -1,156 +1,220 @@
-from typing import Dict, Any
-
-class LLMPromptGenerator:
-    """LLM 프롬프트 생성기"""
-    
-    def __init__(self):
-        self.base_prompt_template = """
-당신은 전문 여행 플래너입니다. 다음 정보를 바탕으로 맞춤형 여행 일정을 만들어주세요.
+"""
+LLM Prompt Generator - 여행 계획/대안/날씨/현지 팁 프롬프트를 미리 만들어 둔 템플릿으로 생성하고 캐싱
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
 
-**여행 정보:**
-{travel_info}
+# 모든 프롬프트가 같은 문자열로 시작하도록 고정한 앞부분 (제공자 측 프롬프트 캐시가 적중할 수 있게
+# 사용자 입력에 따라 바뀌는 내용은 항상 뒤에 둠)
+STABLE_PREFIX = """당신은 전문 여행 플래너입니다.
 
-**요구사항:**
-- 일정은 {duration}일 동안의 상세한 계획이어야 합니다
-- 각 날짜별로 시간대별 활동을 구체적으로 제시해주세요
-- 예산 범위({budget_range})에 맞는 추천을 해주세요
-- {travel_style} 스타일에 맞는 일정을 구성해주세요
-- 선호하는 활동과 음식을 반영해주세요
-- 교통수단과 숙박 옵션을 포함해주세요
+**공통 원칙:**
+- 현실적이고 실행 가능한 정보를 제시해주세요
+- 여행자의 선호사항을 최대한 반영해주세요
+- 예산과 시간을 고려한 합리적인 계획을 제시해주세요
+- 현지 문화와 관습을 고려한 추천을 해주세요
+"""
 
+ITINERARY_FORMAT = """
 **출력 형식:**
 다음 JSON 형식으로 응답해주세요:
 
-{{
+{
     "itinerary": [
-        {{
+        {
             "day": 1,
             "date": "YYYY-MM-DD",
             "activities": [
-                {{
+                {
                     "time": "09:00-10:30",
                     "activity": "활동명",
                     "location": "장소",
                     "description": "상세 설명",
                     "cost": "예상 비용",
                     "transportation": "교통수단"
-                }}
+                }
             ],
             "meals": [
-                {{
+                {
                     "time": "12:00-13:00",
                     "restaurant": "식당명",
                     "cuisine": "음식 종류",
                     "cost": "예상 비용",
                     "notes": "특별한 점"
-                }}
+                }
             ],
-            "accommodation": {{
+            "accommodation": {
                 "name": "숙박시설명",
                 "type": "숙박 유형",
                 "cost": "예상 비용",
                 "notes": "특별한 점"
-            }}
-        }}
+            }
+        }
     ],
-    "recommendations": {{
+    "recommendations": {
         "must_visit": ["반드시 가봐야 할 곳들"],
         "hidden_gems": ["숨겨진 명소들"],
         "local_tips": ["현지인 팁들"],
         "budget_tips": ["예산 절약 팁들"]
-    }},
+    },
     "total_estimated_cost": "총 예상 비용",
     "packing_list": ["준비물 목록"]
-}}
+}
+"""
 
-**중요한 점:**
-- 현실적이고 실행 가능한 일정을 만들어주세요
-- 여행자의 선호사항을 최대한 반영해주세요
-- 예산과 시간을 고려한 합리적인 계획을 제시해주세요
-- 현지 문화와 관습을 고려한 추천을 해주세요
+# 여행 계획 프롬프트에서 입력에 따라 바뀌지 않는 앞부분 (기본/대안 프롬프트가 공유)
+ITINERARY_PREFIX = STABLE_PREFIX + ITINERARY_FORMAT
+
+ALTERNATIVE_INSTRUCTIONS = {
+    "budget": """기존 일정을 더 저렴한 예산으로 조정해주세요.
+무료 관광지, 할인 정보, 저렴한 식당 등을 포함해주세요.""",
+    "luxury": """기존 일정을 더 럭셔리한 버전으로 업그레이드해주세요.
+고급 호텔, 미슐랭 레스토랑, 프리미엄 액티비티 등을 포함해주세요.""",
+    "relaxed": """기존 일정을 더 느긋한 페이스로 조정해주세요.
+휴식 시간을 충분히 포함하고, 스트레스 없는 일정으로 만들어주세요.""",
+    "adventure": """기존 일정을 더 모험적인 버전으로 변경해주세요.
+스릴 있는 액티비티, 오프더비트 경험, 현지인과의 교류 등을 포함해주세요.""",
+}
+
+WEATHER_INSTRUCTIONS = """
+다음 정보를 포함해주세요:
+- 계절별 평균 기온과 강수량
+- 여행 시기별 날씨 특징
+- 날씨에 따른 준비물 추천
+- 날씨가 여행 계획에 미치는 영향
+- 대안 계획 제안"""
+
+LOCAL_TIPS_INSTRUCTIONS = """
+다음 정보를 포함해주세요:
+- 관광객이 모르는 숨겨진 명소
+- 현지인들이 즐겨가는 식당과 카페
+- 관광객 함정 피하는 방법
+- 현지 문화와 예절
+- 교통 이용 팁
+- 쇼핑 팁
+- 안전 주의사항"""
+
+DEFAULT_PROMPT_CACHE_SIZE = 256
+
+def _join(values: Any) -> str:
+    if isinstance(values, (list, tuple, set)):
+        return ', '.join(str(value) for value in values)
+    return str(values or '')
+
+class LLMPromptGenerator:
+    """LLM 프롬프트 생성기
+
+    입력과 무관한 부분(STABLE_PREFIX, JSON 출력 형식, 대안 지시문)은 모듈 로드 시 한 번만 만들어
+    두고, 요청마다 여행 정보 블록만 이어 붙입니다. 완성된 여행 계획 프롬프트는 프롬프트에 들어가는
+    값 그대로(_prompt_values)를 키로 LRU 캐싱하므로, 캐시된 프롬프트는 항상 그 입력으로 렌더링한
+    결과와 같고 같은 입력의 기본/대안 프롬프트는 여행 정보를 다시 만들지 않습니다.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_PROMPT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _prompt_values(user_input: Dict[str, Any]) -> Tuple[str, ...]:
+        """여행 정보 블록에 들어가는 값을 표시되는 문자열 그대로 모은 튜플 (캐시 키 겸 렌더링 입력)"""
+        return (
+            str(user_input.get('destination', 'N/A')),
+            str(user_input.get('duration', 'N/A')),
+            str(user_input.get('group_size', 'N/A')),
+            str(user_input.get('travel_style', 'N/A')),
+            str(user_input.get('budget_range', 'N/A')),
+            str(user_input.get('accommodation_type', 'N/A')),
+            _join(user_input.get('activities', [])),
+            _join(user_input.get('food_preferences', [])),
+            _join(user_input.get('transportation', [])),
+            str(user_input.get('pace', 'N/A')),
+            str(user_input.get('additional_notes') or ''),
+        )
+
+    @staticmethod
+    def _render_travel_section(values: Tuple[str, ...]) -> str:
+        """입력에 따라 바뀌는 여행 정보/요구사항 블록"""
+        (destination, duration, group_size, travel_style, budget_range, accommodation_type,
+         activities, food_preferences, transportation, pace, additional_notes) = values
+        travel_info = f"""- 목적지: {destination}
+- 여행 기간: {duration}일
+- 인원수: {group_size}명
+- 여행 스타일: {travel_style}
+- 예산 범위: {budget_range}
+- 숙박 유형: {accommodation_type}
+- 선호 활동: {activities}
+- 음식 선호: {food_preferences}
+- 교통수단: {transportation}
+- 여행 페이스: {pace}"""
+
+        if additional_notes:
+            travel_info += f"\n- 추가 요구사항: {additional_notes}"
+
+        return f"""
+다음 정보를 바탕으로 위 형식의 맞춤형 여행 일정을 만들어주세요.
+
+**여행 정보:**
+{travel_info}
+
+**요구사항:**
+- 일정은 {duration}일 동안의 상세한 계획이어야 합니다
+- 각 날짜별로 시간대별 활동을 구체적으로 제시해주세요
+- 예산 범위({budget_range})에 맞는 추천을 해주세요
+- {travel_style} 스타일에 맞는 일정을 구성해주세요
+- 선호하는 활동과 음식을 반영해주세요
+- 교통수단과 숙박 옵션을 포함해주세요
 """
-    
+
     def generate_travel_prompt(self, user_input: Dict[str, Any]) -> str:
-        """사용자 입력을 바탕으로 여행 계획 프롬프트 생성"""
-        
-        # 여행 정보 구성
-        travel_info = f"""
-        - 목적지: {user_input.get('destination', 'N/A')}
-        - 여행 기간: {user_input.get('duration', 'N/A')}일
-        - 인원수: {user_input.get('group_size', 'N/A')}명
-        - 여행 스타일: {user_input.get('travel_style', 'N/A')}
-        - 예산 범위: {user_input.get('budget_range', 'N/A')}
-        - 숙박 유형: {user_input.get('accommodation_type', 'N/A')}
-        - 선호 활동: {', '.join(user_input.get('activities', []))}
-        - 음식 선호: {', '.join(user_input.get('food_preferences', []))}
-        - 교통수단: {', '.join(user_input.get('transportation', []))}
-        - 여행 페이스: {user_input.get('pace', 'N/A')}
-        """
-        
-        if user_input.get('additional_notes'):
-            travel_info += f"\n- 추가 요구사항: {user_input.get('additional_notes')}"
-        
-        # 프롬프트 생성
-        prompt = self.base_prompt_template.format(
-            travel_info=travel_info,
-            duration=user_input.get('duration', 'N/A'),
-            budget_range=user_input.get('budget_range', 'N/A'),
-            travel_style=user_input.get('travel_style', 'N/A')
-        )
-        
+        """사용자 입력을 바탕으로 여행 계획 프롬프트 생성 (프롬프트에 들어가는 값이 같으면 캐시 사용)"""
+        key = self._prompt_values(user_input)
+        with self._lock:
+            prompt = self._cache.get(key)
+            if prompt is not None:
+                self._cache.move_to_end(key)
+                return prompt
+
+        prompt = ITINERARY_PREFIX + self._render_travel_section(key)
+
+        with self._lock:
+            self._cache[key] = prompt
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
         return prompt
-    
+
     def generate_alternative_prompt(self, user_input: Dict[str, Any], alternative_type: str) -> str:
-        """대안 일정 생성 프롬프트"""
-        
-        alternative_prompts = {
-            "budget": """
-            기존 일정을 더 저렴한 예산으로 조정해주세요. 
-            무료 관광지, 할인 정보, 저렴한 식당 등을 포함해주세요.
-            """,
-            "luxury": """
-            기존 일정을 더 럭셔리한 버전으로 업그레이드해주세요.
-            고급 호텔, 미슐랭 레스토랑, 프리미엄 액티비티 등을 포함해주세요.
-            """,
-            "relaxed": """
-            기존 일정을 더 느긋한 페이스로 조정해주세요.
-            휴식 시간을 충분히 포함하고, 스트레스 없는 일정으로 만들어주세요.
-            """,
-            "adventure": """
-            기존 일정을 더 모험적인 버전으로 변경해주세요.
-            스릴 있는 액티비티, 오프더비트 경험, 현지인과의 교류 등을 포함해주세요.
-            """
-        }
-        
+        """대안 일정 생성 프롬프트 (기본 프롬프트 전체를 앞부분으로 공유)"""
+        base_prompt = self.generate_travel_prompt(user_input)
+        return base_prompt + "\n" + ALTERNATIVE_INSTRUCTIONS.get(alternative_type, "")
+
+    def generate_alternative_prompts(self, user_input: Dict[str, Any],
+                                     alternative_types: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """여러 대안 프롬프트를 한 번에 생성 (기본 프롬프트는 한 번만 만듦, 기본값은 모든 대안)"""
         base_prompt = self.generate_travel_prompt(user_input)
-        alternative_prompt = alternative_prompts.get(alternative_type, "")
-        
-        return base_prompt + "\n\n" + alternative_prompt
-    
+        types = ALTERNATIVE_INSTRUCTIONS if alternative_types is None else alternative_types
+        return {
+            alternative_type: base_prompt + "\n" + ALTERNATIVE_INSTRUCTIONS.get(alternative_type, "")
+            for alternative_type in types
+        }
+
     def generate_weather_prompt(self, destination: str, duration: int) -> str:
         """날씨 정보 요청 프롬프트"""
-        return f"""
-        {destination}의 {duration}일간 여행에 대한 날씨 정보와 준비사항을 알려주세요.
-        
-        다음 정보를 포함해주세요:
-        - 계절별 평균 기온과 강수량
-        - 여행 시기별 날씨 특징
-        - 날씨에 따른 준비물 추천
-        - 날씨가 여행 계획에 미치는 영향
-        - 대안 계획 제안
-        """
-    
+        return f"""{STABLE_PREFIX}
+{destination}의 {duration}일간 여행에 대한 날씨 정보와 준비사항을 알려주세요.
+{WEATHER_INSTRUCTIONS}
+"""
+
     def generate_local_tips_prompt(self, destination: str) -> str:
         """현지인 팁 요청 프롬프트"""
-        return f"""
-        {destination}에 대한 현지인만 아는 팁과 정보를 알려주세요.
-        
-        다음 정보를 포함해주세요:
-        - 관광객이 모르는 숨겨진 명소
-        - 현지인들이 즐겨가는 식당과 카페
-        - 관광객 함정 피하는 방법
-        - 현지 문화와 예절
-        - 교통 이용 팁
-        - 쇼핑 팁
-        - 안전 주의사항
-        """ 
\ No newline at end of file
+        return f"""{STABLE_PREFIX}
+{destination}에 대한 현지인만 아는 팁과 정보를 알려주세요.
+{LOCAL_TIPS_INSTRUCTIONS}
+"""
+
+    def clear_cache(self):
+        """캐시된 여행 계획 프롬프트 비우기"""
+        with self._lock:
+            self._cache.clear()
@@ -1,14 +1,19 @@
 import json
-import re
 from typing import Dict, Any, List, Optional
 import streamlit as st
 from datetime import datetime, timedelta
 
+from components.json_extractor import extract_largest_json
+from components.itinerary_parser import parse_itinerary
+from components.activity_classifier import default_classifier
+from components.itinerary_model import ItineraryTable
+
 class LLMResponseProcessor:
     """LLM 응답 처리기"""
     
-    def __init__(self):
+    def __init__(self, classifier=None):
         self.processed_data = {}
+        self.classifier = classifier or default_classifier
     
     def process_llm_response(self, response_text: str) -> Dict[str, Any]:
         """LLM 응답을 파싱하고 구조화된 데이터로 변환"""
@@ -33,27 +38,9 @@ class LLMResponseProcessor:
             return {"error": str(e)}
     
     def _extract_json_from_response(self, response_text: str) -> Optional[Dict[str, Any]]:
-        """응답 텍스트에서 JSON 추출"""
-        
-        # JSON 블록 찾기
-        json_pattern = r'```json\s*(.*?)\s*```'
-        json_match = re.search(json_pattern, response_text, re.DOTALL)
-        
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            # JSON 블록이 없는 경우 전체 텍스트에서 JSON 찾기
-            json_pattern = r'\{.*\}'
-            json_match = re.search(json_pattern, response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(0)
-            else:
-                return None
+        """응답 텍스트에서 JSON 추출 (코드 블록 여부와 관계없이 가장 큰 유효 JSON 객체)"""
         
-        try:
-            return json.loads(json_str)
-        except json.JSONDecodeError:
-            return None
+        return extract_largest_json(response_text)
     
     def _validate_and_enhance_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """JSON 데이터 검증 및 보완"""
@@ -92,6 +79,9 @@ class LLMResponseProcessor:
         
         processed_itinerary = []
         
+        # 모든 일자의 활동/식사를 한 번에 분류 (category / meal_type 채움)
+        self.classifier.classify_itinerary(itinerary_data)
+        
         for day_data in itinerary_data:
             processed_day = {
                 "day": day_data.get("day", 1),
@@ -134,7 +124,7 @@ class LLMResponseProcessor:
                 "description": activity.get("description", ""),
                 "cost": activity.get("cost", ""),
                 "transportation": activity.get("transportation", ""),
-                "category": self._categorize_activity(activity.get("activity", ""))
+                "category": activity.get("category", self.classifier.default_category)
             }
             
             processed_activities.append(processed_activity)
@@ -153,7 +143,7 @@ class LLMResponseProcessor:
                 "cuisine": meal.get("cuisine", ""),
                 "cost": meal.get("cost", ""),
                 "notes": meal.get("notes", ""),
-                "meal_type": self._categorize_meal(meal.get("time", ""))
+                "meal_type": meal.get("meal_type", self.classifier.default_meal_type)
             }
             
             processed_meals.append(processed_meal)
@@ -163,32 +153,12 @@ class LLMResponseProcessor:
     def _categorize_activity(self, activity_name: str) -> str:
         """활동 카테고리 분류"""
         
-        activity_lower = activity_name.lower()
-        
-        if any(word in activity_lower for word in ["박물관", "미술관", "갤러리"]):
-            return "문화"
-        elif any(word in activity_lower for word in ["공원", "산", "바다", "자연"]):
-            return "자연"
-        elif any(word in activity_lower for word in ["쇼핑", "마켓", "몰"]):
-            return "쇼핑"
-        elif any(word in activity_lower for word in ["레스토랑", "카페", "음식"]):
-            return "음식"
-        elif any(word in activity_lower for word in ["운동", "스포츠", "액티비티"]):
-            return "액티비티"
-        else:
-            return "기타"
+        return self.classifier.classify_activity(activity_name)
     
     def _categorize_meal(self, time: str) -> str:
         """식사 유형 분류"""
         
-        if "06" in time or "07" in time or "08" in time or "09" in time:
-            return "아침"
-        elif "11" in time or "12" in time or "13" in time:
-            return "점심"
-        elif "17" in time or "18" in time or "19" in time or "20" in time:
-            return "저녁"
-        else:
-            return "간식"
+        return self.classifier.classify_meal(time)
     
     def _generate_date(self, day_number: int) -> str:
         """일차에 따른 날짜 생성"""
@@ -218,38 +188,10 @@ class LLMResponseProcessor:
     def _parse_text_response(self, response_text: str) -> Dict[str, Any]:
         """텍스트 응답 파싱 (JSON이 없는 경우)"""
         
-        # 간단한 텍스트 파싱 로직
-        parsed_data = {
-            "itinerary": [],
-            "recommendations": {
-                "must_visit": [],
-                "hidden_gems": [],
-                "local_tips": [],
-                "budget_tips": []
-            },
-            "total_estimated_cost": "",
-            "packing_list": [],
-            "raw_text": response_text,
-            "metadata": {
-                "processed_at": datetime.now().isoformat(),
-                "data_source": "text_parsing"
-            }
-        }
-        
-        # 텍스트에서 날짜별 정보 추출
-        day_pattern = r'Day\s*(\d+)[:\s]*(.*?)(?=Day\s*\d+|$)'
-        day_matches = re.findall(day_pattern, response_text, re.DOTALL | re.IGNORECASE)
-        
-        for day_num, day_content in day_matches:
-            day_data = {
-                "day": int(day_num),
-                "date": self._generate_date(int(day_num)),
-                "activities": [],
-                "meals": [],
-                "accommodation": {},
-                "summary": f"Day {day_num}: {day_content[:100]}..."
-            }
-            parsed_data["itinerary"].append(day_data)
+        # 마크다운 일정(### Day N / **오전 활동:** / - 시간: ...)을 JSON 응답과 같은 구조로 변환
+        parsed_data = self._validate_and_enhance_data(parse_itinerary(response_text))
+        parsed_data["raw_text"] = response_text
+        parsed_data["metadata"]["data_source"] = "text_parsing"
         
         return parsed_data
     
@@ -263,16 +205,13 @@ class LLMResponseProcessor:
         if not self.processed_data or "itinerary" not in self.processed_data:
             return "일정 정보가 없습니다."
         
-        itinerary = self.processed_data["itinerary"]
-        total_days = len(itinerary)
-        total_activities = sum(len(day.get("activities", [])) for day in itinerary)
-        total_meals = sum(len(day.get("meals", [])) for day in itinerary)
+        stats = ItineraryTable.from_itinerary(self.processed_data["itinerary"]).summary()
         
         summary = f"""
         **여행 일정 요약:**
-        - 총 여행 기간: {total_days}일
-        - 총 활동 수: {total_activities}개
-        - 총 식사 수: {total_meals}회
+        - 총 여행 기간: {stats['total_days']}일
+        - 총 활동 수: {stats['total_activities']}개
+        - 총 식사 수: {stats['total_meals']}회
         - 예상 총 비용: {self.processed_data.get('total_estimated_cost', 'N/A')}
         """
         
@@ -0,0 +1,194 @@
+"""
+Local Vector Index - 임베딩 API 없이 동작하는 문자 n-gram TF-IDF 벡터 색인 (NumPy, 메모리 매핑)
+"""
+import os
+import re
+import json
+import zlib
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from components.hybrid_retriever import RetrievedChunk, chunk_id_of
+
+LOCAL_INDEX_VERSION = 1
+DEFAULT_DIM = 1024
+DEFAULT_NGRAM_RANGE = (2, 4)
+
+_SPACES = re.compile(r'\s+')
+
+class CharNgramVectorizer:
+    """문자 n-gram을 부호 있는 해싱으로 dim차원에 모으고 TF-IDF 가중치를 주는 벡터화기
+
+    어휘 사전 없이 고정 차원 벡터를 만들므로 색인과 질의가 같은 설정만 공유하면 됩니다.
+    한글은 음절 단위 n-gram이 조사/어미 변화에 강합니다.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM, ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+                 idf: Optional[np.ndarray] = None):
+        self.dim = dim
+        self.ngram_range = tuple(ngram_range)
+        self.idf = idf if idf is not None else np.ones(dim, dtype=np.float32)
+
+    def _hashed_counts(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(버킷, 부호 있는 빈도) - 같은 버킷은 합산"""
+        text = _SPACES.sub(' ', (text or '').lower()).strip()
+        if not text:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        text = f" {text} "
+        hashes = [
+            zlib.crc32(text[start:start + n].encode("utf-8"))
+            for n in range(self.ngram_range[0], self.ngram_range[1] + 1)
+            for start in range(len(text) - n + 1)
+        ]
+        hashes = np.array(hashes, dtype=np.uint32)
+        buckets = (hashes % self.dim).astype(np.int64)
+        signs = np.where((hashes >> 31) & 1, -1.0, 1.0)
+        unique, inverse = np.unique(buckets, return_inverse=True)
+        counts = np.bincount(inverse, weights=signs).astype(np.float32)
+        return unique, counts
+
+    def fit(self, texts: Sequence[str]) -> "CharNgramVectorizer":
+        """버킷별 문서 빈도로 IDF 계산"""
+        document_frequency = np.zeros(self.dim, dtype=np.float64)
+        for text in texts:
+            buckets, _ = self._hashed_counts(text)
+            document_frequency[buckets] += 1
+        self.idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+        return self
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """L2 정규화된 (문서 수, dim) float32 행렬 (빈도는 1 + log tf로 완화)"""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            buckets, counts = self._hashed_counts(text)
+            if not len(buckets):
+                continue
+            weights = np.sign(counts) * (1 + np.log(np.maximum(np.abs(counts), 1))) * self.idf[buckets]
+            norm = float(np.linalg.norm(weights))
+            if norm > 0:
+                matrix[row, buckets] = weights / norm
+        return matrix
+
+class LocalVectorIndex:
+    """평면(flat) 코사인 유사도 색인
+
+    벡터는 vectors.npy에 float32로 저장하고 mmap_mode="r"로 열어 시작 시 복사하지 않습니다.
+    vectorstore와 같은 similarity_search(query, k, filter)를 제공해 HybridRetriever에서
+    Chroma 대신 사용할 수 있습니다.
+    """
+
+    VECTORS_FILE = "vectors.npy"
+    IDF_FILE = "idf.npy"
+    META_FILE = "meta.json"
+
+    def __init__(self, vectorizer: CharNgramVectorizer, vectors: np.ndarray,
+                 ids: List[str], texts: List[str], metadatas: List[Dict[str, Any]]):
+        self.vectorizer = vectorizer
+        self.vectors = vectors
+        self.ids = ids
+        self.texts = texts
+        self.metadatas = metadatas
+        self._columns: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, documents: Iterable[Any], dim: int = DEFAULT_DIM,
+              ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE) -> "LocalVectorIndex":
+        """page_content/metadata를 가진 문서(청크) 목록으로 색인 생성"""
+        ids, texts, metadatas = [], [], []
+        for document in documents:
+            ids.append(chunk_id_of(document))
+            texts.append(document.page_content)
+            metadatas.append(dict(document.metadata or {}))
+        vectorizer = CharNgramVectorizer(dim, ngram_range).fit(texts)
+        return cls(vectorizer, vectorizer.transform(texts), ids, texts, metadatas)
+
+    def _column(self, key: str) -> np.ndarray:
+        """메타데이터 key 값 배열 (처음 필터링할 때 한 번 만들어 재사용)"""
+        column = self._columns.get(key)
+        if column is None:
+            column = np.array([metadata.get(key) for metadata in self.metadatas], dtype=object)
+            self._columns[key] = column
+        return column
+
+    def _filter_mask(self, where: Dict[str, Any]) -> np.ndarray:
+        """Chroma where 형식 필터({키: 값}, {키: {"$in": [...]}}, {"$and": [...]})의 청크 마스크"""
+        mask = np.ones(len(self.ids), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._filter_mask(clause)
+            elif isinstance(condition, dict):
+                if "$in" in condition:
+                    mask &= np.isin(self._column(key), list(condition["$in"]))
+                if "$eq" in condition:
+                    mask &= self._column(key) == condition["$eq"]
+            else:
+                mask &= self._column(key) == condition
+        return mask
+
+    def similarity_search_with_score(self, query: str, k: int = 4,
+                                     filter: Optional[Dict[str, Any]] = None) -> List[Tuple[RetrievedChunk, float]]:
+        if not self.ids:
+            return []
+        scores = np.asarray(self.vectors @ self.vectorizer.transform([query])[0])
+        if filter:
+            scores = np.where(self._filter_mask(filter), scores, -np.inf)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (RetrievedChunk(self.ids[row], self.texts[row], self.metadatas[row], float(scores[row])), float(scores[row]))
+            for row in top if np.isfinite(scores[row])
+        ]
+
+    def similarity_search(self, query: str, k: int = 4, filter: Optional[Dict[str, Any]] = None) -> List[RetrievedChunk]:
+        return [chunk for chunk, _ in self.similarity_search_with_score(query, k, filter)]
+
+    def save(self, directory: str):
+        """색인 저장 (파일마다 임시 파일에 쓴 뒤 교체, meta.json을 마지막에 바꿔 버전을 맞춤)"""
+        os.makedirs(directory, exist_ok=True)
+
+        def replace(name: str, write):
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(temp_path, os.path.join(directory, name))
+
+        replace(self.VECTORS_FILE, lambda f: np.save(f, np.ascontiguousarray(self.vectors, dtype=np.float32)))
+        replace(self.IDF_FILE, lambda f: np.save(f, self.vectorizer.idf))
+        meta = {
+            "version": LOCAL_INDEX_VERSION,
+            "dim": self.vectorizer.dim,
+            "ngram_range": list(self.vectorizer.ngram_range),
+            "ids": self.ids,
+            "texts": self.texts,
+            "metadatas": self.metadatas,
+        }
+        replace(self.META_FILE, lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8")))
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["LocalVectorIndex"]:
+        """저장된 색인 로드 (벡터는 메모리 매핑, 없거나 버전/크기가 맞지 않으면 None)"""
+        meta_path = os.path.join(directory, cls.META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("version") != LOCAL_INDEX_VERSION:
+                return None
+            vectors = np.load(os.path.join(directory, cls.VECTORS_FILE), mmap_mode="r")
+            idf = np.load(os.path.join(directory, cls.IDF_FILE))
+        except (OSError, ValueError) as e:
+            print(f"로컬 벡터 색인 로드 실패: {e}")
+            return None
+        if vectors.shape != (len(meta["ids"]), meta["dim"]):
+            print("로컬 벡터 색인 파일이 서로 맞지 않아 사용하지 않습니다.")
+            return None
+        vectorizer = CharNgramVectorizer(meta["dim"], tuple(meta["ngram_range"]), idf=idf)
+        return cls(vectorizer, vectors, meta["ids"], meta["texts"], meta["metadatas"])
@@ -0,0 +1,103 @@
+"""
+Markdown Splitter - 여행 정보 문서를 "## 국가 / ### 도시" 구조에 맞춰 절 단위 청크로 분할
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+SPLITTER_VERSION = 1
+DEFAULT_MAX_CHARS = 1000
+
+_HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+# "### 취리히 (Zurich)" → 이름, 괄호 안 별칭
+_NAME_WITH_ALIAS = re.compile(r'^(.+?)\s*\(([^)]+)\)\s*$')
+# "## 스위스 여행 정보" 처럼 국가 절을 나타내는 제목 끝 표현
+COUNTRY_HEADING_SUFFIXES = ("여행 정보", "여행 가이드", "여행")
+
+def _country_of(heading: str) -> Optional[str]:
+    for suffix in COUNTRY_HEADING_SUFFIXES:
+        if heading.endswith(suffix) and heading != suffix:
+            name = heading[:-len(suffix)].strip()
+            # "일반적인 여행 팁" 같은 제목은 국가가 아님
+            if name and " " not in name:
+                return name
+    return None
+
+def _split_long(body: str, max_chars: int) -> List[str]:
+    """긴 절 본문을 문단(빈 줄) → 줄 경계로 max_chars 이하 조각으로 나눔"""
+    if len(body) <= max_chars:
+        return [body]
+    pieces: List[str] = []
+    current = ""
+    units = [unit for paragraph in re.split(r'\n\s*\n', body) for unit in (
+        [paragraph] if len(paragraph) <= max_chars else paragraph.split("\n")
+    )]
+    for unit in units:
+        unit = unit.strip()
+        if not unit:
+            continue
+        # 한 줄이 max_chars보다 길면 그대로 잘라냄
+        while len(unit) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(unit[:max_chars])
+            unit = unit[max_chars:]
+        candidate = f"{current}\n{unit}" if current else unit
+        if len(candidate) > max_chars:
+            pieces.append(current)
+            current = unit
+        else:
+            current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+def split_markdown_sections(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> List[Tuple[str, Dict[str, Any]]]:
+    """(청크 본문, 메타데이터) 목록
+
+    가장 깊은 제목 하나가 한 청크가 되며, 본문 앞에 "국가 > 도시" 경로를 붙여 청크만 보고도
+    어느 도시 이야기인지 알 수 있게 합니다. 메타데이터:
+    - country: "## 스위스 여행 정보" 아래 청크의 국가
+    - city / city_alias: 국가 절 아래 "### 취리히 (Zurich)" 제목의 도시 이름과 괄호 안 별칭
+    - section: 청크의 제목 (국가 절 밖의 "### 짐 꾸리기" 등)
+    """
+    chunks: List[Tuple[str, Dict[str, Any]]] = []
+    headings: Dict[int, str] = {}
+    lines: List[str] = []
+
+    def flush():
+        body = "\n".join(lines).strip()
+        lines.clear()
+        if not body:
+            return
+        metadata: Dict[str, Any] = {}
+        country_level = next((level for level in sorted(headings) if _country_of(headings[level])), None)
+        deepest = headings[max(headings)] if headings else ""
+        if country_level is not None:
+            metadata["country"] = _country_of(headings[country_level])
+            city_levels = [level for level in headings if level > country_level]
+            if city_levels:
+                city_heading = headings[min(city_levels)]
+                match = _NAME_WITH_ALIAS.match(city_heading)
+                metadata["city"] = match.group(1).strip() if match else city_heading
+                if match:
+                    metadata["city_alias"] = match.group(2).strip()
+        if deepest:
+            metadata["section"] = deepest
+
+        path = " > ".join(headings[level] for level in sorted(headings) if level > 1)
+        for piece in _split_long(body, max_chars):
+            chunks.append((f"[{path}]\n{piece}" if path else piece, dict(metadata)))
+
+    for line in (text or "").splitlines():
+        match = _HEADING.match(line)
+        if match:
+            flush()
+            level = len(match.group(1))
+            for deeper in [key for key in headings if key >= level]:
+                del headings[deeper]
+            headings[level] = match.group(2).strip()
+        else:
+            lines.append(line)
+    flush()
+    return chunks
@@ -0,0 +1,99 @@
+"""
+Matrix Cache - 도시별 POI 거리/이동 시간 행렬을 .npy 파일로 보관하고 메모리 매핑으로 재사용
+"""
+import os
+import hashlib
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from components.route_optimizer import DEFAULT_TRAVEL_MODE, TRAVEL_MODES, WALK_MAX_KM, distance_matrix, travel_time_matrix
+
+class CityMatrices:
+    """한 도시 POI 집합의 (거리, 이동 시간) 행렬과 POI id → 행 번호 색인"""
+
+    __slots__ = ("city", "mode", "ids", "index", "distances", "times")
+
+    def __init__(self, city: str, mode: str, ids: List[Any], distances: np.ndarray, times: np.ndarray):
+        self.city = city
+        self.mode = mode
+        self.ids = ids
+        self.index = {poi_id: row for row, poi_id in enumerate(ids)}
+        self.distances = distances
+        self.times = times
+
+    def subset(self, ids: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """주어진 POI id 순서대로 자른 (거리, 이동 시간) 행렬"""
+        rows = [self.index[poi_id] for poi_id in ids]
+        grid = np.ix_(rows, rows)
+        return np.asarray(self.distances[grid]), np.asarray(self.times[grid])
+
+    def travel_minutes(self, from_id: Any, to_id: Any) -> float:
+        return float(self.times[self.index[from_id], self.index[to_id]])
+
+class MatrixCache:
+    """도시 × 이동 수단별 행렬 캐시
+
+    키는 도시, 이동 수단, POI 집합(id/좌표)과 속도 설정의 해시이므로 POI 데이터가 바뀌면
+    새 파일을 만듭니다. 파일은 처음 필요할 때 mmap_mode="r"로 열어 프로세스 안에서 재사용하고,
+    없으면 한 번 계산해 임시 파일에 쓴 뒤 이름을 바꿔 저장합니다.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, np.ndarray] = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, city: str, pois: List[Dict[str, Any]], mode: str = DEFAULT_TRAVEL_MODE) -> CityMatrices:
+        """도시 POI 목록(좌표 있는 항목만 사용)의 행렬 반환"""
+        located = [poi for poi in pois if poi.get("lat") is not None and poi.get("lon") is not None]
+        signature = "|".join(f"{poi.get('id', poi.get('name'))}:{poi['lat']:.6f}:{poi['lon']:.6f}" for poi in located)
+        distance_key = self._key(city, "distance", signature)
+        time_key = self._key(city, mode, signature, repr(TRAVEL_MODES.get(mode)), repr(WALK_MAX_KM))
+
+        distances = self._load_or_build(distance_key, lambda: distance_matrix(
+            [poi["lat"] for poi in located], [poi["lon"] for poi in located]
+        ))
+        times = self._load_or_build(time_key, lambda: travel_time_matrix(np.asarray(distances), mode))
+        return CityMatrices(city, mode, [poi.get("id", poi.get("name")) for poi in located], distances, times)
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:24]
+
+    def _load_or_build(self, key: str, build) -> np.ndarray:
+        with self._lock:
+            matrix = self._loaded.get(key)
+            if matrix is not None:
+                return matrix
+
+            path = os.path.join(self.directory, f"{key}.npy") if self.directory else None
+            if path and os.path.exists(path):
+                try:
+                    matrix = np.load(path, mmap_mode="r")
+                except (OSError, ValueError) as e:
+                    print(f"행렬 캐시 로드 실패, 다시 계산합니다: {e}")
+            if matrix is None:
+                matrix = build()
+                if path:
+                    self._save(path, matrix)
+            self._loaded[key] = matrix
+            return matrix
+
+    def _save(self, path: str, matrix: np.ndarray):
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".npy.tmp")
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, matrix)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"행렬 캐시 저장 실패: {e}")
+
+    def clear(self):
+        """프로세스 안에서 열어 둔 행렬 해제 (파일은 유지)"""
+        with self._lock:
+            self._loaded.clear()
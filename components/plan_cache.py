@@ -0,0 +1,231 @@
+"""
+Plan Cache - plan_travel 결과를 정규화된 사용자 입력 기준으로 캐싱 (SQLite 디스크 저장)
+"""
+import os
+import json
+import time
+import math
+import sqlite3
+import hashlib
+import threading
+from array import array
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# 의미 유사도 비교 대상에서 제외하는 필드 (값이 다르면 다른 여행이므로 정확히 일치해야 함)
+PARTITION_FIELDS = ("destination", "duration")
+
+def canonicalize_user_input(user_input: Dict[str, Any]) -> Dict[str, Any]:
+    """사용자 입력 정규화 (공백/대소문자 통일, 목록 정렬, 빈 값 제거)"""
+    canonical = {}
+    for key, value in user_input.items():
+        if value is None or value == "" or value == [] or value == ():
+            continue
+        if isinstance(value, str):
+            value = " ".join(value.split()).lower()
+        elif isinstance(value, (list, tuple, set)):
+            value = sorted(" ".join(str(item).split()).lower() for item in value)
+        canonical[key] = value
+    return canonical
+
+def _cache_key(canonical: Dict[str, Any]) -> str:
+    """정규화된 입력의 해시 키"""
+    payload = json.dumps(canonical, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _partition(canonical: Dict[str, Any]) -> str:
+    """의미 유사도 검색 범위 (목적지 + 기간이 같은 항목끼리만 비교)"""
+    return "|".join(str(canonical.get(field, "")) for field in PARTITION_FIELDS)
+
+def _semantic_text(canonical: Dict[str, Any]) -> str:
+    """임베딩에 사용할 입력 설명 문자열"""
+    lines = []
+    for key in sorted(canonical):
+        value = canonical[key]
+        if isinstance(value, list):
+            value = ", ".join(value)
+        lines.append(f"{key}: {value}")
+    return "\n".join(lines)
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    """코사인 유사도"""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+class PlanCache:
+    """여행 계획 결과 캐시
+
+    - 1단계: 정규화된 user_input의 해시로 정확히 일치하는 항목 조회
+    - 2단계 (선택): 목적지/기간이 같은 항목 중 임베딩 유사도가 임계값 이상인 항목 조회
+    - TTL이 지난 항목은 무시/삭제하고, 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int = 86400,
+        max_entries: int = 500,
+        similarity_threshold: float = 0.0,
+        embeddings=None
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        # 임계값이 0 이하이면 의미 유사도 단계 비활성화
+        self.embeddings = embeddings if similarity_threshold > 0 else None
+
+        self._lock = threading.Lock()
+        self._counters = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS plan_cache (
+                    key TEXT PRIMARY KEY,
+                    partition TEXT NOT NULL,
+                    embedding BLOB,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_plan_cache_partition ON plan_cache(partition)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_plan_cache_last_accessed ON plan_cache(last_accessed)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """호출마다 새 연결 사용 (sqlite3 연결은 스레드 간 공유 불가), 종료 시 커밋 후 닫음"""
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, user_input: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """캐시된 계획 반환 (없으면 None)"""
+        canonical = canonicalize_user_input(user_input)
+        key = _cache_key(canonical)
+        now = time.time()
+        min_created = now - self.ttl_seconds
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT result FROM plan_cache WHERE key = ? AND created_at >= ?",
+                (key, min_created)
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE plan_cache SET last_accessed = ? WHERE key = ?", (now, key))
+                self._count("exact_hits")
+                return json.loads(row[0])
+
+        if self.embeddings is not None:
+            match = self._semantic_lookup(canonical, min_created)
+            if match:
+                matched_key, result = match
+                with self._connect() as conn:
+                    conn.execute("UPDATE plan_cache SET last_accessed = ? WHERE key = ?", (now, matched_key))
+                self._count("semantic_hits")
+                return result
+
+        self._count("misses")
+        return None
+
+    def _semantic_lookup(self, canonical: Dict[str, Any], min_created: float) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """같은 파티션에서 임베딩 유사도가 가장 높은 항목 조회"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT key, embedding FROM plan_cache WHERE partition = ? AND created_at >= ? AND embedding IS NOT NULL",
+                (_partition(canonical), min_created)
+            ).fetchall()
+        if not rows:
+            return None
+
+        query_vector = self._embed(canonical)
+        if query_vector is None:
+            return None
+
+        best_key, best_score = None, self.similarity_threshold
+        for key, blob in rows:
+            vector = array("f")
+            vector.frombytes(blob)
+            score = _cosine_similarity(query_vector, vector)
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+
+        with self._connect() as conn:
+            row = conn.execute("SELECT result FROM plan_cache WHERE key = ?", (best_key,)).fetchone()
+        if not row:
+            return None
+        print(f"의미 유사도 캐시 적중: 유사도 {best_score:.3f}")
+        return best_key, json.loads(row[0])
+
+    def _embed(self, canonical: Dict[str, Any]) -> Optional[List[float]]:
+        """입력 설명 임베딩 (실패 시 None)"""
+        try:
+            return list(self.embeddings.embed_query(_semantic_text(canonical)))
+        except Exception as e:
+            print(f"캐시 임베딩 실패: {e}")
+            return None
+
+    def put(self, user_input: Dict[str, Any], result: Dict[str, Any]):
+        """계획 결과 저장 후 만료/초과 항목 정리"""
+        canonical = canonicalize_user_input(user_input)
+        now = time.time()
+
+        embedding = None
+        if self.embeddings is not None:
+            vector = self._embed(canonical)
+            if vector is not None:
+                embedding = array("f", vector).tobytes()
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO plan_cache (key, partition, embedding, result, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (_cache_key(canonical), _partition(canonical), embedding,
+                 json.dumps(result, ensure_ascii=False), now, now)
+            )
+            expired = conn.execute(
+                "DELETE FROM plan_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            ).rowcount
+            overflow = conn.execute("SELECT COUNT(*) FROM plan_cache").fetchone()[0] - self.max_entries
+            evicted = 0
+            if overflow > 0:
+                evicted = conn.execute(
+                    "DELETE FROM plan_cache WHERE key IN "
+                    "(SELECT key FROM plan_cache ORDER BY last_accessed ASC LIMIT ?)",
+                    (overflow,)
+                ).rowcount
+
+        self._count("stores")
+        self._count("evictions", expired + evicted)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM plan_cache")
+
+    def _count(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 적중/미스 통계"""
+        with self._lock:
+            counters = dict(self._counters)
+        with self._connect() as conn:
+            counters["entries"] = conn.execute("SELECT COUNT(*) FROM plan_cache").fetchone()[0]
+
+        lookups = counters["exact_hits"] + counters["semantic_hits"] + counters["misses"]
+        counters["hit_rate"] = (counters["exact_hits"] + counters["semantic_hits"]) / lookups if lookups else 0.0
+        return counters
@@ -0,0 +1,206 @@
+"""
+Plan Jobs - 여행 계획 생성을 백그라운드 작업으로 실행하고 작업 ID로 진행 상황/결과를 조회
+"""
+import json
+import time
+import uuid
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from components.plan_cache import canonicalize_user_input
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+def _input_key(user_input: Dict[str, Any]) -> str:
+    """같은 입력으로 제출된 작업을 찾기 위한 키"""
+    payload = json.dumps(canonicalize_user_input(user_input), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class PlanJob:
+    """계획 생성 작업 하나의 상태와 이벤트 기록
+
+    stream_plan 이벤트를 모두 보관하므로, Streamlit이 스크립트를 다시 실행해도
+    처음부터 이벤트를 재생해 같은 화면을 복원할 수 있습니다.
+    """
+
+    def __init__(self, job_id: str, user_input: Dict[str, Any], input_key: str):
+        self.job_id = job_id
+        self.user_input = user_input
+        self.input_key = input_key
+        self.status = QUEUED
+        self.events: List[Dict[str, Any]] = []
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.future = None
+        # 이 작업을 기다리는 세션 수 (같은 입력 제출이 합쳐지면 증가, release로 감소)
+        self.holders = 1
+        self._condition = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def add_event(self, event: Dict[str, Any]):
+        with self._condition:
+            self.events.append(event)
+            self._condition.notify_all()
+
+    def set_status(self, status: str):
+        with self._condition:
+            self.status = status
+            if status == RUNNING:
+                self.started_at = time.time()
+            elif status in FINISHED_STATES:
+                self.finished_at = time.time()
+            self._condition.notify_all()
+
+    def wait_for_events(self, start: int, timeout: float) -> List[Dict[str, Any]]:
+        """start 이후의 이벤트 반환 (새 이벤트가 없으면 timeout 동안 대기)"""
+        with self._condition:
+            if len(self.events) <= start and not self.finished:
+                self._condition.wait(timeout)
+            return self.events[start:]
+
+class PlanJobManager:
+    """제한된 워커 풀에서 계획 생성 작업을 실행하는 관리자
+
+    - submit: 작업 ID 반환 (같은 입력의 작업이 대기/실행 중이면 그 작업 ID 재사용)
+    - get: 작업 ID로 진행 상황/결과 조회
+    - release: 세션이 작업을 더 기다리지 않음 (마지막 세션이 놓으면 대기 중인 작업 취소)
+    - 완료된 작업은 retention_seconds 동안 보관 후 정리
+    """
+
+    def __init__(self, coordinator_factory: Callable[[], Any], max_workers: int = 2, retention_seconds: int = 3600):
+        self.coordinator_factory = coordinator_factory
+        self.max_workers = max(1, max_workers)
+        self.retention_seconds = retention_seconds
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="plan-job")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, PlanJob] = {}
+        self._active_by_input: Dict[str, str] = {}
+        self._counters = {"submitted": 0, "deduplicated": 0, "completed": 0, "failed": 0, "cancelled": 0}
+        # 평균 대기/실행 시간은 최근 작업 기준으로 계산
+        self._wait_seconds: "deque[float]" = deque(maxlen=100)
+        self._run_seconds: "deque[float]" = deque(maxlen=100)
+
+    def submit(self, user_input: Dict[str, Any]) -> str:
+        """작업 제출 후 작업 ID 반환"""
+        input_key = _input_key(user_input)
+        with self._lock:
+            self._prune()
+
+            active_id = self._active_by_input.get(input_key)
+            if active_id and not self._jobs[active_id].finished:
+                self._jobs[active_id].holders += 1
+                self._counters["deduplicated"] += 1
+                return active_id
+
+            job = PlanJob(uuid.uuid4().hex, dict(user_input), input_key)
+            self._jobs[job.job_id] = job
+            self._active_by_input[input_key] = job.job_id
+            self._counters["submitted"] += 1
+            job.future = self._executor.submit(self._run, job)
+
+        print(f"계획 작업 제출: {job.job_id} (대기 {self.stats()['queue_depth']}건)")
+        return job.job_id
+
+    def get(self, job_id: str) -> Optional[PlanJob]:
+        """작업 조회 (없거나 정리된 작업이면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def release(self, job_id: str) -> bool:
+        """세션과 작업의 연결 해제 (다른 세션이 같은 작업을 기다리지 않으면 대기 중인 작업 취소, 취소했으면 True)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            job.holders = max(0, job.holders - 1)
+            # 같은 잠금 안에서 취소해야 그 사이 submit이 이 작업에 합류하지 않음
+            return job.holders == 0 and self._cancel_locked(job)
+
+    def cancel(self, job_id: str) -> bool:
+        """아직 시작되지 않은 작업 취소 (작업을 기다리는 다른 세션이 있어도 취소하므로 세션에서는 release 사용)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job is not None and self._cancel_locked(job)
+
+    def _cancel_locked(self, job: PlanJob) -> bool:
+        """대기 중인 작업 취소 (호출자가 _lock 보유)"""
+        if job.status != QUEUED or not job.future.cancel():
+            return False
+        job.set_status(CANCELLED)
+        self._counters["cancelled"] += 1
+        if self._active_by_input.get(job.input_key) == job.job_id:
+            del self._active_by_input[job.input_key]
+        return True
+
+    def _run(self, job: PlanJob):
+        job.set_status(RUNNING)
+        with self._lock:
+            self._wait_seconds.append(job.started_at - job.submitted_at)
+
+        try:
+            coordinator = self.coordinator_factory()
+            for event in coordinator.stream_plan(job.user_input):
+                job.add_event(event)
+                if event["type"] == "result":
+                    job.result = event["result"]
+            job.set_status(DONE)
+            self._finish(job, "completed")
+        except Exception as e:
+            print(f"계획 작업 실패 ({job.job_id}): {e}")
+            job.error = str(e)
+            job.set_status(FAILED)
+            self._finish(job, "failed")
+
+    def _finish(self, job: PlanJob, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+            if job.started_at is not None:
+                self._run_seconds.append(job.finished_at - job.started_at)
+            if self._active_by_input.get(job.input_key) == job.job_id:
+                del self._active_by_input[job.input_key]
+
+    def _prune(self):
+        """보관 기간이 지난 완료 작업 제거 (호출자가 _lock 보유)"""
+        cutoff = time.time() - self.retention_seconds
+        expired = [job_id for job_id, job in self._jobs.items() if job.finished and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def stats(self) -> Dict[str, Any]:
+        """모니터링용 큐 길이/워커 사용률 통계"""
+        with self._lock:
+            statuses = [job.status for job in self._jobs.values()]
+            counters = dict(self._counters)
+            wait_seconds = list(self._wait_seconds)
+            run_seconds = list(self._run_seconds)
+
+        running = statuses.count(RUNNING)
+        counters.update({
+            "queue_depth": statuses.count(QUEUED),
+            "running": running,
+            "max_workers": self.max_workers,
+            "utilization": running / self.max_workers,
+            "avg_wait_seconds": sum(wait_seconds) / len(wait_seconds) if wait_seconds else 0.0,
+            "avg_run_seconds": sum(run_seconds) / len(run_seconds) if run_seconds else 0.0,
+        })
+        return counters
+
+    def shutdown(self, wait: bool = False):
+        """워커 풀 종료"""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,331 @@
+"""
+POI Store - 관광지/숙박/식당/교통 정보를 SQLite(FTS5)에 보관하고 색인으로 조회
+"""
+import os
+import re
+import csv
+import json
+import math
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from components.text_match import compile_names, normalize_name
+
+POI_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "poi")
+POI_CATEGORIES = ("attraction", "accommodation", "restaurant", "transport")
+POI_FIELDS = ("city", "name", "category", "subcategory", "price_tier", "price", "rating", "lat", "lon", "tags", "description")
+IMPORT_BATCH_SIZE = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cities (
+    city TEXT PRIMARY KEY,
+    country TEXT,
+    currency TEXT,
+    lat REAL,
+    lon REAL,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS city_aliases (
+    alias TEXT PRIMARY KEY,
+    city TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pois (
+    id INTEGER PRIMARY KEY,
+    city TEXT NOT NULL,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    subcategory TEXT,
+    price_tier INTEGER,
+    price TEXT,
+    rating REAL,
+    lat REAL,
+    lon REAL,
+    tags TEXT,
+    description TEXT,
+    UNIQUE (city, category, name)
+);
+CREATE INDEX IF NOT EXISTS idx_pois_city_category_tier ON pois (city, category, price_tier);
+CREATE INDEX IF NOT EXISTS idx_pois_lat_lon ON pois (lat, lon);
+CREATE VIRTUAL TABLE IF NOT EXISTS pois_fts USING fts5(
+    name, subcategory, tags, description,
+    content='pois', content_rowid='id'
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_TOKEN = re.compile(r'\w+')
+
+def _fts_query(text: str) -> Optional[str]:
+    """자유 문장을 FTS5 OR 접두 검색식으로 변환 ("현지 음식" → "현지"* OR "음식"*)"""
+    tokens = _TOKEN.findall(text or "")
+    return " OR ".join(f'"{token}"*' for token in tokens) if tokens else None
+
+def _read_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """CSV / JSON 배열 / JSON Lines 파일을 행 단위로 읽음 (CSV·JSONL은 스트리밍)"""
+    if path.endswith(".csv"):
+        with open(path, encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+    elif path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            yield from json.load(f)
+    else:
+        raise ValueError(f"지원하지 않는 POI 데이터 형식: {path}")
+
+def _is_cities_file(path: str) -> bool:
+    """도시 목록 파일인지 (파일 이름에 "cities" 포함)"""
+    return "cities" in os.path.basename(path)
+
+def _float_or_none(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+class POIStore:
+    """도시별 POI 저장소
+
+    (city, category, price_tier)와 (lat, lon) 색인, 이름/태그/설명 FTS5 색인을 사용하며,
+    연결 하나를 잠금으로 보호해 여러 스레드(병렬 도구 실행)에서 공유합니다.
+    도시 이름과 별칭은 하나의 정규식으로 컴파일해 "파리, 프랑스" 같은 입력에서 도시를 찾습니다
+    (단어 단위로 맞추므로 "Jerome"이나 "파리지앵"은 도시로 보지 않음).
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        self._city_pattern: Optional["re.Pattern[str]"] = None
+        self._aliases: Dict[str, str] = {}
+        self._refresh_aliases()
+
+    # 데이터 적재
+    def import_cities(self, rows: Iterable[Dict[str, Any]]) -> int:
+        with self._lock, self._conn:
+            count = self._insert_cities(rows)
+        self._refresh_aliases()
+        return count
+
+    def import_pois(self, rows: Iterable[Dict[str, Any]], batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """POI 대량 적재 (batch_size 단위 executemany, 한 트랜잭션, FTS 색인은 마지막에 한 번 재구축)"""
+        with self._lock, self._conn:
+            count = self._insert_pois(rows, batch_size)
+            self._conn.execute("INSERT INTO pois_fts (pois_fts) VALUES ('rebuild')")
+        return count
+
+    def import_file(self, path: str) -> int:
+        """파일 하나 적재 (파일 이름에 "cities"가 있으면 도시 목록, 아니면 POI 목록)"""
+        if _is_cities_file(path):
+            return self.import_cities(_read_rows(path))
+        return self.import_pois(_read_rows(path))
+
+    def import_directory(self, directory: str = POI_DATA_DIR) -> int:
+        """디렉토리의 데이터 파일로 저장소 전체를 교체하고 데이터 버전을 기록
+
+        기존 도시/POI를 지우고 도시 목록부터 다시 적재하므로 원본에서 빠진 항목은 남지 않습니다.
+        한 트랜잭션에서 처리해 다른 스레드는 교체 전이나 후의 데이터만 봅니다.
+        """
+        paths = sorted(
+            (os.path.join(directory, name) for name in os.listdir(directory) if name.endswith((".csv", ".json", ".jsonl"))),
+            key=lambda path: (not _is_cities_file(path), path)
+        )
+        count = 0
+        with self._lock, self._conn:
+            for table in ("pois", "city_aliases", "cities"):
+                self._conn.execute(f"DELETE FROM {table}")
+            for path in paths:
+                rows = _read_rows(path)
+                count += self._insert_cities(rows) if _is_cities_file(path) else self._insert_pois(rows, IMPORT_BATCH_SIZE)
+            self._conn.execute("INSERT INTO pois_fts (pois_fts) VALUES ('rebuild')")
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", ("data_version", data_version(directory)))
+        self._refresh_aliases()
+        print(f"POI 데이터 적재 완료: {count}건 ({directory})")
+        return count
+
+    def _insert_cities(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """도시/별칭 쓰기 (호출자가 _lock과 트랜잭션 보유)"""
+        count = 0
+        for row in rows:
+            city = row["city"].strip()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cities (city, country, currency, lat, lon, description) VALUES (?, ?, ?, ?, ?, ?)",
+                (city, row.get("country"), row.get("currency"), _float_or_none(row.get("lat")),
+                 _float_or_none(row.get("lon")), row.get("description"))
+            )
+            aliases = row.get("aliases") or ""
+            if isinstance(aliases, str):
+                aliases = aliases.split("|")
+            for alias in [city, *aliases]:
+                if alias and alias.strip():
+                    self._conn.execute("INSERT OR REPLACE INTO city_aliases (alias, city) VALUES (?, ?)", (alias.strip().lower(), city))
+            count += 1
+        return count
+
+    def _insert_pois(self, rows: Iterable[Dict[str, Any]], batch_size: int) -> int:
+        """POI 쓰기 (호출자가 _lock과 트랜잭션 보유, FTS 재구축은 호출자가 처리)"""
+        count = 0
+        batch: List[Sequence[Any]] = []
+        sql = f"INSERT OR REPLACE INTO pois ({', '.join(POI_FIELDS)}) VALUES ({', '.join('?' * len(POI_FIELDS))})"
+
+        for row in rows:
+            tags = row.get("tags") or ""
+            if isinstance(tags, (list, tuple)):
+                tags = " ".join(tags)
+            price_tier = _float_or_none(row.get("price_tier"))
+            batch.append((
+                row["city"].strip(), row["name"].strip(), row["category"].strip(), row.get("subcategory") or "",
+                int(price_tier) if price_tier is not None else None, row.get("price") or "",
+                _float_or_none(row.get("rating")), _float_or_none(row.get("lat")), _float_or_none(row.get("lon")),
+                tags, row.get("description") or ""
+            ))
+            if len(batch) >= batch_size:
+                self._conn.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._conn.executemany(sql, batch)
+            count += len(batch)
+        return count
+
+    def _refresh_aliases(self):
+        with self._lock:
+            self._aliases = {normalize_name(row["alias"]): row["city"] for row in self._conn.execute("SELECT alias, city FROM city_aliases")}
+        self._city_pattern = compile_names(self._aliases)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    # 조회
+    def resolve_city(self, destination: str) -> Optional[str]:
+        """입력 문자열에 단어로 들어 있는 도시 이름 (별칭 포함, 없으면 None)"""
+        match = self._city_pattern.search(destination or "") if self._city_pattern else None
+        return self._aliases[normalize_name(match.group("name"))] if match else None
+
+    def city_info(self, city: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM cities WHERE city = ?", (city,)).fetchone()
+        return dict(row) if row else None
+
+    def search(
+        self,
+        city: str,
+        category: Optional[str] = None,
+        text: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        max_price_tier: Optional[int] = None,
+        near: Optional[Sequence[float]] = None,
+        radius_km: Optional[float] = None,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """도시의 POI 검색
+
+        text가 있으면 FTS5로 이름/태그/설명을 검색해 관련도(BM25) 순, 없으면 평점 순으로
+        정렬합니다. near/radius_km는 위경도 색인으로 사각 범위를 먼저 거른 뒤 거리로 확인합니다.
+        """
+        conditions, params = ["p.city = ?"], [city]
+        if category:
+            conditions.append("p.category = ?")
+            params.append(category)
+        if subcategory:
+            conditions.append("p.subcategory = ?")
+            params.append(subcategory)
+        if max_price_tier is not None:
+            conditions.append("p.price_tier <= ?")
+            params.append(int(max_price_tier))
+        if near is not None and radius_km:
+            lat, lon = near
+            dlat = radius_km / 111.0
+            dlon = radius_km / (111.0 * max(math.cos(math.radians(lat)), 0.01))
+            conditions.append("p.lat BETWEEN ? AND ? AND p.lon BETWEEN ? AND ?")
+            params.extend([lat - dlat, lat + dlat, lon - dlon, lon + dlon])
+
+        query = _fts_query(text) if text else None
+        if query:
+            sql = (f"SELECT p.* FROM pois_fts JOIN pois p ON p.id = pois_fts.rowid "
+                   f"WHERE pois_fts MATCH ? AND {' AND '.join(conditions)} ORDER BY bm25(pois_fts), p.rating DESC LIMIT ?")
+            params = [query, *params]
+        else:
+            sql = f"SELECT p.* FROM pois p WHERE {' AND '.join(conditions)} ORDER BY p.rating DESC, p.id LIMIT ?"
+        # 반경 검색은 사각 범위 밖 모서리를 거리로 다시 거르므로 여유 있게 가져옴
+        params.append(limit * 4 if near is not None and radius_km else limit)
+
+        with self._lock:
+            rows = [dict(row) for row in self._conn.execute(sql, params)]
+
+        if near is not None and radius_km:
+            rows = [row for row in rows if row["lat"] is not None and haversine_km(near[0], near[1], row["lat"], row["lon"]) <= radius_km]
+        return rows[:limit]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pois").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def format_pois(rows: List[Dict[str, Any]]) -> str:
+    """도구 응답용 POI 목록 문자열"""
+    lines = []
+    for index, row in enumerate(rows, 1):
+        detail = " / ".join(part for part in (row.get("subcategory"), row.get("price")) if part)
+        line = f"{index}. {row['name']}" + (f" ({detail})" if detail else "")
+        if row.get("rating"):
+            line += f" ★{row['rating']:.1f}"
+        if row.get("description"):
+            line += f" - {row['description']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+def unknown_city_message(destination: str) -> str:
+    return f"로컬 POI 데이터에 '{destination}' 정보가 없습니다. 일반적인 여행 지식을 바탕으로 계획하세요."
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 위경도 사이의 대원 거리 (km)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi, dlambda = phi2 - phi1, math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * 6371.0 * math.asin(math.sqrt(a))
+
+def data_version(directory: str = POI_DATA_DIR) -> str:
+    """데이터 파일 이름/크기/수정 시각으로 만든 버전 문자열 (파일이 바뀌면 다시 적재)"""
+    entries = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith((".csv", ".json", ".jsonl")):
+            stat = os.stat(os.path.join(directory, name))
+            entries.append(f"{name}:{stat.st_size}:{int(stat.st_mtime)}")
+    return "|".join(entries)
+
+def open_poi_store(path: str = ":memory:", data_dir: str = POI_DATA_DIR) -> POIStore:
+    """POI 저장소 열기 (데이터 파일이 저장된 버전과 다르면 다시 적재)"""
+    store = POIStore(path)
+    if store.get_meta("data_version") != data_version(data_dir):
+        store.import_directory(data_dir)
+    return store
+
+_default_store: Optional[POIStore] = None
+_default_store_lock = threading.Lock()
+
+def get_default_poi_store() -> POIStore:
+    """번들 데이터를 메모리에 적재한 공유 저장소 (레지스트리 없이 도구를 만들 때 사용)"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = open_poi_store()
+        return _default_store
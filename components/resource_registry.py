@@ -0,0 +1,246 @@
+"""
+Resource Registry - LLM, 임베딩, 벡터스토어, 도구, Coordinator Agent를 프로세스 전역에서 재사용
+"""
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import config.config as config
+
+# 설정이 바뀌어도 유지하는 리소스 (작업 관리자는 작업마다 레지스트리에서 Coordinator를 다시 가져오므로
+# 새 설정이 다음 작업부터 적용되고, 교체하면 실행 중인 작업과 워커 풀을 잃음)
+PERSISTENT_RESOURCES = ("job_manager",)
+
+def _shutdown(resources: Dict[str, Any]):
+    """워커 풀을 가진 리소스 종료"""
+    job_manager = resources.get("job_manager")
+    if job_manager is not None:
+        job_manager.shutdown()
+
+class ResourceRegistry:
+    """설정 지문(fingerprint)별로 무거운 리소스를 한 번만 생성해 보관하는 레지스트리
+
+    Streamlit은 위젯이 바뀔 때마다 스크립트를 다시 실행하므로, LLM/Chroma/Agent를
+    세션 상태가 아닌 프로세스 전역 레지스트리에 두고 모든 세션이 공유합니다.
+    .env 또는 환경 변수 값이 바뀌면 지문이 달라지고 캐시된 리소스가 무효화됩니다.
+    단, PERSISTENT_RESOURCES(작업 관리자)는 유지하므로 PLAN_JOB_* 설정은 재시작 후에 적용됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._fingerprint: Optional[str] = None
+        self._resources: Dict[str, Any] = {}
+        # 리소스 캐시를 비울 때마다 증가 (생성 중에 설정이 바뀌었는지 확인)
+        self._generation = 0
+        self._build_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """name에 해당하는 리소스 반환 (없으면 factory로 생성 후 캐싱)
+
+        factory는 전역 잠금 밖에서 실행하므로 서로 다른 리소스는 동시에 만들 수 있고,
+        같은 리소스는 이름별 잠금으로 한 번만 만듭니다. 생성 중에 설정이 바뀌었으면
+        (PERSISTENT_RESOURCES가 아니면) 만든 리소스를 버리고 새 설정으로 다시 만듭니다.
+        """
+        with self._lock:
+            self._check_fingerprint()
+            if name in self._resources:
+                return self._resources[name]
+            build_lock = self._build_locks.setdefault(name, threading.Lock())
+
+        with build_lock:
+            while True:
+                with self._lock:
+                    self._check_fingerprint()
+                    if name in self._resources:
+                        return self._resources[name]
+                    generation = self._generation
+
+                print(f"리소스 생성: {name}")
+                resource = factory()
+
+                with self._lock:
+                    if generation == self._generation or name in PERSISTENT_RESOURCES:
+                        self._resources[name] = resource
+                        return resource
+                print(f"리소스 생성 중 설정이 바뀌어 다시 생성합니다: {name}")
+
+    def invalidate(self):
+        """캐시된 모든 리소스 제거 (작업 관리자도 종료)"""
+        with self._lock:
+            resources = dict(self._resources)
+            self._clear(keep=())
+            self._fingerprint = None
+        _shutdown(resources)
+
+    def _clear(self, keep=PERSISTENT_RESOURCES):
+        """keep을 제외한 리소스 캐시 비우기 (호출자가 _lock 보유)"""
+        self._resources = {name: resource for name, resource in self._resources.items() if name in keep}
+        self._generation += 1
+
+    def _check_fingerprint(self):
+        """설정 지문이 바뀌었으면 설정을 다시 읽고 리소스 캐시를 비움"""
+        fingerprint = config.get_config_fingerprint()
+        if fingerprint == self._fingerprint:
+            return
+
+        if self._fingerprint is not None:
+            print("설정 변경이 감지되어 캐시된 리소스를 초기화합니다.")
+            config.reload_config()
+        self._clear()
+        self._fingerprint = fingerprint
+
+    # 리소스별 접근자
+    def get_llm(self):
+        """LLM 클라이언트 반환 (API 키가 없으면 None)"""
+        return self.get("llm", _build_llm)
+
+    def get_embeddings(self):
+        """임베딩 모델 반환 (Azure OpenAI 설정이 없으면 None)"""
+        return self.get("embeddings", _build_embeddings)
+
+    def get_vectorstore(self):
+        """ChromaDB vectorstore 반환 (로드 실패 시 None)"""
+        return self.get("vectorstore", lambda: _build_vectorstore(self.get_embeddings()))
+
+    def get_retriever(self):
+        """RAG 하이브리드 검색기 반환 (BM25 색인 + vectorstore, 둘 다 없으면 None)"""
+        return self.get("retriever", lambda: _build_retriever(self.get_vectorstore()))
+
+    def get_tools(self):
+        """ReAct Tool 목록 반환"""
+        return self.get("tools", lambda: _build_tools(self))
+
+    def get_coordinator(self):
+        """TravelCoordinatorAgent (AgentExecutor 포함) 반환"""
+        return self.get("coordinator", lambda: _build_coordinator(self))
+
+    def get_job_manager(self):
+        """백그라운드 계획 작업 관리자 반환 (작업 실행 시점의 Coordinator 사용)"""
+        return self.get("job_manager", lambda: _build_job_manager(self))
+
+    def get_poi_store(self):
+        """로컬 POI 저장소 반환 (번들 데이터가 바뀌었으면 다시 적재)"""
+        return self.get("poi_store", _build_poi_store)
+
+    def get_matrix_cache(self):
+        """도시별 POI 거리/이동 시간 행렬 캐시 반환"""
+        return self.get("matrix_cache", _build_matrix_cache)
+
+    def get_fx_rates(self):
+        """비용 환산용 환율표 반환 (로컬 캐시 우선)"""
+        return self.get("fx_rates", _build_fx_rates)
+
+def _build_llm():
+    """LLM 초기화 (Azure OpenAI 우선, 없으면 OpenAI, 둘 다 없으면 None)"""
+    from langchain_openai import ChatOpenAI, AzureChatOpenAI
+
+    try:
+        if config.has_valid_azure_openai_config():
+            return AzureChatOpenAI(
+                azure_endpoint=config.AOAI_ENDPOINT,
+                azure_deployment=config.AOAI_DEPLOY_GPT4O,
+                openai_api_version=config.AOAI_API_VERSION,
+                temperature=0.7,
+                api_key=config.AOAI_API_KEY,
+                streaming=True,  # 최종 답변 토큰을 콜백으로 받아 화면에 바로 표시
+                stream_usage=True  # 스트리밍 응답에도 토큰 사용량(usage_metadata)을 포함
+            )
+
+        if config.has_valid_openai_config():
+            return ChatOpenAI(
+                model=config.OPENAI_MODEL,
+                temperature=0.7,
+                api_key=config.OPENAI_API_KEY,
+                streaming=True,
+                stream_usage=True
+            )
+    except Exception as e:
+        print(f"LLM 초기화 실패: {e}")
+
+    return None
+
+def _build_embeddings():
+    """임베딩 모델 초기화"""
+    if not config.is_valid_api_key(config.AOAI_API_KEY):
+        return None
+    return config.get_embeddings()
+
+def _build_vectorstore(embeddings):
+    """ChromaDB vectorstore 로드"""
+    from agents.coordinator import load_vectorstore
+    return load_vectorstore(embeddings)
+
+def _build_retriever(vectorstore):
+    """BM25 색인을 로드해 vectorstore와 묶은 하이브리드 검색기 구성"""
+    from agents.coordinator import load_retriever
+    return load_retriever(vectorstore)
+
+def _build_tools(registry: ResourceRegistry):
+    """ReAct Tools 초기화 (검색 도구는 POI 저장소/행렬 캐시, 예산 도구는 환율표를 레지스트리와 공유)"""
+    from tools import (
+        SearchDestinationTool, WeatherTool, AccommodationSearchTool,
+        RestaurantSearchTool, TransportationTool, BudgetCalculatorTool,
+        ItineraryOptimizerTool
+    )
+
+    poi_store = registry.get_poi_store()
+    matrix_cache = registry.get_matrix_cache()
+    return [
+        SearchDestinationTool(poi_store=poi_store),
+        WeatherTool(),
+        AccommodationSearchTool(poi_store=poi_store),
+        RestaurantSearchTool(poi_store=poi_store),
+        TransportationTool(poi_store=poi_store, matrix_cache=matrix_cache),
+        BudgetCalculatorTool(fx_rates=registry.get_fx_rates()),
+        ItineraryOptimizerTool(poi_store=poi_store, matrix_cache=matrix_cache)
+    ]
+
+def _build_coordinator(registry: ResourceRegistry):
+    """Coordinator Agent 초기화 (레지스트리의 LLM/도구/vectorstore 공유)"""
+    from agents import TravelCoordinatorAgent
+
+    return TravelCoordinatorAgent(
+        registry.get_llm(),
+        registry.get_tools(),
+        vectorstore=registry.get_vectorstore(),
+        embeddings=registry.get_embeddings(),
+        retriever=registry.get_retriever()
+    )
+
+def _build_job_manager(registry: ResourceRegistry):
+    """계획 작업 관리자 초기화"""
+    from components.plan_jobs import PlanJobManager
+
+    return PlanJobManager(
+        registry.get_coordinator,
+        max_workers=config.PLAN_JOB_WORKERS,
+        retention_seconds=config.PLAN_JOB_RETENTION_SECONDS
+    )
+
+def _build_poi_store():
+    """POI 저장소 열기"""
+    from components.poi_store import open_poi_store
+
+    return open_poi_store(config.POI_DB_PATH)
+
+def _build_matrix_cache():
+    """행렬 캐시 초기화 (MATRIX_CACHE_DIR이 비어 있으면 프로세스 메모리에만 보관)"""
+    from components.matrix_cache import MatrixCache
+
+    return MatrixCache(config.MATRIX_CACHE_DIR or None)
+
+def _build_fx_rates():
+    """환율표 로드 (캐시가 오래되었고 FX_RATES_URL이 있으면 다시 조회)"""
+    from components.cost_engine import FXRates
+
+    return FXRates.load(
+        config.FX_CACHE_PATH,
+        ttl_seconds=config.FX_CACHE_TTL_SECONDS,
+        url=config.FX_RATES_URL or None,
+        base=config.COST_CURRENCY
+    )
+
+_registry = ResourceRegistry()
+
+def get_resource_registry() -> ResourceRegistry:
+    """프로세스 전역 ResourceRegistry 반환"""
+    return _registry
@@ -0,0 +1,281 @@
+"""
+Route Optimizer - 좌표가 있는 POI를 날짜별로 묶고 하루 동선을 정렬 (NumPy, LLM 호출 없음)
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from components.activity_classifier import parse_time_range
+
+EARTH_RADIUS_KM = 6371.0
+
+# 여행 페이스별 하루 일정 (시작/종료 분, 최대 방문지 수, 방문지 사이 여유 시간)
+PACE_SETTINGS: Dict[str, Dict[str, int]] = {
+    "느긋하게": {"day_start": 10 * 60, "day_end": 18 * 60, "max_stops": 3, "buffer_minutes": 30},
+    "보통": {"day_start": 9 * 60, "day_end": 19 * 60, "max_stops": 5, "buffer_minutes": 20},
+    "빠르게": {"day_start": 8 * 60, "day_end": 21 * 60, "max_stops": 7, "buffer_minutes": 10},
+}
+DEFAULT_PACE = "보통"
+
+# 이동 수단별 (평균 속도 km/h, 대기/승차 준비 분) - "혼합"은 가까우면 도보, 멀면 대중교통
+TRAVEL_MODES: Dict[str, Tuple[float, float]] = {
+    "도보": (4.5, 0.0),
+    "대중교통": (18.0, 10.0),
+    "택시": (25.0, 5.0),
+}
+DEFAULT_TRAVEL_MODE = "혼합"
+WALK_MAX_KM = 1.5
+# 교통수단 선호 문자열 → 이동 수단
+TRAVEL_MODE_KEYWORDS = {
+    "택시": "택시", "렌터카": "택시", "자동차": "택시", "우버": "택시",
+    "도보": "도보", "걷기": "도보",
+}
+
+# POI에 방문 시간/운영 시간이 없을 때 세부 분류별 기본값
+DEFAULT_VISIT_MINUTES = 90
+VISIT_MINUTES = {
+    "박물관": 180, "미술관": 150, "궁전": 180, "궁궐": 120, "테마파크": 360, "성": 120,
+    "유적": 120, "랜드마크": 90, "전망": 60, "시장": 90, "공원": 60, "거리": 60,
+    "자연": 150, "해변": 120, "크루즈": 90, "사원": 60, "사찰": 60, "신사": 45,
+    "건축": 60, "한옥마을": 90,
+}
+DEFAULT_OPENING_HOURS = (9 * 60, 18 * 60)
+OPENING_HOURS = {
+    "랜드마크": (9 * 60, 23 * 60), "전망": (9 * 60, 23 * 60), "시장": (8 * 60, 20 * 60),
+    "크루즈": (10 * 60, 22 * 60), "테마파크": (9 * 60, 21 * 60),
+    "공원": (0, 24 * 60), "거리": (0, 24 * 60), "자연": (0, 24 * 60), "해변": (0, 24 * 60),
+    "건축": (0, 24 * 60), "한옥마을": (0, 24 * 60),
+}
+
+def distance_matrix(lat: Sequence[float], lon: Sequence[float]) -> np.ndarray:
+    """위경도 배열의 쌍별 대원 거리 행렬 (km)"""
+    phi = np.radians(np.asarray(lat, dtype=np.float64))
+    lam = np.radians(np.asarray(lon, dtype=np.float64))
+    dphi = phi[:, None] - phi[None, :]
+    dlam = lam[:, None] - lam[None, :]
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi)[:, None] * np.cos(phi)[None, :] * np.sin(dlam / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def _mode_minutes(distances: np.ndarray, mode: str) -> np.ndarray:
+    speed, wait = TRAVEL_MODES[mode]
+    return distances / speed * 60 + wait
+
+def travel_time_matrix(distances: np.ndarray, mode: str = DEFAULT_TRAVEL_MODE) -> np.ndarray:
+    """거리 행렬(km) → 이동 수단별 이동 시간 행렬(분)"""
+    if mode in TRAVEL_MODES:
+        times = _mode_minutes(distances, mode)
+    else:
+        times = np.where(distances <= WALK_MAX_KM, _mode_minutes(distances, "도보"), _mode_minutes(distances, "대중교통"))
+    np.fill_diagonal(times, 0.0)
+    return times
+
+def resolve_travel_mode(preferences: str) -> str:
+    """교통수단 선호 문자열의 이동 수단 (도보만 원하면 도보, 택시/렌터카면 택시, 그 외 혼합)"""
+    modes = {mode for keyword, mode in TRAVEL_MODE_KEYWORDS.items() if keyword in (preferences or "")}
+    if modes == {"도보"} and "대중교통" not in preferences:
+        return "도보"
+    return "택시" if "택시" in modes else DEFAULT_TRAVEL_MODE
+
+def kmeans(points: np.ndarray, k: int, iterations: int = 50, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """(레이블, 중심) 반환 - k-means++ 초기화, 시드 고정으로 같은 입력이면 같은 결과"""
+    rng = np.random.default_rng(seed)
+    n = len(points)
+    centroids = np.empty((k, points.shape[1]))
+    centroids[0] = points[rng.integers(n)]
+    closest = ((points - centroids[0]) ** 2).sum(axis=1)
+    for index in range(1, k):
+        total = closest.sum()
+        choice = rng.choice(n, p=closest / total) if total > 0 else rng.integers(n)
+        centroids[index] = points[choice]
+        closest = np.minimum(closest, ((points - centroids[index]) ** 2).sum(axis=1))
+
+    labels = np.zeros(n, dtype=np.int64)
+    for _ in range(iterations):
+        squared = ((points[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+        new_labels = squared.argmin(axis=1)
+        counts = np.bincount(new_labels, minlength=k)
+        for axis in range(points.shape[1]):
+            sums = np.bincount(new_labels, weights=points[:, axis], minlength=k)
+            # 빈 군집은 이전 중심 유지
+            centroids[:, axis] = np.where(counts > 0, sums / np.maximum(counts, 1), centroids[:, axis])
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    return labels, centroids
+
+def assign_with_capacity(points: np.ndarray, centroids: np.ndarray, capacity: int) -> np.ndarray:
+    """하루 방문지 수 제한을 지키며 각 점을 가까운 중심에 배정
+
+    가장 가까운 중심과 차선 중심의 차이(양보 비용)가 큰 점부터 배정합니다.
+    """
+    squared = ((points[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+    preference = np.argsort(squared, axis=1)
+    if centroids.shape[0] > 1:
+        ordered = np.take_along_axis(squared, preference[:, :2], axis=1)
+        regret = ordered[:, 1] - ordered[:, 0]
+    else:
+        regret = np.zeros(len(points))
+
+    remaining = np.full(centroids.shape[0], capacity)
+    labels = np.empty(len(points), dtype=np.int64)
+    for index in np.argsort(-regret, kind="stable"):
+        for cluster in preference[index]:
+            if remaining[cluster] > 0:
+                labels[index] = cluster
+                remaining[cluster] -= 1
+                break
+    return labels
+
+def nearest_neighbour_route(distances: np.ndarray, start: int = 0) -> List[int]:
+    """가장 가까운 미방문 지점으로 이동하는 초기 경로"""
+    n = len(distances)
+    visited = np.zeros(n, dtype=bool)
+    route = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, distances[route[-1]])
+        nxt = int(row.argmin())
+        route.append(nxt)
+        visited[nxt] = True
+    return route
+
+def two_opt(route: List[int], distances: np.ndarray, max_passes: int = 20) -> List[int]:
+    """열린 경로(출발점 고정)에 대한 2-opt 개선
+
+    구간 route[i..j]를 뒤집었을 때의 거리 변화를 i마다 모든 j에 대해 한 번에 계산합니다.
+    """
+    route = np.asarray(route)
+    m = len(route)
+    if m < 4:
+        return route.tolist()
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, m - 1):
+            j = np.arange(i + 1, m)
+            prev, first, last = route[i - 1], route[i], route[j]
+            after = np.append(route[j[:-1] + 1], -1)
+            delta = distances[prev, last] - distances[prev, first]
+            has_next = after >= 0
+            delta[has_next] += distances[first, after[has_next]] - distances[last[has_next], after[has_next]]
+            best = int(delta.argmin())
+            if delta[best] < -1e-9:
+                end = j[best]
+                route[i:end + 1] = route[i:end + 1][::-1]
+                improved = True
+        if not improved:
+            break
+    return route.tolist()
+
+def _poi_schedule_defaults(poi: Dict[str, Any]) -> Tuple[int, int, int]:
+    """(개장 분, 폐장 분, 방문 분) - POI 값이 없으면 세부 분류별 기본값"""
+    subcategory = poi.get("subcategory") or ""
+    opening, closing = OPENING_HOURS.get(subcategory, DEFAULT_OPENING_HOURS)
+    if poi.get("opening_hours"):
+        parsed_open, parsed_close = parse_time_range(poi["opening_hours"])
+        if parsed_open is not None:
+            opening = parsed_open
+        if parsed_close is not None:
+            closing = parsed_close
+    visit = poi.get("visit_minutes") or VISIT_MINUTES.get(subcategory, DEFAULT_VISIT_MINUTES)
+    return opening, closing, int(visit)
+
+def _format_clock(minutes: float) -> str:
+    minutes = int(round(minutes))
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+def optimize_route(
+    pois: List[Dict[str, Any]],
+    days: int,
+    pace: str = DEFAULT_PACE,
+    seed: int = 0,
+    matrices: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    mode: str = DEFAULT_TRAVEL_MODE
+) -> Dict[str, Any]:
+    """POI(우선순위 순)를 날짜별로 묶고 하루 동선과 방문 시각을 계산
+
+    matrices는 pois 순서와 같은 (거리, 이동 시간) 행렬로, 주면 다시 계산하지 않습니다
+    (MatrixCache.subset 결과).
+
+    1. 페이스의 하루 최대 방문지 수 × 일수만큼 우선순위 높은 POI를 고름
+    2. k-means로 지역별로 묶은 뒤 하루 방문지 수 제한에 맞춰 재배정
+    3. 하루 안에서 최근접 이웃 + 2-opt로 이동 거리를 줄이고 운영 시간에 맞춰 시각 배정
+       (폐장 뒤 도착하거나 하루 일정 안에 끝나지 않는 곳은 unscheduled로 돌려줌)
+    """
+    settings = PACE_SETTINGS.get(pace, PACE_SETTINGS[DEFAULT_PACE])
+    days = max(int(days), 1)
+    located = [index for index, poi in enumerate(pois) if poi.get("lat") is not None and poi.get("lon") is not None]
+    located = located[:days * settings["max_stops"]]
+    selected = [pois[index] for index in located]
+    result = {"pace": pace if pace in PACE_SETTINGS else DEFAULT_PACE, "days": [], "unscheduled": []}
+    if not selected:
+        result["days"] = [{"day": day, "stops": [], "total_km": 0.0} for day in range(1, days + 1)]
+        return result
+
+    lat = np.array([poi["lat"] for poi in selected], dtype=np.float64)
+    lon = np.array([poi["lon"] for poi in selected], dtype=np.float64)
+    if matrices is not None:
+        distances, times = (np.asarray(matrix)[np.ix_(located, located)] for matrix in matrices)
+    else:
+        distances = distance_matrix(lat, lon)
+        times = travel_time_matrix(distances, mode)
+
+    # 군집화는 평면 근사 좌표(경도에 cos(위도) 보정)로 수행
+    points = np.column_stack([lat, lon * np.cos(np.radians(lat.mean()))])
+    k = min(days, len(selected))
+    _, centroids = kmeans(points, k, seed=seed)
+    labels = assign_with_capacity(points, centroids, settings["max_stops"])
+
+    # 중심 경도 순으로 날짜를 매겨 인접한 지역이 연달아 오도록 함
+    day_order = np.argsort(centroids[:, 1], kind="stable")
+    for day_index, cluster in enumerate(day_order, 1):
+        members = np.flatnonzero(labels == cluster)
+        stops, total_km = [], 0.0
+        if len(members):
+            local = distances[np.ix_(members, members)]
+            # 중심에서 가장 먼 곳을 출발점으로 두면 열린 경로의 끝점이 됨
+            start = int(((points[members] - centroids[cluster]) ** 2).sum(axis=1).argmax())
+            route = two_opt(nearest_neighbour_route(local, start), local)
+
+            clock, previous = float(settings["day_start"]), None
+            for position in route:
+                index = int(members[position])
+                poi = selected[index]
+                opening, closing, visit = _poi_schedule_defaults(poi)
+                travel = 0.0 if previous is None else float(times[previous, index])
+                buffer = 0 if previous is None else settings["buffer_minutes"]
+                arrive = max(clock + travel + buffer, float(opening))
+                depart = arrive + visit
+                if depart > min(closing, settings["day_end"]):
+                    result["unscheduled"].append(poi["name"])
+                    continue
+                distance = 0.0 if previous is None else float(distances[previous, index])
+                total_km += distance
+                stops.append({
+                    "name": poi["name"],
+                    "subcategory": poi.get("subcategory") or "",
+                    "arrive": _format_clock(arrive),
+                    "depart": _format_clock(depart),
+                    "distance_km": round(distance, 2),
+                    "travel_minutes": round(travel),
+                })
+                clock, previous = depart, index
+        result["days"].append({"day": day_index, "stops": stops, "total_km": round(total_km, 2)})
+
+    for day_index in range(k + 1, days + 1):
+        result["days"].append({"day": day_index, "stops": [], "total_km": 0.0})
+    return result
+
+def format_route_plan(plan: Dict[str, Any]) -> str:
+    """도구 응답용 일자별 동선 문자열"""
+    lines = []
+    for day in plan["days"]:
+        if not day["stops"]:
+            lines.append(f"{day['day']}일차: 자유 일정")
+            continue
+        lines.append(f"{day['day']}일차 (이동 {day['total_km']:.1f}km):")
+        for stop in day["stops"]:
+            move = f" ← 이동 {stop['travel_minutes']}분" if stop["travel_minutes"] else ""
+            lines.append(f"  - {stop['arrive']}-{stop['depart']} {stop['name']}{move}")
+    if plan["unscheduled"]:
+        lines.append(f"운영 시간/일정상 제외: {', '.join(plan['unscheduled'])}")
+    return "\n".join(lines)
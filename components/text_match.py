@@ -0,0 +1,30 @@
+"""
+Text Match - 목적지 문자열에서 도시/국가 이름을 단어 단위로 찾기 (한글 조사 허용)
+"""
+import re
+from typing import Iterable, Optional
+
+# 도시/국가 이름 뒤에 붙을 수 있는 조사 ("파리에서", "스위스의")
+PARTICLES = ("에서", "으로", "로", "의", "에", "은", "는", "이", "가", "을", "를", "와", "과", "도")
+
+def normalize_name(name: str) -> str:
+    """비교용 이름 (소문자, 공백 1칸)"""
+    return " ".join((name or "").lower().split())
+
+def compile_names(names: Iterable[str]) -> Optional["re.Pattern"]:
+    """이름들을 단어 단위로 찾는 정규식 하나로 컴파일 (긴 이름 우선, 이름이 없으면 None)
+
+    "Rome"은 "Romeo"/"Jerome"과, "파리"는 "파리지앵"과 맞지 않고 "파리에서"와는 맞습니다.
+    찾은 이름은 normalize_name(match.group("name"))으로 얻습니다 (조사 제외).
+    """
+    ordered = sorted({normalize_name(name) for name in names} - {""}, key=len, reverse=True)
+    if not ordered:
+        return None
+    alternatives = "|".join(r'\s+'.join(re.escape(part) for part in name.split()) for name in ordered)
+    particles = "|".join(PARTICLES)
+    return re.compile(rf'(?<![^\W_])(?P<name>{alternatives})(?:{particles})?(?![^\W_])', re.IGNORECASE)
+
+def mentions(text: str, name: str) -> bool:
+    """text에 name이 단어 단위로 들어 있는지"""
+    pattern = compile_names([name])
+    return pattern is not None and pattern.search(text or "") is not None
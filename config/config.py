@@ -1,5 +1,10 @@
 import os
-from dotenv import load_dotenv
+import sys
+import time
+import hashlib
+import importlib
+from typing import Dict, Optional
+from dotenv import find_dotenv, dotenv_values
 from langchain_openai import AzureChatOpenAI, AzureOpenAIEmbeddings
 
 # langfuse를 선택적 import로 변경
@@ -10,8 +15,22 @@ except ImportError:
     LANGFUSE_AVAILABLE = False
     Langfuse = None
 
+def _apply_dotenv(override: bool = False) -> Dict[str, Optional[str]]:
+    """.env 값을 os.environ에 반영하고 {반영한 키: 반영 전 값(없었으면 None)} 반환"""
+    applied: Dict[str, Optional[str]] = {}
+    dotenv_path = find_dotenv()
+    if not dotenv_path:
+        return applied
+    for key, value in dotenv_values(dotenv_path).items():
+        if value is None or (not override and key in os.environ):
+            continue
+        applied[key] = os.environ.get(key)
+        os.environ[key] = value
+    return applied
+
 # 환경 변수 로드 - 현재 디렉토리에서 .env 파일 찾기
-load_dotenv()
+# (reload_config가 .env에서 지워진 키를 되돌릴 수 있도록 반영한 키를 기록)
+_dotenv_applied = _apply_dotenv()
 
 # OpenAI API 설정
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -28,6 +47,52 @@ AOAI_EMBEDDING_DEPLOYMENT = os.getenv("AOAI_EMBEDDING_DEPLOYMENT")
 DEFAULT_TEMPERATURE = float(os.getenv("DEFAULT_TEMPERATURE", "0.7"))
 MAX_TOKENS = int(os.getenv("MAX_TOKENS", "2000"))
 
+# 계획 수립 모드: "react" (Agent가 도구를 순차 호출) / "parallel" (도구 병렬 실행 후 LLM 1회 종합)
+PLANNING_MODE = os.getenv("PLANNING_MODE", "react")
+PARALLEL_TOOL_WORKERS = int(os.getenv("PARALLEL_TOOL_WORKERS", "7"))
+
+# 여행 계획 결과 캐시 설정 (유사도 임계값이 0이면 정확히 일치하는 입력만 캐시 적중)
+PLAN_CACHE_ENABLED = os.getenv("PLAN_CACHE_ENABLED", "true").lower() == "true"
+PLAN_CACHE_PATH = os.getenv("PLAN_CACHE_PATH", "./cache/plan_cache.sqlite3")
+PLAN_CACHE_TTL_SECONDS = int(os.getenv("PLAN_CACHE_TTL_SECONDS", "86400"))
+PLAN_CACHE_MAX_ENTRIES = int(os.getenv("PLAN_CACHE_MAX_ENTRIES", "500"))
+PLAN_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("PLAN_CACHE_SIMILARITY_THRESHOLD", "0"))
+
+# 백그라운드 계획 작업 설정 (동시 실행 작업 수, 완료 작업 보관 시간)
+PLAN_JOB_WORKERS = int(os.getenv("PLAN_JOB_WORKERS", "2"))
+PLAN_JOB_RETENTION_SECONDS = int(os.getenv("PLAN_JOB_RETENTION_SECONDS", "3600"))
+
+# 임베딩 서비스 설정 (배치 크기, 동시 요청 수, 재시도, 벡터 캐시 경로)
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+EMBEDDING_MAX_WORKERS = int(os.getenv("EMBEDDING_MAX_WORKERS", "4"))
+EMBEDDING_MAX_RETRIES = int(os.getenv("EMBEDDING_MAX_RETRIES", "3"))
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH", "./cache/embedding_cache.sqlite3")
+
+# RAG 검색 설정 (최종 청크 수, BM25/벡터 검색별 후보 수, 로컬 cross-encoder 재순위화 모델 - 비우면 사용 안 함)
+RAG_TOP_K = int(os.getenv("RAG_TOP_K", "3"))
+RAG_CANDIDATES = int(os.getenv("RAG_CANDIDATES", "20"))
+RAG_RERANKER_MODEL = os.getenv("RAG_RERANKER_MODEL", "")
+BM25_INDEX_PATH = os.getenv("BM25_INDEX_PATH", "./chroma_db/bm25_index.json")
+# 벡터 검색 백엔드: "auto" (ChromaDB, 없으면 로컬 색인) / "chroma" / "local" (임베딩 API 없이 문자 n-gram 색인)
+VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "auto").lower()
+LOCAL_INDEX_DIR = os.getenv("LOCAL_INDEX_DIR", "./chroma_db/local_index")
+
+# 프롬프트 토큰 예산 (계획 프롬프트 입력 토큰 상한, RAG 컨텍스트 상한 - 0이면 제한 없음, tiktoken 인코딩 - 로컬에 없으면 근사)
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "6000"))
+RAG_CONTEXT_TOKEN_BUDGET = int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "800"))
+TOKENIZER_ENCODING = os.getenv("TOKENIZER_ENCODING", "o200k_base")
+
+# 비용 집계 설정 (표시 통화, 환율표 로컬 캐시 경로/유효 시간, 환율 조회 URL - 비어 있으면 캐시/기본 환율만 사용)
+COST_CURRENCY = os.getenv("COST_CURRENCY", "KRW")
+FX_CACHE_PATH = os.getenv("FX_CACHE_PATH", "./cache/fx_rates.json")
+FX_CACHE_TTL_SECONDS = int(os.getenv("FX_CACHE_TTL_SECONDS", "86400"))
+FX_RATES_URL = os.getenv("FX_RATES_URL", "")
+
+# 로컬 POI 저장소 경로 (data/poi 데이터 파일이 바뀌면 다시 적재)
+POI_DB_PATH = os.getenv("POI_DB_PATH", "./cache/poi.sqlite3")
+# 도시별 POI 거리/이동 시간 행렬(.npy) 캐시 디렉토리 (비우면 파일로 저장하지 않음)
+MATRIX_CACHE_DIR = os.getenv("MATRIX_CACHE_DIR", "./cache/matrices")
+
 # UI 설정
 PAGE_TITLE = "AI 여행 플래너"
 PAGE_ICON = "✈️"
@@ -121,24 +186,142 @@ def get_llm():
         print(f"LLM 초기화 실패: {e}")
         return None
 
+# 프로세스 내에서 공유하는 임베딩 인스턴스 (reload_config 시 초기화됨)
+_embeddings_instance = None
+
 def get_embeddings():
-    """Azure OpenAI Embeddings 인스턴스 반환"""
+    """Azure OpenAI Embeddings 인스턴스 반환 (배치/캐시 래퍼, 프로세스 내 공유)"""
+    global _embeddings_instance
+    
     # Azure OpenAI 설정이 모두 유효한지 확인
     if not has_valid_azure_openai_config():
         print("Azure OpenAI API 키가 설정되지 않았거나 유효하지 않습니다.")
         return None
     
+    if _embeddings_instance is not None:
+        return _embeddings_instance
+    
     try:
-        return AzureOpenAIEmbeddings(
+        from components.embedding_service import CachedEmbeddings
+        
+        base_embeddings = AzureOpenAIEmbeddings(
             model=AOAI_EMBEDDING_DEPLOYMENT,
             openai_api_version=AOAI_API_VERSION,
             api_key=AOAI_API_KEY,
             azure_endpoint=AOAI_ENDPOINT,
         )
+        _embeddings_instance = CachedEmbeddings(
+            base_embeddings,
+            EMBEDDING_CACHE_PATH,
+            model_key=AOAI_EMBEDDING_DEPLOYMENT,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            max_workers=EMBEDDING_MAX_WORKERS,
+            max_retries=EMBEDDING_MAX_RETRIES
+        )
+        return _embeddings_instance
     except Exception as e:
         print(f"Embeddings 초기화 실패: {e}")
         return None
 
+# 설정 지문(fingerprint) 계산에 사용하는 환경 변수 목록
+CONFIG_FINGERPRINT_KEYS = [
+    "OPENAI_API_KEY",
+    "OPENAI_MODEL",
+    "AOAI_API_KEY",
+    "AOAI_ENDPOINT",
+    "AOAI_DEPLOY_GPT4O",
+    "AOAI_API_VERSION",
+    "AOAI_EMBEDDING_DEPLOYMENT",
+    "DEFAULT_TEMPERATURE",
+    "MAX_TOKENS",
+    "PLANNING_MODE",
+    "PARALLEL_TOOL_WORKERS",
+    "PLAN_CACHE_ENABLED",
+    "PLAN_CACHE_PATH",
+    "PLAN_CACHE_TTL_SECONDS",
+    "PLAN_CACHE_MAX_ENTRIES",
+    "PLAN_CACHE_SIMILARITY_THRESHOLD",
+    "PLAN_JOB_WORKERS",
+    "PLAN_JOB_RETENTION_SECONDS",
+    "EMBEDDING_BATCH_SIZE",
+    "EMBEDDING_MAX_WORKERS",
+    "EMBEDDING_MAX_RETRIES",
+    "EMBEDDING_CACHE_PATH",
+    "RAG_TOP_K",
+    "RAG_CANDIDATES",
+    "RAG_RERANKER_MODEL",
+    "BM25_INDEX_PATH",
+    "VECTOR_BACKEND",
+    "LOCAL_INDEX_DIR",
+    "PROMPT_TOKEN_BUDGET",
+    "RAG_CONTEXT_TOKEN_BUDGET",
+    "TOKENIZER_ENCODING",
+    "COST_CURRENCY",
+    "FX_CACHE_PATH",
+    "FX_CACHE_TTL_SECONDS",
+    "FX_RATES_URL",
+    "POI_DB_PATH",
+    "MATRIX_CACHE_DIR",
+]
+
+# .env 파일 위치와 (수정 시각, 크기)별 파싱 결과 캐시
+# 지문은 registry.get()마다 계산하므로 .env가 바뀌었을 때만 다시 파싱하고,
+# .env가 없으면 DOTENV_RECHECK_SECONDS마다 한 번만 다시 찾음
+DOTENV_RECHECK_SECONDS = 5.0
+_dotenv_cache = {"path": "", "checked_at": None, "stamp": None, "values": {}}
+
+def _dotenv_snapshot() -> Dict[str, Optional[str]]:
+    """현재 .env 파일 값 (파일이 바뀌지 않았으면 이전 파싱 결과 재사용)"""
+    cache = _dotenv_cache
+    now = time.monotonic()
+    if not cache["path"] and (cache["checked_at"] is None or now - cache["checked_at"] >= DOTENV_RECHECK_SECONDS):
+        cache["path"] = find_dotenv()
+        cache["checked_at"] = now
+    if not cache["path"]:
+        return {}
+
+    try:
+        stat = os.stat(cache["path"])
+    except OSError:
+        # .env가 삭제됨 - 다음 호출부터 다시 찾음
+        cache.update(path="", checked_at=now, stamp=None, values={})
+        return {}
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if stamp != cache["stamp"]:
+        cache["values"] = dotenv_values(cache["path"])
+        cache["stamp"] = stamp
+    return cache["values"]
+
+def get_config_fingerprint() -> str:
+    """현재 환경 변수와 .env 파일 값으로 설정 지문 계산 (값이 바뀌면 지문도 바뀜)"""
+    values = {key: os.getenv(key, "") for key in CONFIG_FINGERPRINT_KEYS}
+    
+    # .env 파일 값이 우선 (reload_config가 override=True로 다시 읽기 때문)
+    for key, value in _dotenv_snapshot().items():
+        if key in values and value is not None:
+            values[key] = value
+    
+    digest = hashlib.sha256()
+    for key in CONFIG_FINGERPRINT_KEYS:
+        digest.update(f"{key}={values[key]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+def reload_config():
+    """.env 파일을 다시 읽어 모듈 설정값을 갱신
+
+    지난번에 .env에서 반영한 키를 먼저 원래 값으로 되돌리므로, .env에서 지운 설정은
+    환경 변수 또는 기본값으로 돌아갑니다.
+    """
+    for key, previous in _dotenv_applied.items():
+        if previous is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = previous
+    applied = _apply_dotenv(override=True)
+    module = importlib.reload(sys.modules[__name__])
+    # 다시 실행된 모듈의 _apply_dotenv()는 이미 반영된 키를 건너뛰므로 이번에 반영한 키로 덮어씀
+    module._dotenv_applied = applied
+
 def get_langfuse():
     """Langfuse 인스턴스 반환"""
     if not LANGFUSE_AVAILABLE:
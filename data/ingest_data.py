@@ -1,53 +1,226 @@
 import os
 import sys # Added for sys.path modification
-from langchain_community.document_loaders import TextLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_chroma import Chroma
+import json
+import glob
+import hashlib
+import argparse
+from typing import Dict, Any, List
+from langchain_core.documents import Document
 
-# 현재 파일의 디렉토리를 sys.path에 추가하여 모듈을 찾을 수 있도록 함
+# ChromaDB가 없어도 로컬 색인(BM25/문자 n-gram 벡터)은 만들 수 있도록 선택적 import
+try:
+    from langchain_chroma import Chroma
+    CHROMA_AVAILABLE = True
+except ImportError:
+    CHROMA_AVAILABLE = False
+    Chroma = None
+
+# 프로젝트 루트를 sys.path에 추가하여 모듈을 찾을 수 있도록 함
 # This ensures that imports like 'from config.config import ...' work correctly
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.config import get_embeddings # config.py에서 임베딩 함수 임포트
+from config.config import get_embeddings, BM25_INDEX_PATH, LOCAL_INDEX_DIR # config.py에서 임베딩 함수 임포트
+from components.hybrid_retriever import BM25Index
+from components.local_vector_index import LocalVectorIndex
+from components.markdown_splitter import SPLITTER_VERSION, split_markdown_sections
 
 # ChromaDB 저장 경로
 CHROMA_PERSIST_DIRECTORY = "./chroma_db"
 
-def ingest_data():
+# 기본 입력 파일 패턴 (디렉토리/glob 지원)
+DEFAULT_SOURCE_GLOB = "data/**/*.txt"
+
+# 증분 인덱싱 상태 파일 (파일별 해시와 청크 ID 목록)
+MANIFEST_PATH = os.path.join(CHROMA_PERSIST_DIRECTORY, "ingest_manifest.json")
+MANIFEST_VERSION = 1
+
+# 청킹 설정 (바뀌면 모든 파일을 다시 청킹) - 제목 절 단위로 나누고 긴 절만 CHUNK_SIZE로 다시 나눔
+CHUNK_SIZE = 1000
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def _chunking_signature() -> Dict[str, Any]:
+    return {"splitter": "markdown_sections", "splitter_version": SPLITTER_VERSION, "chunk_size": CHUNK_SIZE}
+
+def load_manifest() -> Dict[str, Any]:
+    """인덱싱 상태 파일 로드 (없거나 손상되면 빈 상태)"""
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"매니페스트를 읽을 수 없어 전체 재구축합니다: {e}")
+        return {}
+
+def save_manifest(manifest: Dict[str, Any]):
+    """인덱싱 상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+def find_source_files(source: str) -> List[str]:
+    """디렉토리 또는 glob 패턴을 파일 목록으로 변환"""
+    if os.path.isdir(source):
+        source = os.path.join(source, "**", "*.txt")
+    return sorted(os.path.normpath(path) for path in glob.glob(source, recursive=True) if os.path.isfile(path))
+
+def split_source_file(path: str):
+    """파일을 "## 국가 / ### 도시" 절 단위 청크로 분할하고, 청크마다 내용 해시 ID와 country/city/section 메타데이터를 부여"""
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+
+    chunks = {}
+    for content, metadata in split_markdown_sections(text, max_chars=CHUNK_SIZE):
+        # 같은 파일 안의 동일한 청크는 하나만 저장
+        chunk_id = _sha256(f"{path}\0{content}")
+        metadata.update({"source": path, "chunk_hash": chunk_id})
+        chunks.setdefault(chunk_id, Document(page_content=content, metadata=metadata))
+    return chunks
+
+def build_bm25_index(chunks_by_file: Dict[str, Dict[str, Any]], path: str = BM25_INDEX_PATH):
+    """모든 청크로 BM25 색인 재구축 (임베딩이 필요 없어 매번 전체를 다시 만듦)"""
+    documents = [chunk for chunks in chunks_by_file.values() for chunk in chunks.values()]
+    BM25Index.from_documents(documents).save(path)
+    print(f"BM25 색인 저장 완료: {len(documents)}개 청크. 경로: {path}")
+
+def build_local_index(chunks_by_file: Dict[str, Dict[str, Any]], directory: str = LOCAL_INDEX_DIR):
+    """모든 청크로 로컬 벡터 색인 재구축 (임베딩 API 없이 오프라인으로 동작)"""
+    documents = [chunk for chunks in chunks_by_file.values() for chunk in chunks.values()]
+    LocalVectorIndex.build(documents).save(directory)
+    print(f"로컬 벡터 색인 저장 완료: {len(documents)}개 청크. 경로: {directory}")
+
+def _file_stamp(path: str) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def diff_source_files(source_files: List[str], previous_files: Dict[str, Any], chunking_changed: bool):
+    """매니페스트와 비교한 (현재 파일 상태, 변경/신규 파일, 삭제된 파일)
+
+    수정 시각과 크기가 매니페스트와 같으면 파일을 읽지 않고 이전 해시를 사용합니다.
+    """
+    current, changed = {}, []
+    for path in source_files:
+        stamp = _file_stamp(path)
+        previous = previous_files.get(path)
+        if previous and previous.get("stamp") == stamp:
+            file_hash = previous["sha256"]
+        else:
+            with open(path, encoding="utf-8") as f:
+                file_hash = _sha256(f.read())
+        current[path] = {"sha256": file_hash, "stamp": stamp}
+        if chunking_changed or not previous or previous["sha256"] != file_hash:
+            changed.append(path)
+    deleted = [path for path in previous_files if path not in current]
+    return current, changed, deleted
+
+def _local_indexes_exist() -> bool:
+    return os.path.exists(BM25_INDEX_PATH) and os.path.exists(os.path.join(LOCAL_INDEX_DIR, LocalVectorIndex.META_FILE))
+
+def ingest_data(source: str = DEFAULT_SOURCE_GLOB, rebuild: bool = False) -> Dict[str, int]:
+    """변경된 파일만 ChromaDB에 반영하고 BM25/로컬 벡터 색인을 다시 만듦 (추가/삭제 청크 수 반환)"""
     print("데이터 임베딩 및 ChromaDB 저장 시작...")
+    summary = {"added": 0, "deleted": 0}
+
+    manifest = {} if rebuild else load_manifest()
+    previous_files = manifest.get("files", {})
+    # 청킹 설정이 바뀌었으면 모든 파일의 청크가 달라지므로 파일 해시를 무시
+    chunking_changed = manifest.get("chunking") != _chunking_signature()
+    # 매니페스트가 없거나 (첫 실행 또는 --rebuild) 지난 실행에서 ChromaDB를 갱신하지 못했으면 컬렉션 재구축
+    needs_reset = not manifest or not manifest.get("chroma_synced", True)
+
+    source_files = find_source_files(source)
+    if not source_files:
+        print(f"입력 파일이 없습니다: {source}")
+        return summary
+
+    # 1. 매니페스트와 비교해 바뀐 것이 없으면 청킹/색인 재구축 없이 종료
+    current_files, changed, deleted = diff_source_files(source_files, previous_files, chunking_changed)
+    chroma_pending = needs_reset and CHROMA_AVAILABLE
+    if not changed and not deleted and not chroma_pending and _local_indexes_exist():
+        print("변경된 파일이 없습니다. 색인 갱신을 건너뜁니다.")
+        return summary
+
+    # 2. 모든 파일을 청킹 (BM25/로컬 색인은 전체 재구축), 변경된 파일만 추가/삭제할 청크 계산
+    files_state, chunks_by_file = {}, {}
+    documents_to_add, ids_to_add, ids_to_delete = [], [], []
+    changed = set(changed)
+    for path in source_files:
+        chunks = split_source_file(path)
+        chunks_by_file[path] = chunks
+        files_state[path] = dict(current_files[path], chunk_ids=list(chunks))
+        previous = previous_files.get(path)
+        if path not in changed and not needs_reset:
+            continue
+
+        old_ids = set() if needs_reset or not previous else set(previous["chunk_ids"])
+        new_ids = [chunk_id for chunk_id in chunks if chunk_id not in old_ids]
+        documents_to_add.extend(chunks[chunk_id] for chunk_id in new_ids)
+        ids_to_add.extend(new_ids)
+        ids_to_delete.extend(old_ids - set(chunks))
+        print(f"{path}: 청크 {len(chunks)}개 (신규 {len(new_ids)}개, 삭제 {len(old_ids - set(chunks))}개)")
 
-    # 1. 문서 로드
-    loader = TextLoader("data/travel_info.txt", encoding="utf-8")
-    documents = loader.load()
+    # 입력에서 사라진 파일의 청크 삭제
+    for path in deleted:
+        if not needs_reset:
+            ids_to_delete.extend(previous_files[path]["chunk_ids"])
+        print(f"{path}: 삭제된 파일, 청크 {len(previous_files[path]['chunk_ids'])}개 제거")
 
-    # 2. 문서 청킹
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=1000,
-        chunk_overlap=200,
-        length_function=len,
-        is_separator_regex=False,
-    )
-    texts = text_splitter.split_documents(documents)
-    print(f"총 {len(texts)}개의 청크로 분할되었습니다.")
+    # BM25/로컬 벡터 색인은 API 키 없이도 만들 수 있으므로 임베딩 단계 전에 저장
+    build_bm25_index(chunks_by_file, BM25_INDEX_PATH)
+    build_local_index(chunks_by_file, LOCAL_INDEX_DIR)
+
+    def finish(chroma_synced: bool) -> Dict[str, int]:
+        save_manifest({
+            "version": MANIFEST_VERSION, "chunking": _chunking_signature(),
+            "chroma_synced": chroma_synced, "files": files_state
+        })
+        return summary
+
+    if not documents_to_add and not ids_to_delete and not needs_reset:
+        print("변경된 청크가 없습니다. 임베딩을 건너뜁니다.")
+        return finish(True)
+
+    if not CHROMA_AVAILABLE:
+        print("langchain_chroma가 설치되지 않아 ChromaDB 갱신을 건너뜁니다. (로컬 색인만 사용)")
+        return finish(False)
 
     # 3. 임베딩 모델 초기화
     embeddings = get_embeddings()
     if embeddings is None:
         print("임베딩 모델 초기화에 실패했습니다. 환경 변수를 확인해주세요.")
-        return
-
-    # 4. ChromaDB에 저장
-    print("ChromaDB에 임베딩 저장 중...")
-    vectorstore = Chroma.from_documents(
-        documents=texts,
-        embedding=embeddings,
-        persist_directory=CHROMA_PERSIST_DIRECTORY
-    )
-    vectorstore.persist()
-    print(f"ChromaDB에 데이터 저장이 완료되었습니다. 경로: {CHROMA_PERSIST_DIRECTORY}")
+        return finish(False)
+
+    # 4. ChromaDB 갱신 (재구축이면 이전 방식으로 쌓인 중복 벡터까지 지우고 모든 청크를 추가)
+    vectorstore = Chroma(persist_directory=CHROMA_PERSIST_DIRECTORY, embedding_function=embeddings)
+    if needs_reset:
+        print("기존 컬렉션을 초기화합니다.")
+        vectorstore.delete_collection()
+        vectorstore = Chroma(persist_directory=CHROMA_PERSIST_DIRECTORY, embedding_function=embeddings)
+
+    if ids_to_delete:
+        vectorstore.delete(ids=ids_to_delete)
+    if documents_to_add:
+        print(f"ChromaDB에 임베딩 저장 중... ({len(documents_to_add)}개 청크)")
+        vectorstore.add_documents(documents=documents_to_add, ids=ids_to_add)
+
+    summary.update(added=len(ids_to_add), deleted=len(ids_to_delete))
+    print(f"ChromaDB 갱신 완료: 추가 {len(ids_to_add)}개, 삭제 {len(ids_to_delete)}개. 경로: {CHROMA_PERSIST_DIRECTORY}")
+    return finish(True)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="여행 정보 문서를 ChromaDB에 증분 인덱싱")
+    parser.add_argument("--source", default=DEFAULT_SOURCE_GLOB, help="입력 디렉토리 또는 glob 패턴 (기본값: data/**/*.txt)")
+    parser.add_argument("--rebuild", action="store_true", help="매니페스트를 무시하고 컬렉션 전체 재구축")
+    args = parser.parse_args()
+
     # ChromaDB 저장 디렉토리 생성 (없으면)
     if not os.path.exists(CHROMA_PERSIST_DIRECTORY):
         os.makedirs(CHROMA_PERSIST_DIRECTORY)
-    ingest_data() 
\ No newline at end of file
+    ingest_data(args.source, rebuild=args.rebuild)
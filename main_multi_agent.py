@@ -3,7 +3,6 @@ AI 여행 플래너 - Multi Agent System with LangChain & LangGraph
 """
 import streamlit as st
 from typing import Dict, Any, List
-from langchain_openai import ChatOpenAI, AzureChatOpenAI
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.prompts import PromptTemplate
 from langchain.schema import BaseMessage
@@ -13,15 +12,21 @@ from datetime import date, timedelta # Moved from inside functions
 
 # 기존 컴포넌트 import
 from components.user_input_handler import UserInputHandler
+from components.resource_registry import get_resource_registry
+from components.itinerary_parser import StreamingItineraryParser
+from components.itinerary_model import ItineraryTable
 from ui.streamlit_ui import StreamlitUI
 
-# 새로운 Multi Agent System import
-from agents import TravelCoordinatorAgent
-from tools import (
-    SearchDestinationTool, WeatherTool, AccommodationSearchTool,
-    RestaurantSearchTool, TransportationTool, BudgetCalculatorTool,
-    ItineraryOptimizerTool
-)
+# 도구 실행 시 표시할 진행 상태 문구
+TOOL_STATUS_LABELS = {
+    "search_destination": "🔍 목적지 정보 수집 중...",
+    "get_weather": "🌤️ 날씨 정보 확인 중...",
+    "search_accommodation": "🏨 숙박 옵션 검색 중...",
+    "search_restaurants": "🍽️ 음식점 추천 중...",
+    "get_transportation": "🚗 교통 계획 수립 중...",
+    "calculate_budget": "💰 예산 최적화 중...",
+    "optimize_itinerary": "🎪 액티비티 계획 중...",
+}
 
 class MultiAgentTravelPlanner:
     """Multi Agent 기반 여행 플래너"""
@@ -29,10 +34,16 @@ class MultiAgentTravelPlanner:
     def __init__(self):
         self.ui = StreamlitUI()
         self.input_handler = UserInputHandler()
-        self.llm = self._initialize_llm()
-        self.tools = self._initialize_tools()
-        # RAG 활성화를 위해 vectorstore 파라미터 제거
-        self.coordinator_agent = TravelCoordinatorAgent(self.llm, self.tools)
+        
+        # LLM, 도구, Coordinator Agent는 프로세스 전역 레지스트리에서 재사용
+        # (Streamlit rerun마다 다시 생성하지 않고, 설정이 바뀔 때만 새로 생성)
+        registry = get_resource_registry()
+        self.llm = registry.get_llm()
+        if self.llm is None:
+            st.info("🤖 API 키가 설정되지 않아 데모 모드로 동작합니다.")
+        self.tools = registry.get_tools()
+        self.coordinator_agent = registry.get_coordinator()
+        self.job_manager = registry.get_job_manager()
         
         # 세션 상태 초기화
         if 'travel_data' not in st.session_state:
@@ -46,51 +57,6 @@ class MultiAgentTravelPlanner:
         if 'user_input_data' not in st.session_state:
             st.session_state.user_input_data = {}
     
-    def _initialize_llm(self):
-        """LLM 초기화"""
-        try:
-            # Azure OpenAI 우선 시도 (ChatOpenAI 사용)
-            import config.config as config
-            
-            # Azure OpenAI 설정이 유효한지 확인
-            if config.has_valid_azure_openai_config():
-                return AzureChatOpenAI(
-                    azure_endpoint=config.AOAI_ENDPOINT,
-                    azure_deployment=config.AOAI_DEPLOY_GPT4O,
-                    openai_api_version=config.AOAI_API_VERSION,
-                    temperature=0.7,
-                    api_key=config.AOAI_API_KEY
-                )
-            
-            # OpenAI API 시도
-            if config.has_valid_openai_config():
-                return ChatOpenAI(
-                    model=config.OPENAI_MODEL,
-                    temperature=0.7,
-                    api_key=config.OPENAI_API_KEY
-                )
-            
-            # API 키가 없는 경우 데모 모드로 동작
-            st.info("🤖 API 키가 설정되지 않아 데모 모드로 동작합니다.")
-            return None
-            
-        except Exception as e:
-            st.warning(f"⚠️ LLM 초기화 실패: {str(e)}")
-            st.info("💡 데모 모드로 동작합니다.")
-            return None
-    
-    def _initialize_tools(self):
-        """ReAct Tools 초기화"""
-        return [
-            SearchDestinationTool(),
-            WeatherTool(),
-            AccommodationSearchTool(),
-            RestaurantSearchTool(),
-            TransportationTool(),
-            BudgetCalculatorTool(),
-            ItineraryOptimizerTool()
-        ]
-    
     def run(self):
         """메인 실행 함수"""
         
@@ -143,6 +109,23 @@ class MultiAgentTravelPlanner:
                 4. 애플리케이션 재시작
                 """)
             
+            # 계획 캐시 적중/미스 통계
+            plan_cache = getattr(self.coordinator_agent, 'plan_cache', None)
+            if plan_cache:
+                stats = plan_cache.stats()
+                st.caption(
+                    f"💾 계획 캐시: 적중 {stats['exact_hits'] + stats['semantic_hits']}회 "
+                    f"(유사 {stats['semantic_hits']}회) / 미스 {stats['misses']}회, 저장 {stats['entries']}건"
+                )
+            
+            # 백그라운드 계획 작업 큐 상태
+            job_stats = self.job_manager.stats()
+            st.caption(
+                f"⚙️ 계획 작업: 대기 {job_stats['queue_depth']}건, 실행 {job_stats['running']}/{job_stats['max_workers']} "
+                f"(사용률 {job_stats['utilization']:.0%}), 평균 대기 {job_stats['avg_wait_seconds']:.1f}초 · "
+                f"실행 {job_stats['avg_run_seconds']:.1f}초"
+            )
+            
             st.markdown("---")
             
             # Agent 정보
@@ -227,44 +210,139 @@ class MultiAgentTravelPlanner:
         # Agent 대화 과정 표시
         st.subheader("🤖 Agent 협력 과정")
         
-        # 진행 상태 표시
+        # 계획 생성은 백그라운드 작업으로 실행하고, 스크립트가 다시 실행되면 같은 작업에 다시 연결
+        job = self._get_or_submit_plan_job(st.session_state.travel_data)
+        
+        with st.spinner("Multi Agent들이 여행 계획을 수립하고 있습니다..."):
+            result = self._follow_plan_job(job)
+        
+        if result and result.get('status') != 'error':
+            st.session_state.processed_data = result
+            st.success("✅ Multi Agent 여행 계획이 완성되었습니다!")
+            
+            # 다음 단계로 이동 버튼
+            if st.button("📋 결과 확인하기", type="primary"):
+                st.session_state.current_step = 'results'
+                st.rerun()
+        else:
+            st.error("여행 계획 생성에 실패했습니다.")
+            if result and result.get('type') == 'error':
+                st.error(f"오류: {result.get('message', '알 수 없는 오류')}")
+            elif job.error:
+                st.error(f"오류: {job.error}")
+            st.button("← 이전 단계로", on_click=self._go_back_to_input)
+    
+    def _get_or_submit_plan_job(self, travel_data: Dict[str, Any]):
+        """세션에 연결된 작업 반환 (없거나 만료되었거나 취소/실패했으면 새로 제출)"""
+        
+        job = None
+        job_id = st.session_state.get('plan_job_id')
+        if job_id:
+            job = self.job_manager.get(job_id)
+        
+        # 입력이 바뀌었거나, 작업 기록이 정리되었거나, 이전 작업이 취소/실패했으면 새 작업 제출
+        if job is None or job.user_input != travel_data or job.status in ('cancelled', 'failed'):
+            if job is not None:
+                self.job_manager.release(job_id)
+            job_id = self.job_manager.submit(travel_data)
+            st.session_state.plan_job_id = job_id
+            job = self.job_manager.get(job_id)
+        return job
+    
+    def _follow_plan_job(self, job) -> Dict[str, Any]:
+        """작업 이벤트를 처음부터 재생하며 화면에 렌더링하고, 완료될 때까지 새 이벤트를 기다림
+        
+        진행률은 실제로 완료된 도구 실행과 LLM 호출 수를 기준으로 갱신합니다.
+        """
+        
         progress_bar = st.progress(0)
         status_text = st.empty()
+        steps_container = st.container()
+        # 완성된 일자는 구조화된 카드로 바로 표시 (일자를 하나도 못 찾은 응답은 원문 미리보기로 표시)
+        days_container = st.container()
+        content_placeholder = st.empty()
         
-        # 단계별 진행 상황 표시
-        steps = [
-            "🔍 목적지 정보 수집 중...",
-            "🌤️ 날씨 정보 확인 중...",
-            "🏨 숙박 옵션 검색 중...",
-            "🍽️ 음식점 추천 중...",
-            "🚗 교통 계획 수립 중...",
-            "🎪 액티비티 계획 중...",
-            "💰 예산 최적화 중...",
-            "📋 최종 일정 정리 중..."
-        ]
-        
-        for i, step in enumerate(steps):
-            status_text.text(step)
-            progress_bar.progress((i + 1) / len(steps))
-            st.empty()  # 잠시 대기 효과
-        
-        # Coordinator Agent 실행
-        with st.spinner("Multi Agent들이 여행 계획을 수립하고 있습니다..."):
-            result = self.coordinator_agent.plan_travel(st.session_state.travel_data)
+        expected_steps = 1
+        completed_steps = 0
+        streamed_text = ""
+        itinerary_parser = StreamingItineraryParser()
+        metrics = None
+        next_index = 0
+        
+        if job.status == 'queued':
+            status_text.text(f"⏳ 대기 중인 작업 {self.job_manager.stats()['queue_depth']}건 - 순서를 기다리고 있습니다...")
+        
+        while True:
+            finished = job.finished
+            events = job.wait_for_events(next_index, timeout=0.5)
+            next_index += len(events)
             
-            if result and result.get('status') != 'error':
-                st.session_state.processed_data = result
-                st.success("✅ Multi Agent 여행 계획이 완성되었습니다!")
-                
-                # 다음 단계로 이동 버튼
-                if st.button("📋 결과 확인하기", type="primary"):
-                    st.session_state.current_step = 'results'
-                    st.rerun()
-            else:
-                st.error("여행 계획 생성에 실패했습니다.")
-                if result and result.get('type') == 'error':
-                    st.error(f"오류: {result.get('message', '알 수 없는 오류')}")
-                st.button("← 이전 단계로", on_click=self._go_back_to_input)
+            for event in events:
+                if event['type'] == 'start':
+                    expected_steps = max(1, event['expected_steps'])
+                    status_text.text("🤖 Coordinator Agent가 계획을 준비하고 있습니다...")
+                elif event['type'] == 'step':
+                    status_text.text(TOOL_STATUS_LABELS.get(event['tool'], f"🔧 {event['tool']} 실행 중..."))
+                elif event['type'] == 'observation':
+                    completed_steps += 1
+                    icon = "⚠️" if event['error'] else "✅"
+                    steps_container.markdown(f"{icon} **{event['tool']}** ({event['elapsed_ms']:.0f}ms)")
+                elif event['type'] == 'llm':
+                    completed_steps += 1
+                elif event['type'] == 'token':
+                    streamed_text += event['text']
+                    # 완성된 일자가 생기는 대로 카드로 표시하고 진행 상태에 반영
+                    completed_days = self._render_parsed_days(itinerary_parser.feed(event['text']), days_container)
+                    if completed_days or not itinerary_parser.days:
+                        written = f" (Day {len(itinerary_parser.days)}까지 작성 완료)" if itinerary_parser.days else ""
+                        status_text.text(f"📋 최종 일정 정리 중...{written}")
+                elif event['type'] == 'result':
+                    metrics = event['metrics']
+            
+            if itinerary_parser.days:
+                content_placeholder.empty()
+            elif streamed_text:
+                content_placeholder.markdown(streamed_text + "▌")
+            # ReAct 모드는 도구를 반복 호출할 수 있으므로 완료 전에는 100%를 넘기지 않음
+            progress_bar.progress(min(completed_steps / (expected_steps + 1), 0.95))
+            
+            # 완료 상태를 확인한 뒤 남은 이벤트까지 모두 렌더링했으면 종료
+            if finished and not events:
+                break
+        
+        progress_bar.progress(1.0)
+        status_text.empty()
+        # 응답이 끝나 닫히지 않은 마지막 일자까지 표시
+        self._render_parsed_days(itinerary_parser.close(), days_container)
+        
+        # 일자 카드로 표시했으면 원문 미리보기는 지우고, 일자를 찾지 못했으면 원문 그대로 표시
+        if itinerary_parser.days:
+            content_placeholder.empty()
+        elif streamed_text:
+            content_placeholder.markdown(streamed_text)
+        if metrics:
+            self._display_plan_metrics(metrics)
+        return job.result
+    
+    def _render_parsed_days(self, parsed_events: List[Dict[str, Any]], container) -> int:
+        """파서 이벤트 중 완성된 일자를 카드로 표시하고 표시한 일자 수 반환"""
+        days = [parsed['record'] for parsed in parsed_events if parsed['type'] == 'day']
+        with container:
+            for day in days:
+                self.ui.display_day_card(day)
+        return len(days)
+    
+    def _display_plan_metrics(self, metrics: Dict[str, Any]):
+        """도구별 실행 시간과 LLM 토큰 사용량 표시"""
+        
+        with st.expander("⏱️ 단계별 소요 시간"):
+            for timing in metrics['tools']:
+                st.text(f"{timing['tool']}: {timing['elapsed_ms']:.0f}ms")
+            st.caption(
+                f"전체 {metrics['total_ms'] / 1000:.1f}초 · 도구 {metrics['tool_ms'] / 1000:.1f}초 · "
+                f"LLM {metrics['llm_calls']}회 {metrics['llm_ms'] / 1000:.1f}초 · "
+                f"토큰 {metrics['tokens']['total_tokens']}개"
+            )
     
     def _handle_results_display(self):
         """결과 표시 및 추가 기능 처리"""
@@ -336,35 +414,39 @@ class MultiAgentTravelPlanner:
                 st.markdown(data['agent_analysis'])
                 st.markdown("---")
             
+            # 일정 요약/차트는 열 단위 표 하나에서 계산
+            itinerary_table = ItineraryTable.from_itinerary(data['itinerary']) if data.get('itinerary') else None
+            
             # 여행 일정 표시
-            if data.get('itinerary'):
+            if itinerary_table is not None:
                 st.subheader("📅 여행 일정")
                 self.ui.display_itinerary(data['itinerary'])
                 
                 # 일정 요약 정보 표시
                 st.markdown("---")
                 st.subheader("📋 일정 요약")
-                total_days = len(data['itinerary'])
-                total_activities = sum(len(day.get('activities', [])) for day in data['itinerary'])
-                total_meals = sum(len(day.get('meals', [])) for day in data['itinerary'])
+                stats = itinerary_table.summary()
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("총 여행 일수", f"{total_days}일")
+                    st.metric("총 여행 일수", f"{stats['total_days']}일")
                 with col2:
-                    st.metric("총 활동 수", f"{total_activities}개")
+                    st.metric("총 활동 수", f"{stats['total_activities']}개")
                 with col3:
-                    st.metric("총 식사 수", f"{total_meals}회")
+                    st.metric("총 식사 수", f"{stats['total_meals']}회")
             
             # 추천사항 표시
             if data.get('recommendations'):
                 st.subheader("💡 추천사항")
                 self.ui.display_recommendations(data['recommendations'])
             
-            # 비용 요약 표시
-            if data.get('total_estimated_cost'):
+            # 비용 요약 표시 (일정 항목 비용은 LLM 호출 없이 환율표로 환산해 집계)
+            cost_breakdown = None
+            if itinerary_table is not None:
+                cost_breakdown = itinerary_table.cost_summary(get_resource_registry().get_fx_rates())
+            if data.get('total_estimated_cost') or cost_breakdown:
                 st.subheader("💰 비용 요약")
-                self.ui.display_cost_summary(data['total_estimated_cost'])
+                self.ui.display_cost_summary(data.get('total_estimated_cost', ''), cost_breakdown)
             
             # 준비물 목록 표시
             if data.get('packing_list'):
@@ -372,9 +454,9 @@ class MultiAgentTravelPlanner:
                 self.ui.display_packing_list(data['packing_list'])
             
             # 일정 분석 차트 표시
-            if data.get('itinerary'):
+            if itinerary_table is not None:
                 st.subheader("📊 일정 분석")
-                self.ui.display_itinerary_chart(data['itinerary'])
+                self.ui.display_itinerary_chart(itinerary_table)
             
             # 데이터 품질 정보 표시
             st.markdown("---")
@@ -402,6 +484,13 @@ class MultiAgentTravelPlanner:
     def _go_back_to_input(self):
         """입력 단계로 돌아가기"""
         st.session_state.current_step = 'input'
+        self._release_plan_job()
+    
+    def _release_plan_job(self):
+        """세션과 계획 작업의 연결 해제 (같은 작업을 기다리는 다른 세션이 없고 아직 시작되지 않았으면 취소)"""
+        job_id = st.session_state.pop('plan_job_id', None)
+        if job_id:
+            self.job_manager.release(job_id)
     
     def _go_back_to_planning(self):
         """계획 단계로 돌아가기"""
@@ -414,6 +503,7 @@ class MultiAgentTravelPlanner:
         st.session_state.agent_conversation = []
         st.session_state.current_step = 'input'
         st.session_state.user_input_data = {}
+        self._release_plan_job()
 
 def main():
     """메인 함수"""
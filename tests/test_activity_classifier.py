@@ -0,0 +1,54 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.activity_classifier import ActivityClassifier, parse_start_minutes
+
+def test_activity_categories_follow_table_priority():
+    classifier = ActivityClassifier()
+    assert classifier.classify_activity("루브르 박물관 관람") == "문화"
+    assert classifier.classify_activity("Central PARK walk") == "자연"
+    assert classifier.classify_activity("야시장 마켓 구경") == "쇼핑"
+    assert classifier.classify_activity("에펠탑 방문") == "기타"
+    # 뒤에 나온 키워드라도 우선순위가 높은 카테고리가 선택됨
+    assert classifier.classify_activity("공원 옆 미술관") == "문화"
+
+def test_batch_matches_single_classification():
+    classifier = ActivityClassifier()
+    names = ["공원 산책", "", "카페 투어", "쇼핑몰\n박물관", "스포츠 경기 관람", "몽마르트르"]
+    assert classifier.classify_activities(names) == [classifier.classify_activity(name) for name in names]
+    assert classifier.classify_activities([]) == []
+
+def test_custom_keyword_table():
+    classifier = ActivityClassifier({"야경": ["night view", "야경"]}, default_category="관광")
+    assert classifier.classify_activities(["한강 야경", "Night View tour", "시내 관광"]) == ["야경", "야경", "관광"]
+
+def test_parse_start_minutes():
+    assert parse_start_minutes("12:30-13:30") == 12 * 60 + 30
+    assert parse_start_minutes("오후 7시") == 19 * 60
+    assert parse_start_minutes("7:15 PM") == 19 * 60 + 15
+    assert parse_start_minutes("오전 12시") == 0
+    assert parse_start_minutes("19시 30분") == 19 * 60 + 30
+    assert parse_start_minutes("시간 미정") is None
+
+def test_meal_type_uses_time_ranges_and_hints():
+    classifier = ActivityClassifier()
+    # 부분 문자열 비교로는 "10:12"가 점심, "21:08"이 아침으로 잘못 분류되던 경우
+    assert classifier.classify_meal("10:12") == "아침"
+    assert classifier.classify_meal("21:08") == "저녁"
+    assert classifier.classify_meal("12:30-13:30") == "점심"
+    assert classifier.classify_meal("15:30") == "간식"
+    assert classifier.classify_meal("", hint="점심") == "점심"
+    assert classifier.classify_meals(["08:00", "오후 7시"]) == ["아침", "저녁"]
+
+def test_classify_itinerary_fills_all_days():
+    itinerary = [
+        {"day": 1, "activities": [{"activity": "미술관"}, {"activity": "해변 산책"}], "meals": [{"time": "12:00"}]},
+        {"day": 2, "activities": None, "meals": [{"time": "", "slot": "저녁"}]},
+    ]
+    ActivityClassifier().classify_itinerary(itinerary)
+    assert [activity["category"] for activity in itinerary[0]["activities"]] == ["문화", "자연"]
+    assert itinerary[0]["meals"][0]["meal_type"] == "점심"
+    assert itinerary[1]["meals"][0]["meal_type"] == "저녁"
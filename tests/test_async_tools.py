@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+import asyncio
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools import WeatherTool
+from tools.async_support import run_in_thread
+
+class SlowWeatherTool(WeatherTool):
+    """동기 구현이 0.2초 걸리는 테스트용 도구"""
+    def _run(self, query: str) -> str:
+        time.sleep(0.2)
+        return f"날씨: {query}"
+
+def test_tool_arun_does_not_block_event_loop():
+    tool = SlowWeatherTool()
+
+    async def run_all():
+        started = time.perf_counter()
+        results = await asyncio.gather(*(tool._arun(city) for city in ("파리", "로마", "도쿄")))
+        return results, time.perf_counter() - started
+
+    results, elapsed = asyncio.run(run_all())
+    assert results == ["날씨: 파리", "날씨: 로마", "날씨: 도쿄"]
+    # 순차 실행이면 0.6초 이상
+    assert elapsed < 0.45
+
+def test_run_in_thread_returns_result():
+    assert asyncio.run(run_in_thread(lambda a, b: a + b, 1, 2)) == 3
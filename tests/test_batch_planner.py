@@ -0,0 +1,69 @@
+import os
+import sys
+import json
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch_planner
+
+class RecordingCoordinator:
+    """요청받은 목적지를 기록하고, 지정된 목적지는 실패시키는 테스트용 Coordinator"""
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.destinations = []
+
+    def plan_travel(self, user_input, callbacks=None):
+        self.destinations.append(user_input["destination"])
+        if user_input["destination"] in self.failing:
+            return {"type": "error", "status": "error", "message": "LLM 호출 실패"}
+        return {"type": "text_response", "status": "success", "content": f"{user_input['destination']} 일정"}
+
+def write_requests(path, rows):
+    path.write_text("\n".join(json.dumps(row, ensure_ascii=False) for row in rows) + "\n", encoding="utf-8")
+
+def test_load_requests_accepts_flat_and_nested_inputs(tmp_path):
+    source = tmp_path / "requests.jsonl"
+    write_requests(source, [
+        {"id": "paris", "destination": "파리", "duration": 5},
+        {"request_id": "rome", "input": {"destination": "로마"}},
+        {"destination": "도쿄"},
+    ])
+
+    assert batch_planner.load_requests(str(source)) == [
+        ("paris", {"destination": "파리", "duration": 5}),
+        ("rome", {"destination": "로마"}),
+        ("line-3", {"destination": "도쿄"}),
+    ]
+
+def test_run_batch_resumes_from_checkpoint(tmp_path, monkeypatch):
+    source, output = tmp_path / "requests.jsonl", tmp_path / "results.jsonl"
+    write_requests(source, [
+        {"id": "paris", "destination": "파리"},
+        {"id": "rome", "destination": "로마"},
+        {"id": "tokyo", "destination": "도쿄"},
+    ])
+
+    first = RecordingCoordinator(failing={"로마"})
+    monkeypatch.setattr(batch_planner, "build_coordinator", lambda demo: first)
+    summary = batch_planner.run_batch(str(source), str(output), concurrency=2)
+    assert (summary["succeeded"], summary["failed"]) == (2, 1)
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert {record["request_id"]: record["status"] for record in records} == \
+        {"paris": "success", "rome": "error", "tokyo": "success"}
+    assert all(record["latency_ms"] >= 0 and "tokens" in record["metrics"] for record in records)
+
+    # 다시 실행하면 처리된 요청은 건너뛰고, retry_failed이면 실패한 요청만 다시 처리
+    second = RecordingCoordinator()
+    monkeypatch.setattr(batch_planner, "build_coordinator", lambda demo: second)
+    assert batch_planner.run_batch(str(source), str(output))["skipped"] == 3
+    summary = batch_planner.run_batch(str(source), str(output), retry_failed=True)
+    assert second.destinations == ["로마"]
+    assert (summary["skipped"], summary["succeeded"]) == (2, 1)
+
+    # 다시 처리한 요청은 이전 실패 기록을 대체해 요청 ID마다 한 줄만 남음
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 3
+    assert {record["request_id"]: record["status"] for record in records} == \
+        {"paris": "success", "rome": "success", "tokyo": "success"}
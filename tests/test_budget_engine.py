@@ -0,0 +1,73 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.budget_engine import CostTable, estimate_budget, load_cost_table, resolve_tier
+from components.cost_engine import FXRates
+
+ROWS = [
+    {"destination": "파리", "aliases": "paris", "currency": "EUR", "tier": "보통",
+     "lodging_per_room_night": "100", "food_per_person_day": "50", "transport_per_person_day": "10",
+     "activities_per_person_day": "30", "misc_per_person_day": "10"},
+    {"destination": "파리", "aliases": "paris", "currency": "EUR", "tier": "고급",
+     "lodging_per_room_night": "200", "food_per_person_day": "80", "transport_per_person_day": "15",
+     "activities_per_person_day": "50", "misc_per_person_day": "15"},
+    {"destination": "기본", "aliases": "", "currency": "USD", "tier": "보통",
+     "lodging_per_room_night": "80", "food_per_person_day": "40", "transport_per_person_day": "10",
+     "activities_per_person_day": "20", "misc_per_person_day": "10"},
+]
+
+def test_bundled_table_covers_every_tier():
+    table = load_cost_table()
+    assert load_cost_table() is table
+    for tier in ("저예산", "보통", "고급", "럭셔리"):
+        assert table.lookup("파리, 프랑스", tier)[0] == "파리"
+        assert table.lookup("어딘가", tier)[0] == "기본"
+
+def test_match_destination_ignores_partial_words():
+    table = load_cost_table()
+    assert table.match_destination("로마에서 4일") == "로마"
+    assert table.match_destination("Rome, Italy") == "로마"
+    assert table.match_destination("Jerome") is None
+    assert table.match_destination("로마네스크 성당 투어") is None
+    assert table.match_destination("파리지앵 카페") is None
+
+def test_resolve_tier():
+    assert resolve_tier("고급 (100-200만원)") == "고급"
+    assert resolve_tier("알 수 없음") == "보통"
+
+def test_estimate_scales_with_group_and_accommodation():
+    table = CostTable(ROWS)
+    single = estimate_budget("Paris", 3, "보통 (50-100만원)", group_size=1, table=table)
+    assert single["matched_destination"] == "파리"
+    assert single["currency"] == "EUR"
+    assert single["nights"] == 2
+    assert single["breakdown"] == {"숙박": 200, "식비": 150, "교통": 30, "액티비티": 90, "기타": 30}
+    assert single["total"] == 500
+
+    # 호텔은 2인 1실, 호스텔은 1인 1침대(숙박비 0.35배)
+    group = estimate_budget("파리", 3, "보통", group_size=3, accommodation_type="호텔", table=table)
+    assert group["rooms"] == 2
+    assert group["breakdown"]["숙박"] == 100 * 2 * 2
+    assert group["breakdown"]["식비"] == 50 * 3 * 3
+    hostel = estimate_budget("파리", 3, "보통", group_size=3, accommodation_type="호스텔", table=table)
+    assert hostel["breakdown"]["숙박"] == 100 * 0.35 * 3 * 2
+
+    assert estimate_budget("파리", 3, "고급 (100-200만원)", table=table)["total"] > single["total"]
+
+def test_estimate_compares_per_person_budget():
+    table = CostTable(ROWS)
+    fx = FXRates({"EUR": 1500, "USD": 1300}, base="KRW")
+    estimate = estimate_budget("파리", 3, "보통 (50-100만원)", table=table, fx_rates=fx)
+    assert estimate["budget"]["per_person_estimate"] == 500 * 1500
+    assert estimate["budget"]["within_budget"] is True
+
+    over = estimate_budget("파리", 3, "저예산 (50만원 이하)", table=table, fx_rates=fx)
+    assert over["budget"]["low"] == 0
+    assert over["budget"]["within_budget"] is False
+
+    unlimited = estimate_budget("파리", 30, "럭셔리 (200만원 이상)", table=table, fx_rates=fx)
+    assert unlimited["budget"]["high"] is None
+    assert unlimited["budget"]["within_budget"] is True
@@ -0,0 +1,107 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config.config as config
+
+def test_fingerprint_reparses_dotenv_only_when_file_changes(tmp_path, monkeypatch):
+    env_path = tmp_path / ".env"
+    env_path.write_text('PLANNING_MODE="react"\n', encoding="utf-8")
+    monkeypatch.setattr(config, "_dotenv_cache", {"path": str(env_path), "checked_at": 0.0, "stamp": None, "values": {}})
+
+    parsed = []
+    original = config.dotenv_values
+    monkeypatch.setattr(config, "dotenv_values", lambda path: parsed.append(path) or original(path))
+
+    first = config.get_config_fingerprint()
+    assert config.get_config_fingerprint() == first
+    assert len(parsed) == 1
+
+    env_path.write_text('PLANNING_MODE="parallel"\n', encoding="utf-8")
+    os.utime(env_path, ns=(env_path.stat().st_atime_ns, env_path.stat().st_mtime_ns + 1_000_000))
+    assert config.get_config_fingerprint() != first
+    assert len(parsed) == 2
+
+def test_coordinator_reads_settings_from_reloaded_module(monkeypatch):
+    from agents.coordinator import TravelCoordinatorAgent
+
+    monkeypatch.setattr(config, "PLAN_CACHE_ENABLED", False)
+    monkeypatch.setattr(config, "PLANNING_MODE", "parallel")
+    assert TravelCoordinatorAgent(None, []).planning_mode == "parallel"
+    monkeypatch.setattr(config, "PLANNING_MODE", "react")
+    assert TravelCoordinatorAgent(None, []).planning_mode == "react"
+
+def test_reload_config_drops_keys_removed_from_dotenv(tmp_path, monkeypatch):
+    env_path = tmp_path / ".env"
+    env_path.write_text('PLANNING_MODE="parallel"\nTEST_ONLY_SETTING="1"\n', encoding="utf-8")
+    monkeypatch.setattr("dotenv.find_dotenv", lambda *args, **kwargs: str(env_path))
+    monkeypatch.setattr(config, "find_dotenv", lambda *args, **kwargs: str(env_path))
+    monkeypatch.setattr(config, "_dotenv_applied", {})
+    monkeypatch.delenv("PLANNING_MODE", raising=False)
+    monkeypatch.delenv("TEST_ONLY_SETTING", raising=False)
+
+    config.reload_config()
+    assert (config.PLANNING_MODE, os.environ["TEST_ONLY_SETTING"]) == ("parallel", "1")
+
+    # .env에서 지운 설정은 기본값으로 돌아감
+    env_path.write_text("", encoding="utf-8")
+    config.reload_config()
+    assert config.PLANNING_MODE == "react"
+    assert "TEST_ONLY_SETTING" not in os.environ
+
+def test_registry_builds_resources_outside_global_lock(monkeypatch):
+    import threading
+    from components.resource_registry import ResourceRegistry
+
+    monkeypatch.setattr(config, "get_config_fingerprint", lambda: "fixed")
+    registry = ResourceRegistry()
+    barrier = threading.Barrier(2, timeout=2)
+    built = []
+
+    def factory(name):
+        # 두 리소스가 동시에 생성 중이어야 barrier를 통과
+        barrier.wait()
+        built.append(name)
+        return name
+
+    results = {}
+    threads = [
+        threading.Thread(target=lambda name=name: results.update({name: registry.get(name, lambda: factory(name))}))
+        for name in ("llm", "tools")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {"llm": "llm", "tools": "tools"}
+    assert registry.get("llm", lambda: factory("again")) == "llm"
+    assert sorted(built) == ["llm", "tools"]
+
+def test_registry_keeps_job_manager_across_config_changes(monkeypatch):
+    from components.resource_registry import ResourceRegistry
+
+    class FakeJobManager:
+        def __init__(self):
+            self.stopped = False
+
+        def shutdown(self, wait=False):
+            self.stopped = True
+
+    fingerprint = ["a"]
+    monkeypatch.setattr(config, "get_config_fingerprint", lambda: fingerprint[0])
+    monkeypatch.setattr(config, "reload_config", lambda: None)
+    registry = ResourceRegistry()
+    job_manager = registry.get("job_manager", FakeJobManager)
+    llm = registry.get("llm", object)
+
+    # 설정이 바뀌면 LLM은 다시 만들지만 작업 관리자(실행 중인 작업, 워커 풀)는 유지
+    fingerprint[0] = "b"
+    assert registry.get("llm", object) is not llm
+    assert registry.get("job_manager", FakeJobManager) is job_manager
+    assert not job_manager.stopped
+
+    registry.invalidate()
+    assert job_manager.stopped
@@ -0,0 +1,88 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.context_budget import (
+    ContextBudget, TokenCounter, _load_encoding, approximate_tokens, dedupe_chunks, saved_tokens
+)
+from components.hybrid_retriever import RetrievedChunk
+
+PARIS = "[프랑스 > 파리]\n에펠탑은 파리의 상징입니다.\n루브르 박물관은 월요일이 아닌 화요일에 휴관합니다.\n센 강 유람선은 저녁에 인기가 많습니다."
+
+def chunk(text: str, chunk_id: str) -> RetrievedChunk:
+    return RetrievedChunk(chunk_id, text, {})
+
+def test_approximate_tokens_counts_hangul_per_character():
+    assert approximate_tokens("") == 0
+    assert approximate_tokens("파리 여행") == 4
+    assert approximate_tokens("Paris travel") == 2 + 2
+
+def test_token_counter_loads_encoding_once_without_downloading(tmp_path, monkeypatch):
+    # 비어 있는 캐시 디렉토리 - 인코딩 파일을 내려받지 않고 근사로 대체해야 함
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+    _load_encoding.cache_clear()
+    try:
+        counter = TokenCounter("o200k_base")
+        assert not counter.exact
+        assert counter.count("파리 여행") == approximate_tokens("파리 여행")
+        assert list(tmp_path.iterdir()) == []
+
+        TokenCounter("o200k_base")
+        assert _load_encoding.cache_info().hits == 1
+    finally:
+        _load_encoding.cache_clear()
+
+def test_dedupe_keeps_first_of_near_duplicates():
+    chunks = [chunk(PARIS, "a"), chunk(PARIS + "\n센 강", "b"), chunk("[스위스 > 취리히]\n취리히 호수", "c")]
+    assert [kept.id for kept in dedupe_chunks(chunks)] == ["a", "c"]
+
+def test_pack_chunks_respects_context_budget_and_reports_savings():
+    budget = ContextBudget(context_tokens=40)
+    report = {}
+    context = budget.pack_chunks([chunk(PARIS, "a"), chunk(PARIS, "b"), chunk("로마 콜로세움 " * 20, "c")], report)
+
+    assert budget.count(context) <= 40
+    assert context.startswith("[프랑스 > 파리]")
+    assert report["rag_tokens_after"] < report["rag_tokens_before"]
+    assert saved_tokens(report) == report["rag_tokens_before"] - report["rag_tokens_after"]
+
+def test_truncate_prefers_line_boundaries():
+    counter = TokenCounter()
+    truncated = counter.truncate(PARIS, counter.count(PARIS) - 5)
+    assert truncated.endswith("…")
+    assert truncated[:-1] in PARIS
+    assert truncated[:-1].endswith("휴관합니다.")
+    assert counter.truncate(PARIS, 10_000) == PARIS
+
+def test_fit_shares_remaining_budget_between_sections():
+    budget = ContextBudget(max_tokens=120)
+
+    def render(sections):
+        return "지시문\n" + "\n".join(f"[{name}]\n{text}" for name, text in sections.items())
+
+    sections = {"context": "맥락 " * 200, "tool:weather": "맑음", "tool:food": "음식 " * 200}
+    report = {}
+    prompt = budget.fit(render, sections, report)
+
+    assert report["prompt_tokens"] <= 120
+    assert report["trimmed_tokens"] > 0
+    # 짧은 섹션은 그대로, 긴 섹션은 비슷한 몫으로 잘림
+    assert "[tool:weather]\n맑음" in prompt
+    assert prompt.index("[context]") < prompt.index("[tool:food]")
+
+def test_fit_without_limit_returns_prompt_unchanged():
+    report = {}
+    prompt = ContextBudget().fit(lambda sections: "요청\n" + sections["context"], {"context": PARIS}, report)
+    assert prompt == "요청\n" + PARIS
+    assert report["trimmed_tokens"] == 0
+
+def test_fit_reports_when_fixed_part_exceeds_budget():
+    budget = ContextBudget(max_tokens=10)
+    report = {}
+    prompt = budget.fit(lambda sections: "지시문 " * 20 + sections["context"], {"context": PARIS}, report)
+
+    # 가변 섹션은 모두 비우고, 남은 초과분을 보고
+    assert prompt == "지시문 " * 20
+    assert report["over_budget_tokens"] == report["prompt_tokens"] - 10 > 0
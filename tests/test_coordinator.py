@@ -1,12 +1,16 @@
 import os
 import sys
+import queue
+import asyncio
 import pytest
 from datetime import date, timedelta
 
 # Add the project root directory to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from agents.callbacks import PlanEventQueueHandler
 from agents.coordinator import TravelCoordinatorAgent
+from components.plan_cache import PlanCache
 
 # Mock LLM and tools for testing purposes
 class MockLLM:
@@ -36,6 +40,11 @@ class MockTools:
     def __init__(self):
         pass
 
+@pytest.fixture(autouse=True)
+def disable_default_plan_cache(monkeypatch):
+    # 테스트가 작업 디렉토리의 ./cache에 결과를 남기지 않도록 기본 캐시 비활성화
+    monkeypatch.setattr("config.config.PLAN_CACHE_ENABLED", False)
+
 @pytest.fixture
 def coordinator_agent():
     llm = MockLLM()
@@ -65,4 +74,134 @@ def test_parse_free_form_text(coordinator_agent):
     # Test date generation for parsed itinerary (should be dynamic)
     today = date.today()
     assert itinerary[0]['date'] == today.strftime("%Y-%m-%d")
-    assert itinerary[1]['date'] == (today + timedelta(days=1)).strftime("%Y-%m-%d") 
\ No newline at end of file
+    assert itinerary[1]['date'] == (today + timedelta(days=1)).strftime("%Y-%m-%d") 
+
+class EchoTool:
+    """입력을 그대로 돌려주는 테스트용 도구"""
+    def __init__(self, name):
+        self.name = name
+
+    def run(self, query):
+        return f"{self.name} 결과: {query}"
+
+    async def arun(self, query):
+        return self.run(query)
+
+class SynthesisLLM:
+    """종합 프롬프트를 기록하고 고정된 최종 답변을 반환하는 테스트용 LLM"""
+    def __init__(self):
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return "Final Answer: ## 📅 여행 일정\n\n### Day 1: 파리 도착"
+
+    async def ainvoke(self, prompt):
+        return self.invoke(prompt)
+
+def test_parallel_planning_uses_single_synthesis_call():
+    tool_names = [
+        "search_destination", "get_weather", "search_accommodation", "search_restaurants",
+        "get_transportation", "calculate_budget", "optimize_itinerary"
+    ]
+    agent = TravelCoordinatorAgent(None, [EchoTool(name) for name in tool_names], planning_mode="parallel")
+    agent.llm = SynthesisLLM()
+
+    result = agent.plan_travel({
+        'destination': '파리',
+        'duration': 3,
+        'activities': ['맛집 탐방'],
+        'food_preferences': ['현지 음식']
+    })
+
+    assert result['type'] == 'text_response'
+    assert result['content'].startswith("## 📅 여행 일정")
+    assert len(agent.llm.prompts) == 1
+    for name in tool_names:
+        assert f"[{name}]" in agent.llm.prompts[0]
+    assert "optimize_itinerary 결과: 파리, 3일, 맛집 탐방" in agent.llm.prompts[0]
+
+def test_async_parallel_planning_matches_sync_path():
+    agent = TravelCoordinatorAgent(None, [EchoTool("search_destination"), EchoTool("get_weather")], planning_mode="parallel")
+    agent.llm = SynthesisLLM()
+    user_input = {'destination': '로마', 'duration': 2}
+
+    sync_result = agent.plan_travel(user_input)
+    async_result = asyncio.run(agent.aplan_travel(user_input))
+
+    assert async_result == sync_result
+    assert agent.llm.prompts[0] == agent.llm.prompts[1]
+
+def test_plan_travel_serves_repeated_request_from_cache(tmp_path):
+    cache = PlanCache(str(tmp_path / "plan_cache.sqlite3"))
+    agent = TravelCoordinatorAgent(None, [EchoTool("search_destination")], planning_mode="parallel", plan_cache=cache)
+    agent.llm = SynthesisLLM()
+
+    first = agent.plan_travel({'destination': '파리', 'duration': 5, 'activities': ['맛집 탐방', '쇼핑']})
+    second = agent.plan_travel({'destination': ' 파리 ', 'duration': 5, 'activities': ['쇼핑', '맛집 탐방']})
+
+    assert second == first
+    assert len(agent.llm.prompts) == 1
+    assert cache.stats()['exact_hits'] == 1
+
+def test_event_handler_streams_only_final_answer_tokens():
+    events = queue.Queue()
+    handler = PlanEventQueueHandler(events)
+
+    handler.on_chat_model_start({}, [], run_id="llm-1")
+    for token in ["Thought: 날씨", " 확인\nAction: get_weather", "\n"]:
+        handler.on_llm_new_token(token)
+    handler.on_tool_start({"name": "get_weather"}, "파리", run_id="tool-1")
+    handler.on_tool_end("맑음", run_id="tool-1")
+
+    handler.on_chat_model_start({}, [], run_id="llm-2")
+    for token in ["Thought: 완료\nFinal", " Answer: ## 📅", " 여행 일정"]:
+        handler.on_llm_new_token(token)
+
+    received = [events.get_nowait() for _ in range(events.qsize())]
+    observation = received[1]
+    assert received[0] == {"type": "step", "tool": "get_weather", "input": "파리"}
+    assert (observation["type"], observation["tool"], observation["output"], observation["error"]) == \
+        ("observation", "get_weather", "맑음", False)
+    assert observation["elapsed_ms"] >= 0
+    assert received[2:] == [
+        {"type": "token", "text": "## 📅"},
+        {"type": "token", "text": " 여행 일정"},
+    ]
+
+class UsageResult:
+    """token_usage를 보고하는 LLMResult 대용 객체"""
+    llm_output = {"token_usage": {"prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150}}
+    generations = []
+
+def test_event_handler_reports_per_step_metrics():
+    handler = PlanEventQueueHandler(queue.Queue())
+
+    # 병렬 모드처럼 두 도구가 겹쳐서 실행되어도 run_id별로 시간을 측정
+    handler.on_tool_start({"name": "get_weather"}, "파리", run_id="a")
+    handler.on_tool_start({"name": "search_restaurants"}, "파리", run_id="b")
+    handler.on_tool_error(RuntimeError("timeout"), run_id="b")
+    handler.on_tool_end("맑음", run_id="a")
+    handler.on_llm_start({}, ["prompt"], run_id="llm")
+    handler.on_llm_end(UsageResult(), run_id="llm")
+
+    metrics = handler.metrics()
+    assert [(timing["tool"], timing["error"]) for timing in metrics["tools"]] == \
+        [("search_restaurants", True), ("get_weather", False)]
+    assert metrics["llm_calls"] == 1
+    assert metrics["tokens"] == {"prompt_tokens": 120, "completion_tokens": 30, "total_tokens": 150}
+
+def test_event_handler_reads_usage_from_streamed_chunks():
+    from langchain_core.messages import AIMessageChunk
+    from langchain_core.outputs import ChatGenerationChunk, LLMResult
+
+    # stream_usage=True로 스트리밍하면 llm_output 없이 마지막 청크의 usage_metadata에 사용량이 담김
+    chunk = AIMessageChunk(content="Final Answer: 완료")
+    chunk += AIMessageChunk(content="", usage_metadata={"input_tokens": 80, "output_tokens": 20, "total_tokens": 100})
+    result = LLMResult(generations=[[ChatGenerationChunk(message=chunk)]], llm_output=None)
+
+    handler = PlanEventQueueHandler(queue.Queue())
+    handler.on_chat_model_start({}, [], run_id="llm")
+    handler.on_llm_end(result, run_id="llm")
+
+    assert handler.metrics()["tokens"] == {"prompt_tokens": 80, "completion_tokens": 20, "total_tokens": 100}
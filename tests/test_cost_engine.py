@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+import math
+import time
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.cost_engine import CostAmount, FXRates, DEFAULT_FX_RATES, parse_cost
+
+def test_parse_cost_formats():
+    assert parse_cost("€26") == CostAmount(26, 26, "EUR")
+    assert parse_cost("€25-35") == CostAmount(25, 35, "EUR")
+    assert parse_cost("₩1,500,000") == CostAmount(1500000, 1500000, "KRW")
+    assert parse_cost("보통 (50-100만원)") == CostAmount(500000, 1000000, "KRW")
+    assert parse_cost("¥3000") == CostAmount(3000, 3000, "JPY")
+    assert parse_cost("USD 12.5") == CostAmount(12.5, 12.5, "USD")
+    assert parse_cost("30 유로") == CostAmount(30, 30, "EUR")
+
+def test_parse_cost_prefers_amount_with_currency():
+    # "1박"의 숫자보다 통화가 붙은 금액을 사용
+    assert parse_cost("1박 €120") == CostAmount(120, 120, "EUR")
+    assert parse_cost("입장료 2인 기준 €40") == CostAmount(40, 40, "EUR")
+
+def test_parse_cost_reads_k_suffix():
+    assert parse_cost("15k", default_currency="USD") == CostAmount(15000, 15000, "USD")
+    assert parse_cost("€10-15k") == CostAmount(10000, 15000, "EUR")
+    assert parse_cost("15 km") is None
+
+def test_parse_cost_ignores_bare_numbers_outside_cost_context():
+    # 통화 표시 없는 숫자는 값 전체가 금액이거나 비용을 뜻하는 말 뒤에 있을 때만 금액
+    assert parse_cost("12시 출발", default_currency="EUR") is None
+    assert parse_cost("12:00-13:00", default_currency="EUR") is None
+    assert parse_cost("2인 기준 40", default_currency="EUR") is None
+    assert parse_cost("25-35", default_currency="EUR") == CostAmount(25, 35, "EUR")
+    assert parse_cost("입장료 40", default_currency="EUR") == CostAmount(40, 40, "EUR")
+    assert parse_cost("약 30 정도", default_currency="EUR") == CostAmount(30, 30, "EUR")
+
+def test_parse_cost_free_and_unknown():
+    assert parse_cost("무료") == CostAmount(0, 0, None)
+    assert parse_cost("변동") is None
+    assert parse_cost(None) is None
+
+def test_fx_rates_convert_and_rebase():
+    rates = FXRates({"EUR": 1500, "USD": 1300}, base="KRW")
+    assert rates.convert(2, "EUR", "KRW") == 3000
+    assert rates.convert(1300, "KRW", "USD") == 1
+    assert math.isnan(rates.rate("THB", "KRW"))
+    assert math.isnan(rates.rate(None, "KRW"))
+    assert rates.rate_vector(["EUR", "KRW", "EUR"], "KRW").tolist() == [1500, 1, 1500]
+
+    in_euro = rates.rebase("EUR")
+    assert in_euro.base == "EUR"
+    assert in_euro.convert(1500, "KRW", "EUR") == 1
+
+def test_load_uses_fresh_cache_without_fetching(tmp_path):
+    cache_path = str(tmp_path / "fx.json")
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"base": "KRW", "rates": {"EUR": 1400}, "fetched_at": time.time()}, f)
+
+    def fail(url):
+        raise AssertionError("캐시가 유효하면 조회하지 않아야 함")
+
+    rates = FXRates.load(cache_path, url="http://example.invalid", fetcher=fail)
+    assert rates.rates["EUR"] == 1400
+
+def test_load_refreshes_stale_cache_and_falls_back(tmp_path):
+    cache_path = str(tmp_path / "cache" / "fx.json")
+
+    # 캐시 없음 + URL 없음 → 기본 근사값
+    assert FXRates.load(cache_path).rates["EUR"] == DEFAULT_FX_RATES["EUR"]
+
+    # 조회 결과(1 KRW당 통화 금액)를 뒤집어 저장
+    rates = FXRates.load(cache_path, url="http://fx", fetcher=lambda url: {"rates": {"EUR": 0.0005}})
+    assert rates.rates["EUR"] == 2000
+    assert os.path.exists(cache_path)
+
+    # 만료된 캐시 + 조회 실패 → 오래된 캐시 사용
+    def fail(url):
+        raise OSError("network down")
+
+    stale = FXRates.load(cache_path, ttl_seconds=0, url="http://fx", fetcher=fail)
+    assert stale.rates["EUR"] == 2000
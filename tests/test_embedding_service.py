@@ -0,0 +1,92 @@
+import os
+import sys
+import pytest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.embedding_service import CachedEmbeddings
+
+class RateLimitError(Exception):
+    status_code = 429
+
+class AuthenticationError(Exception):
+    status_code = 401
+
+class CountingEmbeddings:
+    """요청된 배치를 기록하는 테스트용 임베딩 모델"""
+    def __init__(self, fail_times=0, error=RateLimitError, fail_texts=()):
+        self.batches = []
+        self.queries = []
+        self.fail_times = fail_times
+        self.error = error
+        self.fail_texts = set(fail_texts)
+
+    def embed_documents(self, texts):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise self.error("rate limited")
+        if self.fail_texts & set(texts):
+            raise self.error("bad batch")
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text):
+        self.queries.append(text)
+        return [float(len(text)), 0.5]
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "embedding_cache.sqlite3")
+
+def test_documents_are_batched_deduplicated_and_cached(cache_path):
+    base = CountingEmbeddings()
+    embeddings = CachedEmbeddings(base, cache_path, batch_size=2, max_workers=2)
+
+    texts = ["a", "bb", "ccc", "a", "dddd"]
+    vectors = embeddings.embed_documents(texts)
+
+    assert [vector[0] for vector in vectors] == [1.0, 2.0, 3.0, 1.0, 4.0]
+    assert sorted(len(batch) for batch in base.batches) == [2, 2]
+
+    # 캐시 파일은 재시작 후에도 재사용됨
+    reopened = CachedEmbeddings(base, cache_path, batch_size=2)
+    assert reopened.embed_documents(["dddd", "eeeee"])[0][0] == 4.0
+    assert base.batches[-1] == ["eeeee"]
+
+def test_query_embedding_hits_api_once(cache_path):
+    base = CountingEmbeddings()
+    embeddings = CachedEmbeddings(base, cache_path)
+
+    first = embeddings.embed_query("파리 여행 정보")
+    second = embeddings.embed_query("파리 여행 정보")
+
+    assert first == second
+    assert base.queries == ["파리 여행 정보"]
+
+def test_failed_batches_are_retried(cache_path):
+    base = CountingEmbeddings(fail_times=2)
+    embeddings = CachedEmbeddings(base, cache_path, max_retries=3, retry_base_delay=0)
+
+    assert embeddings.embed_documents(["x"]) == [[1.0, 1.0]]
+    assert embeddings.api_calls == 3
+
+def test_non_transient_errors_are_not_retried(cache_path):
+    base = CountingEmbeddings(fail_times=1, error=AuthenticationError)
+    embeddings = CachedEmbeddings(base, cache_path, max_retries=3, retry_base_delay=0)
+
+    with pytest.raises(AuthenticationError):
+        embeddings.embed_documents(["x"])
+    assert embeddings.api_calls == 1
+
+def test_successful_batches_are_cached_when_another_batch_fails(cache_path):
+    base = CountingEmbeddings(error=AuthenticationError, fail_texts=["bad"])
+    embeddings = CachedEmbeddings(base, cache_path, batch_size=1, max_workers=3, retry_base_delay=0)
+
+    with pytest.raises(AuthenticationError):
+        embeddings.embed_documents(["a", "bad", "ccc"])
+
+    # 성공한 배치는 저장되어 다시 요청하지 않음
+    base.fail_texts.clear()
+    assert embeddings.embed_documents(["a", "ccc"]) == [[1.0, 1.0], [3.0, 1.0]]
+    assert sorted(batch[0] for batch in base.batches) == ["a", "ccc"]
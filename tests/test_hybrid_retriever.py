@@ -0,0 +1,88 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.hybrid_retriever import (
+    BM25Index, HybridRetriever, RetrievedChunk, reciprocal_rank_fusion, tokenize
+)
+
+class Doc:
+    def __init__(self, page_content, **metadata):
+        self.page_content = page_content
+        self.metadata = metadata
+
+DOCS = [
+    Doc("취리히는 스위스 금융 중심지입니다. 취리히 호수와 구시가지.", chunk_hash="zurich", city="취리히", country="스위스"),
+    Doc("제네바는 UN 유럽 본부가 있는 도시입니다. 제트 분수.", chunk_hash="geneva", city="제네바", country="스위스"),
+    Doc("루체른의 카펠교와 빈사의 사자상.", chunk_hash="lucerne", city="루체른", country="스위스"),
+    Doc("짐 꾸리기: 가볍게 짐을 꾸리세요.", chunk_hash="packing"),
+]
+
+class RecordingVectorStore:
+    """고정 순위를 돌려주고 받은 필터를 기록하는 테스트용 vectorstore"""
+
+    def __init__(self, order):
+        self.order = order
+        self.filters = []
+
+    def similarity_search(self, query, k=4, filter=None):
+        self.filters.append(filter)
+        by_id = {doc.metadata["chunk_hash"]: doc for doc in DOCS}
+        return [by_id[chunk_id] for chunk_id in self.order][:k]
+
+def test_tokenize_uses_hangul_bigrams():
+    assert tokenize("파리의 Louvre") == ["파리", "리의", "louvre"]
+    assert "취리" in tokenize("취리히에서")
+
+def test_bm25_ranks_korean_names_and_filters(tmp_path):
+    index = BM25Index.from_documents(DOCS)
+    assert index.search("취리히에서 볼거리")[0].id == "zurich"
+    assert [chunk.id for chunk in index.search("스위스 도시", filters={"city": "제네바"})] == ["geneva"]
+    assert index.metadata_values("city") == ["루체른", "제네바", "취리히"]
+
+    path = str(tmp_path / "bm25.json")
+    index.save(path)
+    loaded = BM25Index.load(path)
+    assert [chunk.id for chunk in loaded.search("카펠교")] == ["lucerne"]
+    assert BM25Index.load(str(tmp_path / "missing.json")) is None
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["b", "c", "a"]], k=60)
+    assert [chunk_id for chunk_id, _ in fused] == ["b", "a", "c"]
+    assert fused[0][1] == 1 / 62 + 1 / 61
+
+def test_hybrid_retriever_fuses_and_passes_filters():
+    vectorstore = RecordingVectorStore(["geneva", "zurich", "lucerne"])
+    retriever = HybridRetriever(vectorstore, BM25Index.from_documents(DOCS))
+
+    results = retriever.retrieve("취리히 호수", k=2)
+    assert results[0].id == "zurich"
+    assert all(isinstance(chunk, RetrievedChunk) for chunk in results)
+
+    filters = retriever.destination_filters("취리히, 스위스")
+    assert filters == {"city": ["취리히"]}
+    retriever.retrieve("여행 정보", k=2, filters=filters)
+    assert vectorstore.filters[-1] == {"city": {"$in": ["취리히"]}}
+    assert retriever.destination_filters("도쿄") is None
+
+def test_destination_filters_match_whole_names_only():
+    docs = DOCS + [
+        Doc("로마의 콜로세움.", chunk_hash="rome", city="로마", city_alias="Rome", country="이탈리아"),
+        Doc("뉴욕 센트럴 파크.", chunk_hash="nyc", city="뉴욕", city_alias="New York", country="미국"),
+    ]
+    retriever = HybridRetriever(bm25_index=BM25Index.from_documents(docs))
+
+    # 조사가 붙은 이름과 여러 단어 별칭은 맞추고, 다른 단어의 일부인 이름은 무시
+    assert retriever.destination_filters("취리히에서 3일") == {"city": ["취리히"]}
+    assert retriever.destination_filters("new  york city") == {"city_alias": ["New York"]}
+    assert retriever.destination_filters("Romeo and Juliet tour, Verona") is None
+    assert retriever.destination_filters("로마네스크 성당 투어") is None
+    assert retriever.destination_filters("미국인 친구와 여행") is None
+
+def test_bm25_only_retriever_works_without_vectorstore():
+    retriever = HybridRetriever(bm25_index=BM25Index.from_documents(DOCS))
+    assert retriever.available
+    assert retriever.retrieve("짐 꾸리기", k=1)[0].id == "packing"
+    assert not HybridRetriever().available
@@ -0,0 +1,108 @@
+import os
+import sys
+
+import pytest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data.ingest_data as ingest
+
+PARIS = "## 프랑스 여행 정보\n### 파리 (Paris)\n에펠탑과 루브르 박물관.\n"
+ROME = "## 이탈리아 여행 정보\n### 로마 (Rome)\n콜로세움과 트레비 분수.\n"
+
+class FakeChroma:
+    """ID별 문서를 기록하는 테스트용 Chroma (인스턴스 간 공유)"""
+    documents = {}
+
+    def __init__(self, persist_directory=None, embedding_function=None):
+        pass
+
+    def delete_collection(self):
+        FakeChroma.documents.clear()
+
+    def delete(self, ids):
+        for chunk_id in ids:
+            FakeChroma.documents.pop(chunk_id)
+
+    def add_documents(self, documents, ids):
+        FakeChroma.documents.update(zip(ids, documents))
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    source = tmp_path / "source"
+    source.mkdir()
+    monkeypatch.setattr(ingest, "MANIFEST_PATH", str(tmp_path / "db" / "manifest.json"))
+    monkeypatch.setattr(ingest, "BM25_INDEX_PATH", str(tmp_path / "db" / "bm25.json"))
+    monkeypatch.setattr(ingest, "LOCAL_INDEX_DIR", str(tmp_path / "db" / "local"))
+    monkeypatch.setattr(ingest, "CHROMA_AVAILABLE", True)
+    monkeypatch.setattr(ingest, "Chroma", FakeChroma)
+    monkeypatch.setattr(ingest, "get_embeddings", lambda: object())
+    FakeChroma.documents = {}
+    return source
+
+def write(path, text):
+    path.write_text(text, encoding="utf-8")
+    # 같은 나노초 안에 다시 쓰더라도 수정 시각이 달라지도록 앞당김
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+def sources_of_stored_chunks():
+    return sorted(os.path.basename(doc.metadata["source"]) for doc in FakeChroma.documents.values())
+
+def test_first_run_adds_every_chunk(workspace):
+    write(workspace / "paris.txt", PARIS)
+    write(workspace / "rome.txt", ROME)
+
+    summary = ingest.ingest_data(str(workspace))
+
+    assert summary == {"added": 2, "deleted": 0}
+    assert sources_of_stored_chunks() == ["paris.txt", "rome.txt"]
+    assert os.path.exists(ingest.BM25_INDEX_PATH)
+
+def test_added_file_only_embeds_new_chunks(workspace):
+    write(workspace / "paris.txt", PARIS)
+    ingest.ingest_data(str(workspace))
+
+    write(workspace / "rome.txt", ROME)
+    assert ingest.ingest_data(str(workspace)) == {"added": 1, "deleted": 0}
+    assert sources_of_stored_chunks() == ["paris.txt", "rome.txt"]
+
+def test_changed_file_replaces_its_chunks(workspace):
+    write(workspace / "paris.txt", PARIS)
+    write(workspace / "rome.txt", ROME)
+    ingest.ingest_data(str(workspace))
+
+    write(workspace / "paris.txt", PARIS + "몽마르트르 언덕.\n")
+    assert ingest.ingest_data(str(workspace)) == {"added": 1, "deleted": 1}
+    assert any("몽마르트르" in doc.page_content for doc in FakeChroma.documents.values())
+    assert sources_of_stored_chunks() == ["paris.txt", "rome.txt"]
+
+def test_deleted_file_removes_its_chunks(workspace):
+    write(workspace / "paris.txt", PARIS)
+    write(workspace / "rome.txt", ROME)
+    ingest.ingest_data(str(workspace))
+
+    os.remove(workspace / "rome.txt")
+    assert ingest.ingest_data(str(workspace)) == {"added": 0, "deleted": 1}
+    assert sources_of_stored_chunks() == ["paris.txt"]
+
+def test_unchanged_run_returns_before_chunking(workspace, monkeypatch):
+    write(workspace / "paris.txt", PARIS)
+    ingest.ingest_data(str(workspace))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("변경이 없으면 청킹/색인 재구축을 하지 않아야 합니다")
+
+    monkeypatch.setattr(ingest, "split_source_file", fail)
+    monkeypatch.setattr(ingest, "build_bm25_index", fail)
+    assert ingest.ingest_data(str(workspace)) == {"added": 0, "deleted": 0}
+
+def test_chroma_unavailable_run_is_synced_later(workspace, monkeypatch):
+    write(workspace / "paris.txt", PARIS)
+    monkeypatch.setattr(ingest, "CHROMA_AVAILABLE", False)
+    ingest.ingest_data(str(workspace))
+    assert FakeChroma.documents == {}
+
+    monkeypatch.setattr(ingest, "CHROMA_AVAILABLE", True)
+    assert ingest.ingest_data(str(workspace)) == {"added": 1, "deleted": 0}
@@ -0,0 +1,87 @@
+import os
+import sys
+import math
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.cost_engine import FXRates
+from components.itinerary_model import ActivityRecord, ItineraryTable
+
+ITINERARY = [
+    {
+        "day": 1,
+        "activities": [
+            {"time": "09:00-11:00", "activity": "에펠탑 방문", "cost": "€26", "category": "기타"},
+            {"time": "14:00-16:00", "activity": "루브르 박물관", "cost": "€17", "category": "문화"},
+        ],
+        "meals": [{"time": "12:00-13:30", "restaurant": "비스트로", "cost": "€25-35", "meal_type": "점심"}],
+        "accommodation": {"name": "Hotel Paris", "cost": "€100-150"},
+    },
+    {
+        "day": 2,
+        "activities": [{"time": "10:00", "activity": "공원 산책", "cost": "무료", "category": "자연"}],
+        "meals": [{"time": "19:00", "restaurant": "야시장", "cost": "변동"}],
+        "accommodation": {},
+    },
+    {"day": 3, "activities": [], "meals": []},
+]
+
+def test_columns_and_numeric_fields():
+    table = ItineraryTable.from_itinerary(ITINERARY)
+    assert table.days.tolist() == [1, 2, 3]
+    assert table.activities["activity"] == ["에펠탑 방문", "루브르 박물관", "공원 산책"]
+    assert table.activities["day"].tolist() == [1, 1, 2]
+    assert table.activities["start_minute"].tolist() == [540, 840, 600]
+    assert math.isnan(table.activities["end_minute"][2])
+    assert table.activities["cost_low"].tolist() == [26, 17, 0]
+    assert table.activities["currency"] == ["EUR", "EUR", ""]
+    assert table.meals["cost_high"][0] == 35
+    assert table.accommodation["name"] == ["Hotel Paris"]
+
+def test_summary_is_computed_from_columns():
+    summary = ItineraryTable.from_itinerary(ITINERARY).summary()
+    assert summary["total_days"] == 3
+    assert summary["total_activities"] == 3
+    assert summary["total_meals"] == 2
+    assert summary["activities_per_day"] == [2, 1, 0]
+    assert summary["meals_per_day"] == [1, 1, 0]
+    assert summary["category_counts"] == {"기타": 1, "문화": 1, "자연": 1}
+
+def test_frame_shares_numeric_columns():
+    table = ItineraryTable.from_itinerary(ITINERARY)
+    frame = table.to_frame("activities")
+    assert list(frame["activity"]) == table.activities["activity"]
+    assert np.shares_memory(frame["cost_low"].to_numpy(), table.activities["cost_low"])
+    assert len(table.to_frame("meals")) == 2
+
+def test_records_are_slotted():
+    record = next(ItineraryTable.from_itinerary(ITINERARY).records())
+    assert isinstance(record, ActivityRecord)
+    assert not hasattr(record, "__dict__")
+    assert record.activity == "에펠탑 방문" and record.start_minute == 540
+
+def test_empty_itinerary():
+    table = ItineraryTable.from_itinerary([])
+    assert table.summary()["total_activities"] == 0
+    assert table.summary()["activities_per_day"] == []
+    assert table.to_frame().empty
+
+def test_cost_summary_converts_and_aggregates():
+    table = ItineraryTable.from_itinerary(ITINERARY)
+    costs = table.cost_summary(FXRates({"EUR": 1500}, base="KRW"))
+    assert costs["currency"] == "KRW"
+    assert costs["by_category"]["활동"] == {"low": 43 * 1500, "high": 43 * 1500}
+    assert costs["by_category"]["식비"] == {"low": 25 * 1500, "high": 35 * 1500}
+    assert costs["by_category"]["숙박"] == {"low": 100 * 1500, "high": 150 * 1500}
+    assert costs["by_day"] == [
+        {"day": 1, "low": 168 * 1500, "high": 228 * 1500},
+        {"day": 2, "low": 0, "high": 0},
+        {"day": 3, "low": 0, "high": 0},
+    ]
+    assert costs["total"] == {"low": 168 * 1500, "high": 228 * 1500}
+    # "변동"은 금액을 알 수 없어 제외
+    assert costs["unpriced"] == 1
+    assert table.cost_summary(FXRates({"EUR": 1500}, base="KRW"), "EUR")["total"]["low"] == 168
@@ -0,0 +1,90 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.itinerary_parser import StreamingItineraryParser, parse_itinerary
+
+RESPONSE = """## 📅 여행 일정
+
+### Day 1: 파리 도착
+**오전 활동:**
+- 시간: 09:00-12:00
+- 활동: 에펠탑 방문
+- 장소: 샹드마르스 공원
+- 비용: €26
+- 교통수단: 지하철
+
+**점심:**
+- 시간: 12:30
+- 식당: 르 프티 클레르
+- 요리: 프랑스 비스트로
+- 비용: €25
+
+**오후 활동:**
+- 시간: 14:00
+- 활동: 루브르 박물관
+- 시간: 16:30
+- 활동: 센강 산책
+
+**숙박:**
+- 숙소명: 호텔 르 마레
+- 유형: 호텔
+- 비용: €150/박
+
+### Day 2: 몽마르트르
+**오전 활동:**
+- 시간: 09:30
+- 활동: 사크레쾨르 대성당
+
+## 💡 추천사항
+- 필수 방문지: 에펠탑, 루브르 박물관
+- 현지인 팁: 뮤지엄 패스 활용
+
+## 💰 총 예상 비용
+약 120-150만원
+
+## 🎒 준비물
+- 편한 신발
+- 우산
+"""
+
+def test_parses_template_into_populated_days():
+    result = parse_itinerary(RESPONSE)
+    day1, day2 = result["itinerary"]
+
+    assert (day1["day"], day1["title"]) == (1, "파리 도착")
+    assert [a["activity"] for a in day1["activities"]] == ["에펠탑 방문", "루브르 박물관", "센강 산책"]
+    assert day1["activities"][0] == {
+        "time": "09:00-12:00", "activity": "에펠탑 방문", "location": "샹드마르스 공원",
+        "cost": "€26", "transportation": "지하철", "slot": "오전 활동",
+    }
+    assert day1["meals"] == [{"time": "12:30", "restaurant": "르 프티 클레르", "cuisine": "프랑스 비스트로", "cost": "€25", "slot": "점심"}]
+    assert day1["accommodation"] == {"name": "호텔 르 마레", "type": "호텔", "cost": "€150/박"}
+    assert [a["activity"] for a in day2["activities"]] == ["사크레쾨르 대성당"]
+
+    assert result["recommendations"]["must_visit"] == ["에펠탑", "루브르 박물관"]
+    assert result["recommendations"]["local_tips"] == ["뮤지엄 패스 활용"]
+    assert result["total_estimated_cost"] == "약 120-150만원"
+    assert result["packing_list"] == ["편한 신발", "우산"]
+
+def test_streaming_emits_day_one_before_day_two_is_complete():
+    parser = StreamingItineraryParser()
+    day2_start = RESPONSE.index("### Day 2")
+    events = []
+    for start in range(0, day2_start + 20, 5):
+        events.extend(parser.feed(RESPONSE[start:min(start + 5, day2_start + 20)]))
+
+    assert [e["type"] for e in events] == ["activity", "meal", "activity", "activity", "accommodation", "day"]
+    assert events[-1]["record"]["day"] == 1
+
+    parser.feed(RESPONSE[day2_start + 20:])
+    parser.close()
+    assert parser.result() == parse_itinerary(RESPONSE)
+
+def test_compact_time_of_day_bullets():
+    text = "#### **Day 1: 서울 도착**\n- **오전**: 경복궁 방문\n- **오후**: 북촌 한옥마을\n"
+
+    day = parse_itinerary(text)["itinerary"][0]
+    assert [(a["time"], a["activity"]) for a in day["activities"]] == [("오전", "경복궁 방문"), ("오후", "북촌 한옥마을")]
@@ -0,0 +1,46 @@
+import os
+import sys
+import json
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.json_extractor import IncrementalJSONExtractor, extract_json_objects, extract_largest_json
+
+PLAN = {"itinerary": [{"day": 1, "activities": [{"activity": "루브르 {특별전}", "note": "\"예약\" 필수"}]}]}
+
+def test_extracts_fenced_json_surrounded_by_braces_in_prose():
+    text = (
+        "설명 {destination} 을 참고하세요.\n```json\n"
+        + json.dumps(PLAN, ensure_ascii=False, indent=2)
+        + "\n```\n추가 메모: {예산} 확인 }"
+    )
+
+    assert extract_largest_json(text) == PLAN
+
+def test_tolerates_trailing_commas_but_keeps_commas_inside_strings():
+    text = '결과: {"itinerary": [{"day": 1, "note": "a,}",},], "total_estimated_cost": "100만원",}'
+
+    assert extract_largest_json(text) == {
+        "itinerary": [{"day": 1, "note": "a,}"}],
+        "total_estimated_cost": "100만원",
+    }
+
+def test_invalid_outer_object_falls_back_to_valid_inner_objects():
+    text = '{잘못된 설명 {"day": 1} 그리고 {"day": 2, "extra": {"x": 1}} 끝'
+
+    assert extract_json_objects(text) == [{"day": 1}, {"day": 2, "extra": {"x": 1}}]
+    assert extract_largest_json(text) == {"day": 2, "extra": {"x": 1}}
+
+def test_incremental_extractor_matches_batch_result_for_any_chunking():
+    text = '앞부분 {"a": 1} 중간 "인용" {"b": {"c": "\\\\ \\" }"}} 뒤'
+    expected = extract_json_objects(text)
+
+    for size in (1, 2, 3, 7):
+        extractor = IncrementalJSONExtractor()
+        streamed = []
+        for start in range(0, len(text), size):
+            streamed.extend(extractor.feed(text[start:start + size]))
+        streamed.extend(extractor.close())
+        assert streamed == expected == [{"a": 1}, {"b": {"c": '\\ " }'}}]
+        assert extractor.largest() == {"b": {"c": '\\ " }'}}
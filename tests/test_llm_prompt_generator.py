@@ -0,0 +1,67 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.llm_prompt_generator import (
+    ALTERNATIVE_INSTRUCTIONS, ITINERARY_PREFIX, STABLE_PREFIX, LLMPromptGenerator
+)
+
+USER_INPUT = {
+    'destination': '파리',
+    'duration': 3,
+    'group_size': 2,
+    'travel_style': '문화',
+    'budget_range': '중간',
+    'activities': ['박물관', '미식'],
+    'food_preferences': ['프랑스 요리'],
+    'additional_notes': '',
+}
+
+def test_travel_prompt_contains_user_input_after_stable_prefix():
+    prompt = LLMPromptGenerator().generate_travel_prompt(USER_INPUT)
+    assert prompt.startswith(ITINERARY_PREFIX)
+    assert '"itinerary": [' in prompt and "{{" not in prompt
+    assert "- 목적지: 파리" in prompt
+    assert "- 선호 활동: 박물관, 미식" in prompt
+    assert "일정은 3일 동안" in prompt
+    assert "추가 요구사항" not in prompt
+
+def test_cache_is_keyed_on_rendered_values():
+    generator = LLMPromptGenerator(cache_size=2)
+    first = generator.generate_travel_prompt(USER_INPUT)
+    # 빈 추가 요구사항은 None과 똑같이 렌더링되므로 캐시 적중
+    assert generator.generate_travel_prompt(dict(USER_INPUT, additional_notes=None)) is first
+
+    # 대소문자/순서만 다른 입력도 프롬프트에 그대로 들어가므로 각자의 값으로 렌더링
+    lower = generator.generate_travel_prompt({'destination': 'paris', 'additional_notes': 'no PORK'})
+    upper = generator.generate_travel_prompt({'destination': 'Paris', 'additional_notes': 'NO pork'})
+    assert "- 목적지: paris" in lower and "- 추가 요구사항: no PORK" in lower
+    assert "- 목적지: Paris" in upper and "- 추가 요구사항: NO pork" in upper
+    reordered = generator.generate_travel_prompt(dict(USER_INPUT, activities=['미식', '박물관']))
+    assert "- 선호 활동: 미식, 박물관" in reordered
+
+    generator.generate_travel_prompt(dict(USER_INPUT, destination='로마'))
+    generator.generate_travel_prompt(dict(USER_INPUT, destination='도쿄'))
+    assert len(generator._cache) == 2
+    assert generator.generate_travel_prompt(USER_INPUT) is not first
+
+def test_alternative_prompts_share_base_prompt():
+    generator = LLMPromptGenerator()
+    base = generator.generate_travel_prompt(USER_INPUT)
+    prompts = generator.generate_alternative_prompts(USER_INPUT)
+
+    assert list(prompts) == list(ALTERNATIVE_INSTRUCTIONS)
+    for alternative_type, prompt in prompts.items():
+        assert prompt.startswith(base)
+        assert prompt.endswith(ALTERNATIVE_INSTRUCTIONS[alternative_type])
+        assert prompt == generator.generate_alternative_prompt(USER_INPUT, alternative_type)
+    assert list(generator.generate_alternative_prompts(USER_INPUT, ["luxury"])) == ["luxury"]
+
+def test_weather_and_local_tips_prompts_share_stable_prefix():
+    generator = LLMPromptGenerator()
+    weather = generator.generate_weather_prompt("파리", 3)
+    tips = generator.generate_local_tips_prompt("파리")
+    assert weather.startswith(STABLE_PREFIX) and "파리의 3일간 여행" in weather
+    assert tips.startswith(STABLE_PREFIX) and "안전 주의사항" in tips
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.hybrid_retriever import BM25Index, HybridRetriever, RetrievedChunk
+from components.local_vector_index import CharNgramVectorizer, LocalVectorIndex
+
+CHUNKS = [
+    RetrievedChunk("zurich", "취리히는 스위스 금융 중심지입니다. 취리히 호수와 구시가지.", {"chunk_hash": "zurich", "city": "취리히", "country": "스위스"}),
+    RetrievedChunk("geneva", "제네바는 UN 유럽 본부가 있는 도시입니다. 제트 분수와 꽃시계.", {"chunk_hash": "geneva", "city": "제네바", "country": "스위스"}),
+    RetrievedChunk("lucerne", "루체른의 카펠교와 빈사의 사자상, 필라투스 산.", {"chunk_hash": "lucerne", "city": "루체른", "country": "스위스"}),
+    RetrievedChunk("packing", "짐 꾸리기: 가볍게 짐을 꾸리고 여행용 어댑터를 챙기세요.", {"chunk_hash": "packing", "section": "짐 꾸리기"}),
+]
+
+def test_vectors_are_normalized_and_deterministic():
+    vectorizer = CharNgramVectorizer(dim=256).fit([chunk.page_content for chunk in CHUNKS])
+    vectors = vectorizer.transform(["취리히 호수", "취리히 호수", ""])
+    assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+    assert np.array_equal(vectors[0], vectors[1])
+    assert not vectors[2].any()
+
+def test_search_handles_particles_and_filters():
+    index = LocalVectorIndex.build(CHUNKS, dim=512)
+    assert index.similarity_search("취리히에서 가볼 곳", k=1)[0].id == "zurich"
+    assert index.similarity_search("카펠교", k=1)[0].id == "lucerne"
+
+    filtered = index.similarity_search("도시", k=4, filter={"city": {"$in": ["제네바"]}})
+    assert [chunk.id for chunk in filtered] == ["geneva"]
+    both = {"$and": [{"country": "스위스"}, {"city": {"$in": ["루체른", "취리히"]}}]}
+    assert {chunk.id for chunk in index.similarity_search("스위스", k=4, filter=both)} == {"zurich", "lucerne"}
+
+def test_saved_index_is_memory_mapped(tmp_path):
+    directory = str(tmp_path / "local_index")
+    LocalVectorIndex.build(CHUNKS, dim=512).save(directory)
+
+    loaded = LocalVectorIndex.load(directory)
+    assert isinstance(loaded.vectors, np.memmap)
+    assert len(loaded) == 4
+    assert loaded.similarity_search("여행용 어댑터", k=1)[0].id == "packing"
+    assert LocalVectorIndex.load(str(tmp_path / "missing")) is None
+
+def test_works_as_hybrid_vector_backend():
+    retriever = HybridRetriever(LocalVectorIndex.build(CHUNKS, dim=512), BM25Index.from_documents(CHUNKS))
+    filters = retriever.destination_filters("제네바")
+    assert [chunk.id for chunk in retriever.retrieve("분수", k=3, filters=filters)] == ["geneva"]
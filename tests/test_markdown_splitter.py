@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.hybrid_retriever import BM25Index, HybridRetriever, RetrievedChunk
+from components.markdown_splitter import split_markdown_sections
+
+TEXT = """# 여행 정보 및 팁
+
+## 스위스 여행 정보
+
+### 취리히 (Zurich)
+취리히는 금융 중심지입니다.
+주요 관광지: 취리히 호수, 구시가지.
+
+### 제네바 (Geneva)
+제네바는 UN 유럽 본부가 있는 도시입니다.
+
+## 일반적인 여행 팁
+
+### 짐 꾸리기
+가볍게 짐을 꾸리세요.
+"""
+
+def test_one_chunk_per_section_with_metadata():
+    chunks = split_markdown_sections(TEXT)
+    assert [metadata for _, metadata in chunks] == [
+        {"country": "스위스", "city": "취리히", "city_alias": "Zurich", "section": "취리히 (Zurich)"},
+        {"country": "스위스", "city": "제네바", "city_alias": "Geneva", "section": "제네바 (Geneva)"},
+        {"section": "짐 꾸리기"},
+    ]
+    # 청크 본문 앞에 제목 경로를 붙여 다른 도시와 섞이지 않음
+    assert chunks[0][0].startswith("[스위스 여행 정보 > 취리히 (Zurich)]\n취리히는")
+    assert "제네바" not in chunks[0][0]
+
+def test_long_sections_split_on_paragraphs_keep_metadata():
+    body = "\n\n".join(f"문단 {index} " + "가" * 40 for index in range(10))
+    chunks = split_markdown_sections(f"## 일본 여행 정보\n### 도쿄\n{body}", max_chars=120)
+    assert len(chunks) > 1
+    assert all(len(text.split("\n", 1)[1]) <= 120 for text, _ in chunks)
+    assert all(metadata["city"] == "도쿄" for _, metadata in chunks)
+    assert "".join(text for text, _ in chunks).count("문단") == 10
+
+def test_destination_prefilter_limits_candidates():
+    chunks = [RetrievedChunk(str(index), text, metadata) for index, (text, metadata) in enumerate(split_markdown_sections(TEXT))]
+    retriever = HybridRetriever(bm25_index=BM25Index.from_documents(chunks))
+
+    assert retriever.destination_filters("Zurich, Switzerland") == {"city_alias": ["Zurich"]}
+    filters = retriever.destination_filters("제네바, 스위스")
+    assert filters == {"city": ["제네바"]}
+    results = retriever.retrieve("도시 여행 정보", k=3, filters=filters)
+    assert [chunk.metadata["city"] for chunk in results] == ["제네바"]
+    assert retriever.destination_filters("스위스 일주") == {"country": ["스위스"]}
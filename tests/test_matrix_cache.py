@@ -0,0 +1,59 @@
+import os
+import sys
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components import matrix_cache as matrix_cache_module
+from components.matrix_cache import MatrixCache
+from components.route_optimizer import optimize_route, resolve_travel_mode
+
+POIS = [
+    {"id": 1, "name": "에펠탑", "lat": 48.8584, "lon": 2.2945},
+    {"id": 2, "name": "루브르 박물관", "lat": 48.8606, "lon": 2.3376},
+    {"id": 3, "name": "노트르담", "lat": 48.8530, "lon": 2.3499},
+    {"id": 4, "name": "좌표 없음", "lat": None, "lon": None},
+]
+
+def test_matrices_are_persisted_and_memory_mapped(tmp_path, monkeypatch):
+    cache = MatrixCache(str(tmp_path))
+    matrices = cache.get("파리", POIS, "도보")
+    assert matrices.ids == [1, 2, 3]
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+    assert matrices.travel_minutes(1, 2) > matrices.travel_minutes(2, 3)
+
+    # 같은 POI 집합이면 다른 프로세스(새 캐시)도 다시 계산하지 않고 파일을 매핑
+    def fail(*args):
+        raise AssertionError("캐시된 행렬은 다시 계산하지 않아야 함")
+
+    monkeypatch.setattr(matrix_cache_module, "distance_matrix", fail)
+    monkeypatch.setattr(matrix_cache_module, "travel_time_matrix", fail)
+    reloaded = MatrixCache(str(tmp_path)).get("파리", POIS, "도보")
+    assert isinstance(reloaded.distances, np.memmap)
+    assert np.allclose(reloaded.times, matrices.times)
+
+def test_cache_key_changes_with_mode_and_pois(tmp_path):
+    cache = MatrixCache(str(tmp_path))
+    walk = cache.get("파리", POIS, "도보")
+    taxi = cache.get("파리", POIS, "택시")
+    # 거리 행렬은 이동 수단과 관계없이 공유
+    assert len(list(tmp_path.glob("*.npy"))) == 3
+    assert taxi.travel_minutes(1, 3) < walk.travel_minutes(1, 3)
+
+    moved = [dict(POIS[0], lat=48.87)] + POIS[1:]
+    assert cache.get("파리", moved, "도보").distances[0, 1] != walk.distances[0, 1]
+
+def test_subset_feeds_optimizer_in_candidate_order():
+    matrices = MatrixCache().get("파리", POIS)
+    candidates = [POIS[2], POIS[0], POIS[1]]
+    distances, times = matrices.subset([poi["id"] for poi in candidates])
+    assert distances[0, 1] == matrices.distances[2, 0]
+    plan = optimize_route(candidates, days=1, matrices=(distances, times))
+    assert plan == optimize_route(candidates, days=1)
+
+def test_resolve_travel_mode():
+    assert resolve_travel_mode("도보") == "도보"
+    assert resolve_travel_mode("대중교통, 도보") == "혼합"
+    assert resolve_travel_mode("렌터카") == "택시"
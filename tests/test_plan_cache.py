@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import pytest
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.plan_cache import PlanCache, canonicalize_user_input
+
+RESULT = {"type": "text_response", "content": "## 📅 여행 일정", "status": "success"}
+
+class KeywordEmbeddings:
+    """키워드 포함 여부로 벡터를 만드는 테스트용 임베딩"""
+    KEYWORDS = ["맛집", "박물관", "쇼핑", "휴식", "느긋하게", "빠르게"]
+
+    def embed_query(self, text):
+        return [1.0 if keyword in text else 0.0 for keyword in self.KEYWORDS]
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "plan_cache.sqlite3")
+
+def test_canonicalize_ignores_whitespace_case_and_list_order():
+    a = canonicalize_user_input({'destination': ' Paris ', 'activities': ['쇼핑', '맛집 탐방'], 'additional_notes': ''})
+    b = canonicalize_user_input({'destination': 'paris', 'activities': ['맛집  탐방', '쇼핑']})
+    assert a == b
+
+def test_exact_hit_survives_restart(cache_path):
+    PlanCache(cache_path).put({'destination': '파리', 'duration': 5}, RESULT)
+
+    reopened = PlanCache(cache_path)
+    assert reopened.get({'destination': '파리', 'duration': 5}) == RESULT
+    assert reopened.get({'destination': '파리', 'duration': 6}) is None
+
+    stats = reopened.stats()
+    assert stats['exact_hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+
+def test_semantic_tier_respects_threshold_and_partition(cache_path):
+    cache = PlanCache(cache_path, similarity_threshold=0.8, embeddings=KeywordEmbeddings())
+    cache.put({'destination': '파리', 'duration': 5, 'activities': ['맛집 탐방', '박물관'], 'pace': '보통'}, RESULT)
+
+    # 같은 목적지/기간, 비슷한 선호 → 의미 유사도 적중
+    assert cache.get({'destination': '파리', 'duration': 5, 'activities': ['맛집 탐방', '박물관 투어'], 'pace': '보통'}) == RESULT
+    # 선호가 크게 다르면 미스
+    assert cache.get({'destination': '파리', 'duration': 5, 'activities': ['쇼핑'], 'pace': '빠르게'}) is None
+    # 기간이 다르면 유사도와 무관하게 미스
+    assert cache.get({'destination': '파리', 'duration': 7, 'activities': ['맛집 탐방', '박물관'], 'pace': '보통'}) is None
+    assert cache.stats()['semantic_hits'] == 1
+
+def test_ttl_expiry(cache_path):
+    cache = PlanCache(cache_path, ttl_seconds=1)
+    cache.put({'destination': '로마'}, RESULT)
+    time.sleep(1.1)
+    assert cache.get({'destination': '로마'}) is None
+
+def test_lru_eviction_keeps_recently_used(cache_path):
+    cache = PlanCache(cache_path, max_entries=2)
+    cache.put({'destination': 'a'}, RESULT)
+    time.sleep(0.01)
+    cache.put({'destination': 'b'}, RESULT)
+    time.sleep(0.01)
+    cache.get({'destination': 'a'})
+    time.sleep(0.01)
+    cache.put({'destination': 'c'}, RESULT)
+
+    assert cache.get({'destination': 'a'}) == RESULT
+    assert cache.get({'destination': 'b'}) is None
+    assert cache.stats()['entries'] == 2
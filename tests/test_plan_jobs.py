@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.plan_jobs import PlanJobManager
+
+class BlockingCoordinator:
+    """release 이벤트가 설정될 때까지 계획 완료를 미루는 테스트용 Coordinator"""
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def stream_plan(self, user_input):
+        self.calls += 1
+        yield {"type": "start", "expected_steps": 1}
+        self.release.wait(5)
+        yield {"type": "result", "result": {"status": "success", "destination": user_input["destination"]}, "metrics": {}}
+
+def wait_until_finished(job):
+    next_index = 0
+    while True:
+        finished = job.finished
+        events = job.wait_for_events(next_index, timeout=1)
+        next_index += len(events)
+        if finished and not events:
+            return next_index
+
+def test_job_runs_in_background_and_reattaches_by_id():
+    coordinator = BlockingCoordinator()
+    manager = PlanJobManager(lambda: coordinator, max_workers=1)
+
+    job_id = manager.submit({"destination": "파리", "duration": 3})
+    # 같은 입력을 다시 제출하면 (예: Streamlit rerun) 실행 중인 작업에 연결
+    assert manager.submit({"destination": " 파리", "duration": 3}) == job_id
+
+    coordinator.release.set()
+    job = manager.get(job_id)
+    assert wait_until_finished(job) == 2
+
+    assert job.status == "done"
+    assert job.result == {"status": "success", "destination": "파리"}
+    assert coordinator.calls == 1
+    stats = manager.stats()
+    assert (stats["submitted"], stats["deduplicated"], stats["completed"]) == (1, 1, 1)
+    manager.shutdown(wait=True)
+
+def test_queued_jobs_report_depth_and_can_be_cancelled():
+    coordinator = BlockingCoordinator()
+    manager = PlanJobManager(lambda: coordinator, max_workers=1)
+
+    running_id = manager.submit({"destination": "로마"})
+    queued_id = manager.submit({"destination": "도쿄"})
+    manager.get(running_id).wait_for_events(0, timeout=1)
+
+    stats = manager.stats()
+    assert (stats["running"], stats["queue_depth"], stats["utilization"]) == (1, 1, 1.0)
+
+    assert manager.cancel(queued_id)
+    assert manager.get(queued_id).status == "cancelled"
+    assert not manager.cancel(running_id)
+
+    coordinator.release.set()
+    wait_until_finished(manager.get(running_id))
+    assert manager.stats()["queue_depth"] == 0
+    manager.shutdown(wait=True)
+
+def test_shared_job_is_cancelled_only_after_last_holder_releases():
+    coordinator = BlockingCoordinator()
+    manager = PlanJobManager(lambda: coordinator, max_workers=1)
+
+    running_id = manager.submit({"destination": "로마"})
+    # 두 세션이 같은 입력을 제출해 대기 중인 작업 하나를 공유
+    shared_id = manager.submit({"destination": "도쿄"})
+    assert manager.submit({"destination": "도쿄"}) == shared_id
+
+    assert not manager.release(shared_id)
+    assert manager.get(shared_id).status == "queued"
+    assert manager.release(shared_id)
+    assert manager.get(shared_id).status == "cancelled"
+
+    coordinator.release.set()
+    wait_until_finished(manager.get(running_id))
+    assert manager.stats()["cancelled"] == 1
+    manager.shutdown(wait=True)
@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.poi_store import POIStore, data_version, format_pois, haversine_km, open_poi_store
+
+CITIES = "city,aliases,country,currency,lat,lon,description\n파리,paris|빠리,프랑스,EUR,48.8566,2.3522,예술의 도시\n"
+POIS = (
+    "city,name,category,subcategory,price_tier,price,rating,lat,lon,tags,description\n"
+    "파리,에펠탑,attraction,랜드마크,2,€26,4.7,48.8584,2.2945,야경 전망,파리의 상징\n"
+    "파리,루브르 박물관,attraction,박물관,2,€22,4.8,48.8606,2.3376,미술 모나리자,세계 최대 미술관\n"
+    "파리,베르사유 궁전,attraction,궁전,2,€21,4.6,48.8049,2.1204,정원 역사,교외의 궁전\n"
+    "파리,제너레이터 파리,accommodation,호스텔,1,€40,4.1,48.8780,2.3700,저렴,배낭여행자 숙소\n"
+    "파리,르 뫼리스,accommodation,호텔,4,€900,4.9,48.8650,2.3280,럭셔리,튈르리 정원 앞 호텔\n"
+    "파리,르 부이용 샤르티에,restaurant,프랑스 요리,1,€20,4.3,48.8719,2.3434,현지 음식 가성비,전통 비스트로\n"
+)
+
+def _write_data(directory):
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "cities.csv"), "w", encoding="utf-8") as f:
+        f.write(CITIES)
+    with open(os.path.join(directory, "pois.csv"), "w", encoding="utf-8") as f:
+        f.write(POIS)
+
+def test_import_and_resolve_city(tmp_path):
+    data_dir = str(tmp_path / "poi")
+    _write_data(data_dir)
+    store = open_poi_store(data_dir=data_dir)
+    assert store.count() == 6
+    assert store.resolve_city("Paris, France") == "파리"
+    assert store.resolve_city("빠리 여행") == "파리"
+    assert store.resolve_city("도쿄") is None
+    assert store.city_info("파리")["currency"] == "EUR"
+
+def test_resolve_city_matches_whole_words_only():
+    store = POIStore()
+    store.import_cities([
+        {"city": "파리", "aliases": "paris", "country": "프랑스"},
+        {"city": "로마", "aliases": "rome|roma", "country": "이탈리아"},
+    ])
+    assert store.resolve_city("파리에서 3일") == "파리"
+    assert store.resolve_city("Rome, Italy") == "로마"
+    # 별칭이 다른 단어의 일부일 뿐이면 도시로 보지 않음
+    assert store.resolve_city("Jerome") is None
+    assert store.resolve_city("Romeo and Juliet tour, Verona") is None
+    assert store.resolve_city("로마네스크 성당 투어") is None
+    assert store.resolve_city("파리지앵 카페") is None
+
+def test_search_filters_and_full_text(tmp_path):
+    data_dir = str(tmp_path / "poi")
+    _write_data(data_dir)
+    store = open_poi_store(data_dir=data_dir)
+
+    attractions = store.search("파리", "attraction")
+    assert [row["name"] for row in attractions] == ["루브르 박물관", "에펠탑", "베르사유 궁전"]
+    assert store.search("파리", "attraction", text="모나리자")[0]["name"] == "루브르 박물관"
+    assert store.search("파리", "restaurant", text="현지 음식")[0]["name"] == "르 부이용 샤르티에"
+
+    assert [row["name"] for row in store.search("파리", "accommodation", max_price_tier=2)] == ["제너레이터 파리"]
+    assert [row["name"] for row in store.search("파리", "accommodation", subcategory="호텔")] == ["르 뫼리스"]
+
+    # 루브르에서 4km 안: 베르사유(약 15km)는 제외
+    nearby = store.search("파리", "attraction", near=(48.8606, 2.3376), radius_km=4)
+    assert {row["name"] for row in nearby} == {"루브르 박물관", "에펠탑"}
+    assert 14 < haversine_km(48.8606, 2.3376, 48.8049, 2.1204) < 18
+    assert format_pois(attractions[:1]).startswith("1. 루브르 박물관 (박물관 / €22) ★4.8")
+
+def test_bulk_jsonl_import_and_reimport_on_change(tmp_path):
+    data_dir = str(tmp_path / "poi")
+    _write_data(data_dir)
+    db_path = str(tmp_path / "cache" / "poi.sqlite3")
+    store = open_poi_store(db_path, data_dir=data_dir)
+    assert store.get_meta("data_version") == data_version(data_dir)
+    store.close()
+
+    # 같은 데이터면 다시 적재하지 않고 기존 DB 사용
+    reopened = open_poi_store(db_path, data_dir=data_dir)
+    assert reopened.count() == 6
+    reopened.close()
+
+    with open(os.path.join(data_dir, "extra.jsonl"), "w", encoding="utf-8") as f:
+        for index in range(1200):
+            f.write(json.dumps({"city": "파리", "name": f"카페 {index}", "category": "restaurant",
+                                "tags": ["카페", "디저트"], "rating": 4.0}, ensure_ascii=False) + "\n")
+    updated = open_poi_store(db_path, data_dir=data_dir)
+    assert updated.count() == 1206
+    assert len(updated.search("파리", "restaurant", text="디저트", limit=10)) == 10
+
+def test_reimport_drops_rows_removed_from_source(tmp_path):
+    data_dir = str(tmp_path / "poi")
+    _write_data(data_dir)
+    db_path = str(tmp_path / "cache" / "poi.sqlite3")
+    open_poi_store(db_path, data_dir=data_dir).close()
+
+    # 원본에서 에펠탑을 빼고 빠리 별칭을 지운 뒤 다시 적재
+    with open(os.path.join(data_dir, "pois.csv"), "w", encoding="utf-8") as f:
+        f.write("".join(line + "\n" for line in POIS.splitlines() if "에펠탑" not in line))
+    with open(os.path.join(data_dir, "cities.csv"), "w", encoding="utf-8") as f:
+        f.write(CITIES.replace("paris|빠리", "paris"))
+    os.utime(os.path.join(data_dir, "pois.csv"), (0, 0))
+
+    store = open_poi_store(db_path, data_dir=data_dir)
+    assert store.count() == 5
+    assert store.search("파리", "attraction", text="에펠탑") == []
+    assert store.resolve_city("빠리 여행") is None
+    assert store.resolve_city("Paris") == "파리"
+
+def test_store_without_data_returns_nothing():
+    store = POIStore()
+    assert store.resolve_city("파리") is None
+    assert store.search("파리") == []
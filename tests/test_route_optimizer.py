@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.route_optimizer import (
+    PACE_SETTINGS, distance_matrix, nearest_neighbour_route, optimize_route, two_opt
+)
+
+def _path_length(route, distances):
+    return sum(distances[a, b] for a, b in zip(route, route[1:]))
+
+def test_distance_matrix_is_symmetric_haversine():
+    distances = distance_matrix([48.8606, 48.8584], [2.3376, 2.2945])
+    assert distances[0, 0] == 0
+    assert distances[0, 1] == distances[1, 0]
+    assert 3.0 < distances[0, 1] < 3.5
+
+def test_two_opt_removes_crossing():
+    # 일직선 위 점을 엇갈린 순서로 방문하면 2-opt가 순서대로 펴야 함
+    lon = np.array([0.0, 0.03, 0.01, 0.02, 0.04])
+    distances = distance_matrix(np.zeros(5), lon)
+    route = two_opt([0, 1, 2, 3, 4], distances)
+    assert route == [0, 2, 3, 1, 4]
+    assert np.isclose(_path_length(route, distances), distances[0, 4])
+    assert nearest_neighbour_route(distances) == [0, 2, 3, 1, 4]
+
+def test_days_are_geographic_clusters_within_pace():
+    rng = np.random.default_rng(1)
+    # 멀리 떨어진 두 지역에 각각 4곳
+    pois = [{"name": f"A{i}", "lat": 48.85 + rng.normal(0, 0.003), "lon": 2.30 + rng.normal(0, 0.003)} for i in range(4)]
+    pois += [{"name": f"B{i}", "lat": 48.80 + rng.normal(0, 0.003), "lon": 2.12 + rng.normal(0, 0.003)} for i in range(4)]
+    plan = optimize_route(pois, days=2, pace="빠르게")
+    groups = [{stop["name"][0] for stop in day["stops"]} for day in plan["days"]]
+    assert sorted(map(sorted, groups)) == [["A"], ["B"]]
+
+    relaxed = optimize_route(pois, days=2, pace="느긋하게")
+    assert all(len(day["stops"]) <= PACE_SETTINGS["느긋하게"]["max_stops"] for day in relaxed["days"])
+    assert relaxed["days"][0]["stops"][0]["arrive"] == "10:00"
+
+def test_opening_hours_are_respected():
+    pois = [
+        {"name": "야경 전망대", "lat": 48.85, "lon": 2.30, "opening_hours": "18:00-23:00", "visit_minutes": 60},
+        {"name": "아침 시장", "lat": 48.851, "lon": 2.301, "opening_hours": "07:00-08:00", "visit_minutes": 60},
+    ]
+    # 보통 페이스는 09:00 시작이라 아침 시장은 제외, 전망대는 개장 시각까지 기다림
+    plan = optimize_route(pois, days=1, pace="보통")
+    assert plan["unscheduled"] == ["아침 시장"]
+    assert plan["days"][0]["stops"][0]["arrive"] == "18:00"
+
+    # 느긋하게 페이스는 18:00에 일정이 끝남
+    assert optimize_route(pois[:1], days=1, pace="느긋하게")["unscheduled"] == ["야경 전망대"]
+
+def test_extra_days_and_missing_coordinates():
+    plan = optimize_route([{"name": "좌표 없음"}, {"name": "A", "lat": 1.0, "lon": 1.0}], days=3)
+    assert [len(day["stops"]) for day in plan["days"]] == [1, 0, 0]
+
+def test_large_input_is_fast():
+    rng = np.random.default_rng(0)
+    pois = [{"name": f"P{i}", "subcategory": "공원", "lat": 48.8 + rng.random() * 0.1, "lon": 2.25 + rng.random() * 0.15,
+             "visit_minutes": 30} for i in range(200)]
+    started = time.perf_counter()
+    plan = optimize_route(pois, days=30, pace="빠르게")
+    assert time.perf_counter() - started < 1.0
+    assert len(plan["days"]) == 30
+    scheduled = sum(len(day["stops"]) for day in plan["days"]) + len(plan["unscheduled"])
+    assert scheduled == 200
@@ -0,0 +1,30 @@
+import os
+import sys
+
+# Add the project root directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools import AccommodationSearchTool, ItineraryOptimizerTool
+
+def test_itinerary_query_keeps_comma_in_destination():
+    tool = ItineraryOptimizerTool()
+    assert tool.parse_query("파리, 프랑스, 3일, 박물관/미술관, 맛집 탐방, 느긋하게") == {
+        "destination": "파리, 프랑스", "duration": 3, "activities": "박물관/미술관, 맛집 탐방", "pace": "느긋하게"
+    }
+    assert tool.parse_query("로마, 4일간, 역사 탐방") == {
+        "destination": "로마", "duration": 4, "activities": "역사 탐방", "pace": "보통"
+    }
+    assert tool.parse_query("도쿄")["duration"] == 5
+
+def test_itinerary_run_resolves_comma_destination():
+    result = ItineraryOptimizerTool()._run("파리, 프랑스, 2일, 박물관/미술관, 보통")
+    assert "오류" not in result
+    assert "파리 2일 동선 추천" in result
+
+def test_accommodation_query_keeps_comma_in_destination():
+    tool = AccommodationSearchTool()
+    assert tool.parse_query("파리, 프랑스, 보통 (50-100만원), 호스텔") == {
+        "destination": "파리, 프랑스", "budget_range": "보통 (50-100만원)", "accommodation_type": "호스텔"
+    }
+    assert tool.parse_query("파리, 100만원, 호텔")["budget_range"] == "100만원"
+    assert tool.parse_query("파리 근교")["budget_range"] == "보통 (50-100만원)"
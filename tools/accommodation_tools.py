@@ -1,43 +1,69 @@
 """
 Accommodation Tools for Travel Planning
 """
+import re
 from langchain.tools import BaseTool
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from components.budget_engine import ACCOMMODATION_SCALING, BUDGET_TIERS, resolve_tier
+from components.poi_store import format_pois, get_default_poi_store, unknown_city_message
+from tools.async_support import run_in_thread
+
+_BUDGET_AMOUNT = re.compile(r'\d\s*만?\s*원')
+
+def _is_budget_range(text: str) -> bool:
+    """예산 등급 이름이나 금액("100만원")이 들어 있는지"""
+    return any(tier in text for tier in BUDGET_TIERS) or _BUDGET_AMOUNT.search(text) is not None
 
 class AccommodationSearchTool(BaseTool):
-    """숙박 시설 검색 도구"""
+    """숙박 시설 검색 도구 (로컬 POI 저장소 조회)"""
     
     name: str = "search_accommodation"
     description: str = "목적지의 숙박 시설을 검색하고 추천합니다. 입력 형식: '목적지, 예산범위, 숙박유형' (예: '파리, 보통 (50-100만원), 호텔')"
+    poi_store: Optional[Any] = None
     
+    def parse_query(self, query: str) -> Dict[str, str]:
+        """입력 문자열을 (목적지, 예산범위, 숙박유형)으로 변환 - 예산범위 토큰 앞은 모두 목적지 ("파리, 프랑스, 보통, 호텔")"""
+        parts = [part.strip() for part in query.split(',') if part.strip()]
+        budget_index = next((index for index, part in enumerate(parts) if index > 0 and _is_budget_range(part)), None)
+        if budget_index is None:
+            return {"destination": query.strip(), "budget_range": "보통 (50-100만원)", "accommodation_type": "호텔"}
+        return {
+            "destination": ", ".join(parts[:budget_index]),
+            "budget_range": parts[budget_index],
+            "accommodation_type": ", ".join(parts[budget_index + 1:]) or "호텔",
+        }
+
     def _run(self, query: str) -> str:
         """숙박 시설 검색 실행"""
         try:
-            # 입력 파싱
-            parts = query.split(',', 2)
-            if len(parts) >= 3:
-                destination = parts[0].strip()
-                budget_range = parts[1].strip()
-                accommodation_type = parts[2].strip()
-            else:
-                destination = query.strip()
-                budget_range = "보통 (50-100만원)"
-                accommodation_type = "호텔"
+            params = self.parse_query(query)
+            destination, budget_range, accommodation_type = params["destination"], params["budget_range"], params["accommodation_type"]
+            
+            store = self.poi_store or get_default_poi_store()
+            city = store.resolve_city(destination)
+            if city is None:
+                return unknown_city_message(destination)
             
+            # 예산 등급 이하 가격대에서 숙박 유형이 맞는 곳 우선, 없으면 조건을 하나씩 완화
+            max_tier = BUDGET_TIERS.index(resolve_tier(budget_range)) + 1
+            subcategory = accommodation_type if accommodation_type in ACCOMMODATION_SCALING and accommodation_type != "상관없음" else None
+            results = (
+                store.search(city, "accommodation", subcategory=subcategory, max_price_tier=max_tier)
+                or store.search(city, "accommodation", max_price_tier=max_tier)
+                or store.search(city, "accommodation")
+            )
             return f"""
-            {destination}의 숙박 추천:
+            {city}의 숙박 추천:
             - 예산 범위: {budget_range}
             - 숙박 유형: {accommodation_type}
             
             추천 숙박시설:
-            1. Hotel de Paris (호텔) - €120/박
-            2. Le Petit Bistrot (게스트하우스) - €60/박
-            3. Cozy Airbnb (에어비앤비) - €80/박
-            
-            총 숙박 비용: €{120 * 5} (5박 기준)
+            {format_pois(results)}
             """
         except Exception as e:
             return f"숙박 검색 중 오류 발생: {str(e)}"
     
-    def _arun(self, query: str):
-        raise NotImplementedError("비동기 실행은 지원하지 않습니다.") 
\ No newline at end of file
+    async def _arun(self, query: str) -> str:
+        """숙박 시설 검색 실행 (비동기)"""
+        return await run_in_thread(self._run, query) 
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Async Support for Travel Tools - 도구의 동기 구현을 비동기 경로에서 실행하는 헬퍼
+"""
+import asyncio
+from typing import Any, Callable
+
+async def run_in_thread(func: Callable[..., Any], *args: Any) -> Any:
+    """블로킹 작업(SQLite 조회, NumPy 계산, .npy 로드 등)이 있는 동기 함수를 워커 스레드에서 실행
+
+    이벤트 루프를 막지 않으므로 aplan_travel의 asyncio.gather에서 도구들이 동시에 실행됩니다.
+    """
+    return await asyncio.to_thread(func, *args)
@@ -1,59 +1,55 @@
 """
 Budget Tools for Travel Planning
 """
+import re
+import json
 from langchain.tools import BaseTool
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from components.budget_engine import ACCOMMODATION_SCALING, estimate_budget
+from tools.async_support import run_in_thread
+
+_GROUP_SIZE = re.compile(r'^(\d+)\s*(?:명|인)$')
+_DURATION = re.compile(r'(\d+)')
 
 class BudgetCalculatorTool(BaseTool):
-    """예산 계산 도구"""
-    
+    """예산 계산 도구 (목적지/예산 등급별 비용표 기반, LLM 호출 없음)"""
+
     name: str = "calculate_budget"
-    description: str = "여행 예산을 계산하고 관리합니다. 입력 형식: '예산범위, 기간, 목적지' (예: '보통 (50-100만원), 5일, 파리')"
-    
+    description: str = (
+        "여행 예산을 계산하고 관리합니다. 입력 형식: '예산범위, 기간, 목적지[, 인원수, 숙박유형]' "
+        "(예: '보통 (50-100만원), 5일, 파리, 2명, 호텔'). 결과는 분류별 비용이 담긴 JSON입니다."
+    )
+    fx_rates: Optional[Any] = None
+
+    def parse_query(self, query: str) -> Dict[str, Any]:
+        """입력 문자열을 estimate_budget 인자로 변환"""
+        parts = [part.strip() for part in query.split(',') if part.strip()]
+        if len(parts) < 3:
+            return {"destination": query.strip(), "duration": 5, "budget_range": "보통 (50-100만원)"}
+
+        params = {"budget_range": parts[0], "duration": int(_DURATION.search(parts[1]).group(1))}
+        destination_parts = []
+        for part in parts[2:]:
+            match = _GROUP_SIZE.match(part)
+            if match:
+                params["group_size"] = int(match.group(1))
+            elif part in ACCOMMODATION_SCALING:
+                params["accommodation_type"] = part
+            else:
+                # "파리, 프랑스"처럼 쉼표가 들어간 목적지
+                destination_parts.append(part)
+        params["destination"] = ", ".join(destination_parts)
+        return params
+
     def _run(self, query: str) -> str:
         """예산 계산 실행"""
         try:
-            # 입력 파싱
-            parts = query.split(',', 2)
-            if len(parts) >= 3:
-                total_budget = parts[0].strip()
-                duration_str = parts[1].strip().replace('일', '').replace('일간', '')
-                destination = parts[2].strip()
-                duration = int(duration_str)
-            else:
-                total_budget = "보통 (50-100만원)"
-                duration = 5
-                destination = query.strip()
-            
-            # 예시 계산
-            accommodation_cost = 120 * duration  # 숙박비
-            food_cost = 70 * duration  # 식비
-            transportation_cost = 37.5  # 교통비
-            activities_cost = 50 * duration  # 액티비티비
-            misc_cost = 30 * duration  # 기타비용
-            
-            total_cost = accommodation_cost + food_cost + transportation_cost + activities_cost + misc_cost
-            
-            return f"""
-            {destination} {duration}일 여행 예산 계산:
-            
-            예산 분배:
-            - 숙박: €{accommodation_cost} ({duration}박)
-            - 식비: €{food_cost} (일 €70)
-            - 교통: €{transportation_cost} (5일 패스)
-            - 액티비티: €{activities_cost} (일 €50)
-            - 기타: €{misc_cost} (일 €30)
-            
-            총 예상 비용: €{total_cost}
-            예산 범위: {total_budget}
-            
-            절약 팁:
-            - 숙박: 게스트하우스 선택으로 30% 절약
-            - 식비: 현지 마켓 이용으로 20% 절약
-            - 교통: 대중교통 패스 이용
-            """
+            estimate = estimate_budget(**self.parse_query(query), fx_rates=self.fx_rates)
+            return json.dumps(estimate, ensure_ascii=False)
         except Exception as e:
             return f"예산 계산 중 오류 발생: {str(e)}"
-    
-    def _arun(self, query: str):
-        raise NotImplementedError("비동기 실행은 지원하지 않습니다.") 
\ No newline at end of file
+
+    async def _arun(self, query: str) -> str:
+        """예산 계산 실행 (비동기)"""
+        return await run_in_thread(self._run, query)
@@ -2,13 +2,17 @@
 Food Tools for Travel Planning
 """
 from langchain.tools import BaseTool
-from typing import Optional
+from typing import Any, Optional
+
+from components.poi_store import format_pois, get_default_poi_store, unknown_city_message
+from tools.async_support import run_in_thread
 
 class RestaurantSearchTool(BaseTool):
-    """레스토랑 검색 도구"""
+    """레스토랑 검색 도구 (로컬 POI 저장소 조회)"""
     
     name: str = "search_restaurants"
     description: str = "목적지의 레스토랑을 검색하고 추천합니다. 입력 형식: '목적지, 음식선호' (예: '파리, 현지 음식, 프랑스 전통')"
+    poi_store: Optional[Any] = None
     
     def _run(self, query: str) -> str:
         """레스토랑 검색 실행"""
@@ -22,19 +26,23 @@ class RestaurantSearchTool(BaseTool):
                 destination = query.strip()
                 food_preferences = "현지 음식"
             
+            store = self.poi_store or get_default_poi_store()
+            city = store.resolve_city(destination)
+            if city is None:
+                return unknown_city_message(destination)
+            
+            # 음식 선호를 이름/요리/태그에서 검색, 맞는 곳이 없으면 평점 순
+            results = store.search(city, "restaurant", text=food_preferences) or store.search(city, "restaurant")
             return f"""
-            {destination}의 레스토랑 추천:
+            {city}의 레스토랑 추천:
             - 음식 선호: {food_preferences}
             
             추천 레스토랑:
-            1. Le Bistrot Parisien (프랑스 전통) - €35/인
-            2. La Crêperie (크레페) - €15/인
-            3. Le Petit Café (카페) - €20/인
-            
-            총 식비: €70/인/일 (3식 기준)
+            {format_pois(results)}
             """
         except Exception as e:
             return f"레스토랑 검색 중 오류 발생: {str(e)}"
     
-    def _arun(self, query: str):
-        raise NotImplementedError("비동기 실행은 지원하지 않습니다.") 
\ No newline at end of file
+    async def _arun(self, query: str) -> str:
+        """레스토랑 검색 실행 (비동기)"""
+        return await run_in_thread(self._run, query) 
\ No newline at end of file
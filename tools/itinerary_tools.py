@@ -1,34 +1,78 @@
 """
 Itinerary Tools for Travel Planning
 """
+import re
 from langchain.tools import BaseTool
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from components.matrix_cache import MatrixCache
+from components.poi_store import get_default_poi_store, unknown_city_message
+from components.route_optimizer import DEFAULT_PACE, PACE_SETTINGS, format_route_plan, optimize_route
+from tools.async_support import run_in_thread
+
+MAX_CANDIDATE_POIS = 200
+
+_DURATION = re.compile(r'^(\d+)\s*(?:일간|일)?$')
 
 class ItineraryOptimizerTool(BaseTool):
-    """일정 최적화 도구"""
+    """일정 최적화 도구 (POI 좌표로 날짜별 지역 묶음과 하루 동선 계산, LLM 호출 없음)"""
     
     name: str = "optimize_itinerary"
-    description: str = "여행 일정을 최적화하고 효율적인 경로를 제안합니다. 입력 형식: '목적지, 기간, 활동' (예: '파리, 5일, 박물관/미술관, 맛집 탐방')"
+    description: str = (
+        "여행 일정을 최적화하고 효율적인 경로를 제안합니다. 입력 형식: '목적지, 기간, 활동[, 페이스]' "
+        "(예: '파리, 5일, 박물관/미술관, 맛집 탐방, 느긋하게'). 페이스는 느긋하게/보통/빠르게 중 하나입니다."
+    )
+    poi_store: Optional[Any] = None
+    matrix_cache: Optional[Any] = None
     
+    def parse_query(self, query: str) -> Dict[str, Any]:
+        """입력 문자열을 (목적지, 기간, 활동, 페이스)로 변환 - 기간 토큰 앞은 모두 목적지 ("파리, 프랑스, 3일, ...")"""
+        parts = [part.strip() for part in query.split(',') if part.strip()]
+        duration_index = next((index for index, part in enumerate(parts) if index > 0 and _DURATION.match(part)), None)
+        if duration_index is None:
+            return {"destination": query.strip(), "duration": 5, "activities": "일반적인 관광", "pace": DEFAULT_PACE}
+
+        rest = parts[duration_index + 1:]
+        # 활동 목록 끝의 페이스 지정 분리
+        pace = rest.pop() if rest and rest[-1] in PACE_SETTINGS else DEFAULT_PACE
+        return {
+            "destination": ", ".join(parts[:duration_index]),
+            "duration": int(_DURATION.match(parts[duration_index]).group(1)),
+            "activities": ", ".join(rest) or "일반적인 관광",
+            "pace": pace,
+        }
+
     def _run(self, query: str) -> str:
         """일정 최적화 실행"""
         try:
-            # 입력 파싱
-            parts = query.split(',', 2)
-            if len(parts) >= 3:
-                destination = parts[0].strip()
-                duration_str = parts[1].strip().replace('일', '').replace('일간', '')
-                activities = parts[2].strip()
-                duration = int(duration_str)
-            else:
-                destination = query.strip()
-                duration = 5
-                activities = "일반적인 관광"
+            params = self.parse_query(query)
+            destination, duration, activities, pace = params["destination"], params["duration"], params["activities"], params["pace"]
+            
+            store = self.poi_store or get_default_poi_store()
+            city = store.resolve_city(destination)
+            if city is None:
+                return unknown_city_message(destination)
+            
+            # 선호 활동과 맞는 관광지를 우선순위 앞에, 나머지는 평점 순으로 뒤에 둠
+            attractions = store.search(city, "attraction", limit=MAX_CANDIDATE_POIS)
+            preferred = store.search(city, "attraction", text=activities, limit=MAX_CANDIDATE_POIS)
+            preferred_ids = {row["id"] for row in preferred}
+            
+            # 도시 관광지 전체의 거리/이동 시간 행렬은 캐시에서 읽고 후보 순서대로 잘라 사용
+            matrices = (self.matrix_cache or MatrixCache()).get(city, attractions)
+            candidates = [
+                row for row in preferred + [row for row in attractions if row["id"] not in preferred_ids]
+                if row["id"] in matrices.index
+            ]
+            plan = optimize_route(candidates, duration, pace, matrices=matrices.subset([row["id"] for row in candidates]))
             
-            # 하드코딩된 파리 일정 대신, 입력 정보를 요약하여 반환
-            return f"Received request to optimize a {duration} day trip to {destination} with activities: {activities}. The agent should now proceed to plan the itinerary based on this information."
+            return f"""
+            {city} {duration}일 동선 추천 (페이스: {plan['pace']}, 활동: {activities}):
+            {format_route_plan(plan)}
+            """
         except Exception as e:
             return f"일정 최적화 중 오류 발생: {str(e)}"
     
-    def _arun(self, query: str):
-        raise NotImplementedError("비동기 실행은 지원하지 않습니다.") 
\ No newline at end of file
+    async def _arun(self, query: str) -> str:
+        """일정 최적화 실행 (비동기)"""
+        return await run_in_thread(self._run, query)
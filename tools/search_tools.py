@@ -2,30 +2,44 @@
 Search Tools for Travel Planning
 """
 from langchain.tools import BaseTool
-from typing import Optional
+from typing import Any, Optional
 import requests
 import json
 
+from components.poi_store import format_pois, get_default_poi_store, unknown_city_message
+from tools.async_support import run_in_thread
+
 class SearchDestinationTool(BaseTool):
-    """목적지 정보 검색 도구"""
+    """목적지 정보 검색 도구 (로컬 POI 저장소 조회)"""
     
     name: str = "search_destination"
     description: str = "목적지에 대한 기본 정보, 관광지, 문화 등을 검색합니다."
+    poi_store: Optional[Any] = None
     
     def _run(self, destination: str) -> str:
         """목적지 정보 검색 실행"""
         try:
-            # 실제 구현에서는 외부 API 사용 (예: Wikipedia, Google Places 등)
-            # 여기서는 입력된 목적지 정보를 요약하여 반환
+            store = self.poi_store or get_default_poi_store()
+            city = store.resolve_city(destination)
+            if city is None:
+                return unknown_city_message(destination)
+            
+            info = store.city_info(city) or {}
+            attractions = store.search(city, "attraction", limit=6)
             return f"""
-            {destination}에 대한 일반적인 정보:
-            이 정보는 실제 검색 결과가 아닌, 목적지에 대한 일반적인 설명을 제공합니다.
+            {city} ({info.get('country', '')}) 기본 정보:
+            - 개요: {info.get('description', '')}
+            - 현지 통화: {info.get('currency', '')}
+            
+            주요 관광지:
+            {format_pois(attractions)}
             """
         except Exception as e:
             return f"목적지 검색 중 오류 발생: {str(e)}"
     
-    def _arun(self, destination: str):
-        raise NotImplementedError("비동기 실행은 지원하지 않습니다.")
+    async def _arun(self, destination: str) -> str:
+        """목적지 정보 검색 실행 (비동기)"""
+        return await run_in_thread(self._run, destination)
 
 class WeatherTool(BaseTool):
     """날씨 정보 조회 도구"""
@@ -54,5 +68,6 @@ class WeatherTool(BaseTool):
         except Exception as e:
             return f"날씨 정보 조회 중 오류 발생: {str(e)}"
     
-    def _arun(self, query: str):
-        raise NotImplementedError("비동기 실행은 지원하지 않습니다.") 
\ No newline at end of file
+    async def _arun(self, query: str) -> str:
+        """날씨 정보 조회 실행 (비동기)"""
+        return await run_in_thread(self._run, query) 
\ No newline at end of file
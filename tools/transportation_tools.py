@@ -2,13 +2,23 @@
 Transportation Tools for Travel Planning
 """
 from langchain.tools import BaseTool
-from typing import Optional
+from typing import Any, Optional
+
+from components.matrix_cache import MatrixCache
+from components.poi_store import format_pois, get_default_poi_store, unknown_city_message
+from components.route_optimizer import DEFAULT_TRAVEL_MODE, resolve_travel_mode
+from tools.async_support import run_in_thread
+
+MAX_MATRIX_POIS = 200
+ROUTE_SAMPLE_SIZE = 4
 
 class TransportationTool(BaseTool):
-    """교통 정보 조회 도구"""
+    """교통 정보 조회 도구 (로컬 POI 저장소 조회, 관광지 간 이동 시간은 행렬 캐시 사용)"""
     
     name: str = "get_transportation"
     description: str = "목적지의 교통 정보를 조회합니다. 입력 형식: '목적지, 교통수단선호' (예: '파리, 대중교통, 도보')"
+    poi_store: Optional[Any] = None
+    matrix_cache: Optional[Any] = None
     
     def _run(self, query: str) -> str:
         """교통 정보 조회 실행"""
@@ -22,22 +32,38 @@ class TransportationTool(BaseTool):
                 destination = query.strip()
                 transportation_preferences = "대중교통"
             
+            store = self.poi_store or get_default_poi_store()
+            city = store.resolve_city(destination)
+            if city is None:
+                return unknown_city_message(destination)
+            
+            # 선호 교통수단과 맞는 항목을 먼저, 나머지는 평점 순으로 뒤에 표시
+            preferred = store.search(city, "transport", text=transportation_preferences)
+            preferred_ids = {row["id"] for row in preferred}
+            others = [row for row in store.search(city, "transport") if row["id"] not in preferred_ids]
+            
+            # 평점 상위 관광지를 차례로 이동할 때의 예상 시간
+            mode = resolve_travel_mode(transportation_preferences)
+            attractions = store.search(city, "attraction", limit=MAX_MATRIX_POIS)
+            matrices = (self.matrix_cache or MatrixCache()).get(city, attractions, mode)
+            sample = [row for row in attractions if row["id"] in matrices.index][:ROUTE_SAMPLE_SIZE]
+            legs = "\n".join(
+                f"- {a['name']} → {b['name']}: 약 {matrices.travel_minutes(a['id'], b['id']):.0f}분"
+                for a, b in zip(sample, sample[1:])
+            )
             return f"""
-            {destination}의 교통 정보:
+            {city}의 교통 정보:
             - 선호 교통수단: {transportation_preferences}
             
             교통 옵션:
-            1. 지하철 - €2.10/회, 1일 패스 €7.50
-            2. 버스 - €2.10/회
-            3. 택시 - €15-25/회
-            4. 렌터카 - €50/일
-            5. 도보 - 무료
+            {format_pois(preferred + others)}
             
-            추천: 지하철 1일 패스 + 도보 조합
-            총 교통비: €37.50 (5일 기준)
+            주요 관광지 간 이동 시간 ({'도보/대중교통' if mode == DEFAULT_TRAVEL_MODE else mode}):
+            {legs or '- 좌표가 있는 관광지 정보가 없습니다'}
             """
         except Exception as e:
             return f"교통 정보 조회 중 오류 발생: {str(e)}"
     
-    def _arun(self, query: str):
-        raise NotImplementedError("비동기 실행은 지원하지 않습니다.") 
\ No newline at end of file
+    async def _arun(self, query: str) -> str:
+        """교통 정보 조회 실행 (비동기)"""
+        return await run_in_thread(self._run, query) 
\ No newline at end of file
@@ -1,9 +1,10 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
+from components.itinerary_model import ItineraryTable
+
 class StreamlitUI:
     """Streamlit UI 출력 클래스"""
     
@@ -100,6 +101,23 @@ class StreamlitUI:
                 st.markdown(f"**💰 비용:** {accommodation.get('cost', 'N/A')}")
                 st.markdown(f"**📝 메모:** {accommodation.get('notes', 'N/A')}")
     
+    def display_day_card(self, day_data: Dict[str, Any]):
+        """스트리밍 중 완성된 일자 한 개를 간단히 표시 (StreamingItineraryParser의 일자 레코드)"""
+        title = f": {day_data['title']}" if day_data.get('title') else ""
+        lines = [f"#### 📅 Day {day_data.get('day', 'N/A')}{title}"]
+        
+        for activity in day_data.get('activities', []):
+            location = f" (📍 {activity['location']})" if activity.get('location') else ""
+            lines.append(f"- ⏰ {activity.get('time') or activity.get('slot', '')} {activity.get('activity', '')}{location}")
+        for meal in day_data.get('meals', []):
+            cuisine = f" ({meal['cuisine']})" if meal.get('cuisine') else ""
+            lines.append(f"- 🍴 {meal.get('time') or meal.get('slot', '')} {meal.get('restaurant', '')}{cuisine}")
+        accommodation = day_data.get('accommodation') or {}
+        if accommodation.get('name'):
+            lines.append(f"- 🏨 {accommodation['name']}")
+        
+        st.markdown("\n".join(lines))
+    
     def display_recommendations(self, recommendations: Dict[str, Any]):
         """추천사항 표시"""
         st.header("💡 추천사항")
@@ -132,14 +150,37 @@ class StreamlitUI:
                 for tip in recommendations['budget_tips']:
                     st.markdown(f"• {tip}")
     
-    def display_cost_summary(self, total_cost: str):
-        """비용 요약 표시"""
+    def display_cost_summary(self, total_cost: str, cost_breakdown: Optional[Dict[str, Any]] = None):
+        """비용 요약 표시 (cost_breakdown: ItineraryTable.cost_summary 결과)"""
         st.header("💰 예상 비용")
         
         if total_cost:
             st.info(f"**총 예상 비용: {total_cost}**")
-        else:
+        elif not cost_breakdown:
             st.warning("비용 정보가 없습니다.")
+        
+        if not cost_breakdown or not cost_breakdown['total']['high']:
+            return
+        
+        currency = cost_breakdown['currency']
+        
+        def format_range(amounts: Dict[str, float]) -> str:
+            if amounts['low'] == amounts['high']:
+                return f"{amounts['low']:,.0f} {currency}"
+            return f"{amounts['low']:,.0f}-{amounts['high']:,.0f} {currency}"
+        
+        st.markdown(f"**일정 항목 합계:** {format_range(cost_breakdown['total'])}")
+        columns = st.columns(len(cost_breakdown['by_category']))
+        for column, (category, amounts) in zip(columns, cost_breakdown['by_category'].items()):
+            with column:
+                st.metric(category, format_range(amounts))
+        
+        with st.expander("일자별 비용"):
+            for day_cost in cost_breakdown['by_day']:
+                st.markdown(f"• Day {day_cost['day']}: {format_range(day_cost)}")
+        
+        if cost_breakdown['unpriced']:
+            st.caption(f"금액을 알 수 없는 항목 {cost_breakdown['unpriced']}개는 합계에서 제외되었습니다.")
     
     def display_packing_list(self, packing_list: List[str]):
         """준비물 목록 표시"""
@@ -217,42 +258,39 @@ class StreamlitUI:
         with st.spinner(message):
             pass
     
-    def display_itinerary_chart(self, itinerary_data: List[Dict[str, Any]]):
-        """일정 차트 표시"""
+    def display_itinerary_chart(self, itinerary_data: Union[List[Dict[str, Any]], ItineraryTable]):
+        """일정 차트 표시 (처리된 일정 목록 또는 ItineraryTable)"""
         st.header("📊 일정 분석")
         
-        if not itinerary_data:
-            return
+        if not isinstance(itinerary_data, ItineraryTable):
+            if not itinerary_data:
+                return
+            itinerary_data = ItineraryTable.from_itinerary(itinerary_data)
         
-        # 활동 카테고리별 분석
-        activity_categories = []
-        for day in itinerary_data:
-            for activity in day.get('activities', []):
-                activity_categories.append(activity.get('category', '기타'))
+        stats = itinerary_data.summary()
         
-        if activity_categories:
+        if stats['total_activities']:
             # 카테고리별 활동 수
-            category_counts = pd.Series(activity_categories).value_counts()
+            category_counts = stats['category_counts']
             
             col1, col2 = st.columns(2)
             
             with col1:
                 st.subheader("활동 카테고리 분포")
                 fig1 = px.pie(
-                    values=category_counts.values,
-                    names=category_counts.index,
+                    values=list(category_counts.values()),
+                    names=list(category_counts.keys()),
                     title="활동 유형별 분포"
                 )
                 st.plotly_chart(fig1, use_container_width=True)
             
             with col2:
                 st.subheader("일별 활동 수")
-                daily_activities = [len(day.get('activities', [])) for day in itinerary_data]
-                days = [f"Day {day.get('day', i+1)}" for i, day in enumerate(itinerary_data)]
+                days = [f"Day {day}" for day in itinerary_data.days]
                 
                 fig2 = px.bar(
                     x=days,
-                    y=daily_activities,
+                    y=stats['activities_per_day'],
                     title="일별 활동 수",
                     labels={'x': '일차', 'y': '활동 수'}
                 )